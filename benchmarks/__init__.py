@@ -0,0 +1 @@
+# Benchmarks for the graph centrality analysis application (run with python -m benchmarks...)
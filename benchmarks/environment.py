@@ -0,0 +1,89 @@
+"""
+Machine/environment header and result files shared by the benchmarks.
+
+Result files are plain CSV preceded by '# key: value' comment lines that
+describe the machine and library versions the numbers were measured on.
+Files without a header (like the original benchmark_results_*.csv) are read
+as well.
+"""
+import datetime
+import os
+import platform
+import subprocess
+import sys
+from importlib import metadata
+from typing import Optional
+
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PACKAGES = ("networkx", "numpy", "scipy", "pandas", "matplotlib")
+
+
+def _total_memory_bytes():
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _git_revision():
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def environment_header(command: Optional[str] = None) -> dict[str, str]:
+    """Describe the machine, interpreter and library versions (and the benchmark command)"""
+    header = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "machine": platform.node(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": str(os.cpu_count()),
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+    }
+    memory = _total_memory_bytes()
+    if memory:
+        header["memory_gb"] = f"{memory / 2 ** 30:.1f}"
+    for package in _PACKAGES:
+        try:
+            header[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            header[package] = "not installed"
+    revision = _git_revision()
+    if revision:
+        header["git_revision"] = revision
+    header["command"] = command or " ".join([os.path.basename(sys.executable)] + sys.argv)
+    return header
+
+
+def write_results(path: str, df: pd.DataFrame, header: dict[str, str]) -> None:
+    """Write a result table preceded by the '# key: value' header"""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        for key, value in header.items():
+            f.write(f"# {key}: {value}\n")
+        df.to_csv(f, index=False)
+
+
+def read_results(path: str) -> tuple[dict[str, str], pd.DataFrame]:
+    """
+    Read a result file.
+
+    Returns:
+        (header, table); the header is empty for files without one
+    """
+    header = {}
+    skip = 0
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.startswith("#"):
+                break
+            key, _, value = line[1:].partition(":")
+            header[key.strip()] = value.strip()
+            skip += 1
+    return header, pd.read_csv(path, skiprows=skip)
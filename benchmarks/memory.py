@@ -0,0 +1,323 @@
+"""
+Peak-memory benchmark per pipeline stage.
+
+For each graph size the pipeline runs in fresh interpreters and every stage is
+measured separately:
+- load: GraphLoader.load of the graph written as TSV
+- process_graph: removing zero-degree nodes and keeping the largest component
+- <centrality>: get_node_removal_impact for each centrality (removing the highest-degree node)
+- compute: CentralityAnalysisService.compute_baseline and compute_removal
+- table: CentralityAnalysisService.build_table building the impact table from them
+- render: PlotRenderer.render and drawing with the Agg backend
+
+Two numbers are recorded per stage:
+- peak_rss_bytes: growth of the resident set size during the stage. On Linux the
+  peak is reset before each stage (/proc/self/clear_refs), elsewhere it is the
+  growth of ru_maxrss, which misses peaks below an earlier stage's peak.
+- tracemalloc_peak_bytes: peak of Python and numpy allocations during the stage
+  (measured in a separate run, since tracing inflates RSS)
+
+bytes_per_node and bytes_per_edge use the larger of the two. Stages whose
+tracemalloc peak grows faster than (nodes + edges) ** SUPERLINEAR_EXPONENT are
+flagged as superlinear.
+
+Usage:
+    python -m benchmarks.memory [--sizes 500 1000 ...] [--graph-type erdos_renyi]
+                                [--centralities degree,betweenness] [-o FILE]
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.environment import REPO_ROOT, environment_header, write_results
+from src.models.graph_type_names import GRAPH_TYPE_KEYS
+
+DEFAULT_SIZES = (500, 1000, 2000, 5000)
+
+# Exponent of the fitted peak ~ (nodes + edges) ** k above which a stage is flagged
+SUPERLINEAR_EXPONENT = 1.2
+
+# Peaks below this are dominated by interpreter noise and are left out of the fit
+MIN_FIT_BYTES = 256 * 1024
+
+COLUMNS = ["timestamp", "graph_type", "graph_size", "nodes", "edges", "stage", "seconds", "peak_rss_bytes",
+           "tracemalloc_peak_bytes", "bytes_per_node", "bytes_per_edge", "error"]
+
+
+# ---- measurement (runs in the child interpreters) ----
+
+def _read_status_kib(field: str):
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _reset_peak_rss() -> bool:
+    """Reset the kernel's peak RSS (VmHWM) of this process; Linux only"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _max_rss_bytes() -> int:
+    import resource
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+class StageMeter:
+    """Measures peak memory growth of one stage in RSS or tracemalloc mode"""
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        if mode == "tracemalloc":
+            tracemalloc.start()
+
+    def measure(self, fn):
+        """Run fn and return (result, seconds, peak growth in bytes)"""
+        gc.collect()
+        if self.mode == "tracemalloc":
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        else:
+            current = _read_status_kib("VmRSS") if _reset_peak_rss() else None
+            before = current * 1024 if current is not None else _max_rss_bytes()
+
+        start = time.perf_counter()
+        result = fn()
+        seconds = time.perf_counter() - start
+
+        if self.mode == "tracemalloc":
+            peak = tracemalloc.get_traced_memory()[1]
+        else:
+            hwm = _read_status_kib("VmHWM") if current is not None else None
+            peak = hwm * 1024 if hwm is not None else _max_rss_bytes()
+        return result, seconds, max(0, peak - before)
+
+
+def measure_pipeline(graph_type: str, size: int, seed: int, centralities: list[str], mode: str) -> list[dict]:
+    """Run the pipeline stages on one graph and measure each of them"""
+    from src.models.centrality_service import (
+        CentralityAnalysisService, centrality_functions, get_node_removal_impact,
+    )
+    from src.models.graph_loader import GraphLoader
+    from src.models.node_index import relabel_to_labels
+    from src.models.random_graph_generator import make_graph
+
+    with tempfile.TemporaryDirectory(prefix="gca-membench-") as directory:
+        path = os.path.join(directory, "graph.tsv")
+        generated = make_graph(graph_type, size, seed=seed)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("edge1\tedge2\tweight\n")
+            for u, v, w in relabel_to_labels(generated).edges(data="weight", default=1):
+                f.write(f"{u}\t{v}\t{w}\n")
+        del generated
+
+        meter = StageMeter(mode)
+        rows = []
+        state = {"nodes": 0, "edges": 0}
+
+        def stage(name, fn):
+            try:
+                result, seconds, peak = meter.measure(fn)
+                rows.append({"stage": name, "seconds": seconds, "peak": peak, "error": ""})
+                return result
+            except Exception as e:
+                rows.append({"stage": name, "seconds": np.nan, "peak": np.nan, "error": f"{type(e).__name__}: {e}"})
+                return None
+
+        def finish():
+            for row in rows:
+                row.update(nodes=state["nodes"], edges=state["edges"])
+            return rows
+
+        loader = GraphLoader()
+        G = stage("load", lambda: loader.load("edge1", "edge2", "weight", path))
+        if G is None:
+            return finish()
+        G = stage("process_graph", lambda: loader.process_graph(G, True, True))
+        if G is None:
+            return finish()
+        state["nodes"], state["edges"] = G.number_of_nodes(), G.number_of_edges()
+
+        removed = [max(G.degree(), key=lambda item: item[1])[0]] if state["nodes"] else []
+        for centrality in centralities:
+            stage(centrality, lambda: get_node_removal_impact(G, removed, centrality_functions[centrality]))
+
+        analysis = CentralityAnalysisService()
+
+        def compute():
+            baseline = analysis.compute_baseline(G, centralities)
+            return baseline, analysis.compute_removal(G, removed, centralities) if removed else baseline
+
+        computed = stage("compute", compute)
+        table = None
+        if computed is not None:
+            table = stage("table", lambda: analysis.build_table(G, removed, centralities, *computed))
+
+        # Imported before the stage, so the import is not counted as rendering memory
+        import matplotlib
+        matplotlib.use("Agg")
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        from src.gui.plot_renderer import PlotRenderer
+        from src.models.layout_cache import LayoutCache
+
+        def render():
+            impact = table[1] if table is not None else {}
+            result = {"label": "Benchmark", "gtype": "Benchmark", "impact": impact, "graph": G,
+                      "removed_nodes": removed}
+            figure = Figure(figsize=(5, 4), dpi=100)
+            canvas = FigureCanvasAgg(figure)
+            PlotRenderer(LayoutCache()).render(figure, result)
+            canvas.draw()
+
+        stage("render", render)
+        return finish()
+
+
+def _child_main(argv) -> int:
+    spec = json.loads(argv[0])
+    rows = measure_pipeline(spec["graph_type"], spec["size"], spec["seed"], spec["centralities"], spec["mode"])
+    print(json.dumps(rows))
+    return 0
+
+
+# ---- driver ----
+
+def _run_child(spec: dict) -> list[dict]:
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.memory", "--child", json.dumps(spec)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        message = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "child failed"
+        raise RuntimeError(message)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run(sizes, graph_type: str, centralities: list[str], seed: int, progress=print) -> pd.DataFrame:
+    timestamp = datetime.datetime.now().isoformat()
+    rows = []
+    for size in sizes:
+        spec = {"graph_type": graph_type, "size": size, "seed": seed, "centralities": centralities}
+        rss = _run_child({**spec, "mode": "rss"})
+        traced = _run_child({**spec, "mode": "tracemalloc"})
+        for rss_row, traced_row in zip(rss, traced):
+            peaks = [p for p in (rss_row["peak"], traced_row["peak"]) if not np.isnan(p)]
+            peak = max(peaks) if peaks else np.nan
+            row = {
+                "timestamp": timestamp,
+                "graph_type": graph_type,
+                "graph_size": size,
+                "nodes": rss_row["nodes"],
+                "edges": rss_row["edges"],
+                "stage": rss_row["stage"],
+                "seconds": rss_row["seconds"],
+                "peak_rss_bytes": rss_row["peak"],
+                "tracemalloc_peak_bytes": traced_row["peak"],
+                "bytes_per_node": peak / rss_row["nodes"] if rss_row["nodes"] else np.nan,
+                "bytes_per_edge": peak / rss_row["edges"] if rss_row["edges"] else np.nan,
+                "error": rss_row["error"] or traced_row["error"],
+            }
+            rows.append(row)
+            progress(f"{size:>7} {row['stage']:<20} rss {row['peak_rss_bytes'] / 2 ** 20:>8.1f} MiB  "
+                     f"traced {row['tracemalloc_peak_bytes'] / 2 ** 20:>8.1f} MiB  "
+                     f"{row['bytes_per_node']:>9.0f} B/node {row['bytes_per_edge']:>9.0f} B/edge")
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+
+def scaling(df: pd.DataFrame, threshold: float = SUPERLINEAR_EXPONENT) -> pd.DataFrame:
+    """
+    Fit tracemalloc peak ~ (nodes + edges) ** exponent per stage and flag superlinear stages.
+
+    Stages with fewer than two usable sizes get no exponent.
+    """
+    rows = []
+    for stage, group in df.groupby("stage", sort=False):
+        usable = group[group["tracemalloc_peak_bytes"] >= MIN_FIT_BYTES]
+        exponent = np.nan
+        if usable["graph_size"].nunique() >= 2:
+            x = np.log((usable["nodes"] + usable["edges"]).to_numpy(dtype=float))
+            y = np.log(usable["tracemalloc_peak_bytes"].to_numpy(dtype=float))
+            exponent = float(np.polyfit(x, y, 1)[0])
+        largest = group.loc[group["graph_size"].idxmax()]
+        rows.append({
+            "stage": stage,
+            "exponent": exponent,
+            "bytes_per_node": largest["bytes_per_node"],
+            "bytes_per_edge": largest["bytes_per_edge"],
+            "superlinear": bool(exponent > threshold) if not np.isnan(exponent) else False,
+        })
+    return pd.DataFrame(rows)
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == "--child":
+        return _child_main(argv[1:])
+
+    from src.models.centrality_service import centrality_functions
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.memory", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--graph-type", default="erdos_renyi", choices=GRAPH_TYPE_KEYS, metavar="GRAPH_TYPE",
+                        help=f"make_graph type ({', '.join(GRAPH_TYPE_KEYS)}; default: erdos_renyi)")
+    parser.add_argument("--centralities", default=",".join(centrality_functions),
+                        help="Comma-separated centralities (default: all)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("-o", "--output", default=None,
+                        help="Output CSV (default: memory_results_<timestamp>.csv)")
+    args = parser.parse_args(argv)
+
+    centralities = [c.strip() for c in args.centralities.split(",") if c.strip()]
+    unknown = [c for c in centralities if c not in centrality_functions]
+    if unknown:
+        print(f"error: unknown centralities {unknown}", file=sys.stderr)
+        return 1
+
+    df = run(sorted(args.sizes), args.graph_type, centralities, args.seed,
+             progress=lambda line: print(line, file=sys.stderr))
+    output = args.output or f"memory_results_{datetime.datetime.now():%Y%m%d_%H%M%S}.csv"
+    header = environment_header("python -m benchmarks.memory " + " ".join(argv))
+    header.update(seed=str(args.seed), superlinear_exponent=str(SUPERLINEAR_EXPONENT))
+    write_results(output, df, header)
+
+    # Sizes whose graph could not be loaded have no node or edge counts to fit against
+    loaded = df.loc[(df["stage"] == "load") & (df["error"] == ""), "graph_size"]
+    if loaded.empty:
+        print("error: no graph could be loaded, see the error column", file=sys.stderr)
+        print(output)
+        return 1
+    summary = scaling(df[df["graph_size"].isin(loaded)])
+    print(f"{'stage':<20} {'exponent':>8} {'B/node':>10} {'B/edge':>10}")
+    for row in summary.itertuples(index=False):
+        flag = "  SUPERLINEAR" if row.superlinear else ""
+        print(f"{row.stage:<20} {row.exponent:>8.2f} {row.bytes_per_node:>10.0f} {row.bytes_per_edge:>10.0f}{flag}")
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
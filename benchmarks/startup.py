@@ -0,0 +1,128 @@
+"""
+Startup-time benchmark for the GUI.
+
+Measures, each in a fresh interpreter:
+- import: time to import src.gui.main_window
+- first_paint: time from process launch until the main window is mapped and painted
+- ready: time from process launch until the initial random graph preview is drawn
+
+Targets (non-frozen interpreter, typical laptop):
+- import       < 0.25 s
+- first_paint  < 1.0 s
+The "ready" time is reported for information; it includes importing networkx,
+pandas and matplotlib and the first spring layout, all after the first paint.
+
+Usage:
+    python -m benchmarks.startup [--runs N]
+
+Exits with status 1 if a median time misses its target. first_paint and ready
+need a display and are skipped when none is available.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+TARGETS = {
+    "import": 0.25,
+    "first_paint": 1.0,
+}
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_IMPORT_SCRIPT = """
+import json, time
+t = time.perf_counter()
+import src.gui.main_window
+print(json.dumps({"import": time.perf_counter() - t}))
+"""
+
+_PAINT_SCRIPT = """
+import json, sys, time
+launched = float(sys.argv[1])
+from src.gui.main_window import GraphAnalysisGUI
+times = {}
+
+app = GraphAnalysisGUI()
+
+def on_map(event):
+    if event.widget is app and "first_paint" not in times:
+        # Let Tk flush the pending redraws before taking the time
+        app.update_idletasks()
+        times["first_paint"] = time.time() - launched
+
+def poll_ready():
+    if app.startup_complete:
+        app.update_idletasks()
+        times["ready"] = time.time() - launched
+        app.destroy()
+    else:
+        app.after(5, poll_ready)
+
+app.bind("<Map>", on_map, add="+")
+app.after(5, poll_ready)
+app.mainloop()
+print(json.dumps(times))
+"""
+
+
+def _run_child(script: str, *args: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", script, *args],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "child failed")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure(runs: int) -> dict[str, list[float]]:
+    samples = {"import": [], "first_paint": [], "ready": []}
+
+    for _ in range(runs):
+        samples["import"].append(_run_child(_IMPORT_SCRIPT)["import"])
+
+    for _ in range(runs):
+        try:
+            times = _run_child(_PAINT_SCRIPT, repr(time.time()))
+        except RuntimeError as e:
+            print(f"first_paint/ready skipped: {e}", file=sys.stderr)
+            break
+        samples["first_paint"].append(times["first_paint"])
+        samples["ready"].append(times["ready"])
+
+    return samples
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters per measurement")
+    args = parser.parse_args(argv)
+
+    samples = measure(args.runs)
+    failed = False
+
+    print(f"{'stage':<12} {'median':>8} {'min':>8} {'max':>8} {'target':>8}")
+    for stage, values in samples.items():
+        if not values:
+            continue
+        median = statistics.median(values)
+        target = TARGETS.get(stage)
+        status = ""
+        if target is not None:
+            status = "ok" if median <= target else "SLOW"
+            failed = failed or median > target
+        target_text = f"{target:.2f}s" if target is not None else "-"
+        print(f"{stage:<12} {median:>7.3f}s {min(values):>7.3f}s {max(values):>7.3f}s {target_text:>8} {status}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,285 @@
+"""
+Timing benchmark suite for centralities, diameter, loaders and rendering.
+
+Generates graphs with make_graph across sizes and graph types ('all' runs every
+type of get_available_graph_types, whose structure - heavy tails, communities,
+clustering, spatial locality - changes the cost of most targets) and times:
+- every entry of centrality_functions
+- diameter: calculate_diameter
+- load_tsv, load_tsv_gz, load_gexf: GraphLoader.load on the graph written to disk
+- render: PlotRenderer.render (including the layout) and drawing with the Agg backend
+
+Results use the schema of benchmark_results_*.csv (one row per graph size and
+target, the target in the 'centrality' column) plus a trailing graph_type
+column, preceded by a '# key: value' machine/environment header.
+
+Usage:
+    python -m benchmarks.suite run [--sizes 10 50 ...] [--graph-types erdos_renyi ...]
+                                   [--targets degree,diameter,...] [--runs 10] [-o FILE]
+    python -m benchmarks.suite compare BASELINE CURRENT [--threshold 0.2] [--min-delta 0.001]
+
+compare exits with status 1 if a target got slower than the threshold allows
+or started failing.
+"""
+import argparse
+import datetime
+import gzip
+import os
+import sys
+import tempfile
+import time
+import traceback
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.environment import environment_header, read_results, write_results
+from src.models.graph_type_names import GRAPH_TYPE_KEYS
+
+DEFAULT_SIZES = (10, 50, 100, 500, 1000, 2000, 3000, 5000)
+DEFAULT_GRAPH_TYPES = ("erdos_renyi",)
+DEFAULT_RUNS = 10
+
+# Regressions: slower by more than THRESHOLD (relative) and MIN_DELTA seconds (absolute)
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_MIN_DELTA = 0.001
+
+LOADER_TARGETS = ("load_tsv", "load_tsv_gz", "load_gexf")
+OTHER_TARGETS = ("diameter",) + LOADER_TARGETS + ("render",)
+
+COLUMNS = ["timestamp", "graph_size", "nodes", "edges", "centrality", "mean_time", "std_time", "min_time",
+           "max_time", "successful_runs", "failed_runs", "error", "graph_type"]
+KEY_COLUMNS = ["graph_type", "graph_size", "centrality"]
+
+
+def available_targets() -> list[str]:
+    from src.models.centrality_service import centrality_functions
+    return list(centrality_functions) + list(OTHER_TARGETS)
+
+
+def time_runs(fn, runs: int) -> dict:
+    """Call fn runs times and summarize the wall-clock times of the successful calls"""
+    times = []
+    errors = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        try:
+            fn()
+        except Exception as e:
+            errors.append(f"{type(e).__name__}: {e}")
+            continue
+        times.append(time.perf_counter() - start)
+
+    summary = {
+        "mean_time": float(np.mean(times)) if times else np.nan,
+        "std_time": float(np.std(times)) if times else np.nan,
+        "min_time": float(np.min(times)) if times else np.nan,
+        "max_time": float(np.max(times)) if times else np.nan,
+        "successful_runs": len(times),
+        "failed_runs": len(errors),
+        "error": errors[0] if errors else "",
+    }
+    return summary
+
+
+class _GraphFiles:
+    """The benchmark graph written as TSV, gzip-compressed TSV and GEXF"""
+
+    def __init__(self, G, directory: str):
+        import networkx as nx
+        from src.models.node_index import relabel_to_labels
+
+        labeled = relabel_to_labels(G)
+        self.tsv = os.path.join(directory, "graph.tsv")
+        self.tsv_gz = self.tsv + ".gz"
+        self.gexf = os.path.join(directory, "graph.gexf")
+
+        lines = ["edge1\tedge2\tweight\n"]
+        lines.extend(f"{u}\t{v}\t{w}\n" for u, v, w in labeled.edges(data="weight", default=1))
+        text = "".join(lines)
+        with open(self.tsv, "w", encoding="utf-8") as f:
+            f.write(text)
+        with gzip.open(self.tsv_gz, "wt", encoding="utf-8") as f:
+            f.write(text)
+        nx.write_gexf(labeled, self.gexf)
+
+
+def _target_function(target: str, G, files: _GraphFiles):
+    """Zero-argument callable timing one target on G"""
+    from src.models.centrality_service import calculate_diameter, centrality_functions
+    from src.models.graph_loader import GraphLoader
+
+    if target in centrality_functions:
+        return lambda: centrality_functions[target](G)
+    if target == "diameter":
+        return lambda: calculate_diameter(G)
+    if target in LOADER_TARGETS:
+        path = {"load_tsv": files.tsv, "load_tsv_gz": files.tsv_gz, "load_gexf": files.gexf}[target]
+        return lambda: GraphLoader().load("edge1", "edge2", "weight", path)
+    if target == "render":
+        return _render_function(G)
+    raise ValueError(f"Unknown target '{target}'. Available: {available_targets()}")
+
+
+def _render_function(G):
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    from src.gui.plot_renderer import PlotRenderer
+    from src.models.centrality_service import CentralityAnalysisService
+    from src.models.layout_cache import LayoutCache
+
+    # Color by the impact of removing the highest-degree node, as after an analysis
+    removed = [max(G.degree(), key=lambda item: item[1])[0]] if G.number_of_nodes() else []
+    _, impact, _ = CentralityAnalysisService().compute(G, removed, ["degree"])
+    result = {"label": "Benchmark", "gtype": "Benchmark", "impact": impact, "graph": G, "removed_nodes": removed}
+
+    def render():
+        # A fresh cache per run, so the layout is part of the measurement
+        figure = Figure(figsize=(5, 4), dpi=100)
+        canvas = FigureCanvasAgg(figure)
+        PlotRenderer(LayoutCache()).render(figure, result)
+        canvas.draw()
+
+    return render
+
+
+def run(sizes, graph_types, targets, runs: int, seed: int, progress=print) -> pd.DataFrame:
+    """Run the benchmark and return the result table"""
+    from src.models.random_graph_generator import make_graph
+
+    timestamp = datetime.datetime.now().isoformat()
+    rows = []
+    for graph_type in graph_types:
+        for size in sizes:
+            G = make_graph(graph_type, size, seed=seed)
+            with tempfile.TemporaryDirectory(prefix="gca-bench-") as directory:
+                files = _GraphFiles(G, directory) if any(t in LOADER_TARGETS for t in targets) else None
+                for target in targets:
+                    try:
+                        summary = time_runs(_target_function(target, G, files), runs)
+                    except Exception as e:
+                        # Setup failures (e.g. a missing optional backend) are reported like run failures
+                        summary = {"mean_time": np.nan, "std_time": np.nan, "min_time": np.nan,
+                                   "max_time": np.nan, "successful_runs": 0, "failed_runs": runs,
+                                   "error": f"{type(e).__name__}: {e}"}
+                        traceback.print_exc()
+                    rows.append({
+                        "timestamp": timestamp,
+                        "graph_size": size,
+                        "nodes": G.number_of_nodes(),
+                        "edges": G.number_of_edges(),
+                        "centrality": target,
+                        **summary,
+                        "graph_type": graph_type,
+                    })
+                    progress(f"{graph_type:<16} {size:>6} {target:<20} "
+                             f"mean {summary['mean_time']:.4f}s ({summary['successful_runs']}/{runs} ok)")
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+
+def compare(baseline: pd.DataFrame, current: pd.DataFrame, threshold: float = DEFAULT_THRESHOLD,
+            min_delta: float = DEFAULT_MIN_DELTA) -> pd.DataFrame:
+    """
+    Match rows by graph type, size and target and flag regressions.
+
+    A row regresses if its mean time grew by more than threshold (relative) and
+    min_delta seconds (absolute), or if it fails now but did not fail before.
+    """
+    frames = []
+    for df in (baseline, current):
+        df = df.copy()
+        if "graph_type" not in df.columns:
+            # The original result files were measured on Erdős-Rényi graphs only
+            df["graph_type"] = DEFAULT_GRAPH_TYPES[0]
+        frames.append(df[KEY_COLUMNS + ["mean_time", "failed_runs", "successful_runs"]])
+
+    merged = frames[0].merge(frames[1], on=KEY_COLUMNS, how="inner", suffixes=("_baseline", "_current"))
+    merged["ratio"] = merged["mean_time_current"] / merged["mean_time_baseline"]
+    slower = ((merged["mean_time_current"] > merged["mean_time_baseline"] * (1 + threshold))
+              & (merged["mean_time_current"] - merged["mean_time_baseline"] > min_delta))
+    new_failures = (merged["successful_runs_current"] == 0) & (merged["successful_runs_baseline"] > 0)
+    merged["status"] = np.where(new_failures, "FAILING", np.where(slower, "REGRESSION", "ok"))
+    merged.loc[(merged["status"] == "ok") & (merged["ratio"] < 1 / (1 + threshold)), "status"] = "faster"
+    return merged.sort_values(KEY_COLUMNS).reset_index(drop=True)
+
+
+def _run_command(args) -> int:
+    targets = available_targets() if not args.targets else [t.strip() for t in args.targets.split(",") if t.strip()]
+    unknown = [t for t in targets if t not in available_targets()]
+    if unknown:
+        print(f"error: unknown targets {unknown}. Available: {available_targets()}", file=sys.stderr)
+        return 1
+
+    output = args.output or f"benchmark_results_{datetime.datetime.now():%Y%m%d_%H%M%S}.csv"
+    header = environment_header("python -m benchmarks.suite " + " ".join(args.argv))
+    header.update(runs=str(args.runs), seed=str(args.seed))
+
+    graph_types = list(GRAPH_TYPE_KEYS) if "all" in args.graph_types else args.graph_types
+    df = run(args.sizes, graph_types, targets, args.runs, args.seed,
+             progress=lambda line: print(line, file=sys.stderr))
+    write_results(output, df, header)
+    print(output)
+    return 0
+
+
+def _compare_command(args) -> int:
+    baseline_header, baseline = read_results(args.baseline)
+    current_header, current = read_results(args.current)
+    for name, header in (("baseline", baseline_header), ("current", current_header)):
+        if header:
+            print(f"{name}: {header.get('machine', '?')}, {header.get('python', '?')}, "
+                  f"networkx {header.get('networkx', '?')}, {header.get('created', '?')}")
+    if baseline_header and current_header and baseline_header.get("machine") != current_header.get("machine"):
+        print("warning: the files were measured on different machines", file=sys.stderr)
+
+    result = compare(baseline, current, args.threshold, args.min_delta)
+    if result.empty:
+        print("error: the files have no (graph_type, graph_size, centrality) rows in common", file=sys.stderr)
+        return 1
+
+    print(f"{'graph_type':<16} {'size':>6} {'target':<20} {'baseline':>10} {'current':>10} {'ratio':>7}  status")
+    for row in result.itertuples(index=False):
+        print(f"{row.graph_type:<16} {row.graph_size:>6} {row.centrality:<20} {row.mean_time_baseline:>9.4f}s "
+              f"{row.mean_time_current:>9.4f}s {row.ratio:>7.2f}  {row.status}")
+
+    regressions = result["status"].isin(["REGRESSION", "FAILING"])
+    print(f"{int(regressions.sum())} regression(s) in {len(result)} comparable row(s)")
+    return 1 if regressions.any() else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmark and write a result CSV")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    run_parser.add_argument("--graph-types", nargs="+", default=list(DEFAULT_GRAPH_TYPES),
+                            choices=list(GRAPH_TYPE_KEYS) + ["all"], metavar="GRAPH_TYPE",
+                            help=f"make_graph types or 'all' ({', '.join(GRAPH_TYPE_KEYS)}; default: erdos_renyi)")
+    run_parser.add_argument("--targets", default=None,
+                            help="Comma-separated targets (default: all centralities, diameter, loaders and render)")
+    run_parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help=f"Runs per target (default: {DEFAULT_RUNS})")
+    run_parser.add_argument("--seed", type=int, default=42, help="make_graph seed (default: 42)")
+    run_parser.add_argument("-o", "--output", default=None,
+                            help="Output CSV (default: benchmark_results_<timestamp>.csv)")
+    run_parser.set_defaults(handler=_run_command)
+
+    compare_parser = commands.add_parser("compare", help="Flag regressions against a baseline result file")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help=f"Relative slowdown flagged as a regression (default: {DEFAULT_THRESHOLD})")
+    compare_parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA,
+                                help=f"Ignore slowdowns below this many seconds (default: {DEFAULT_MIN_DELTA})")
+    compare_parser.set_defaults(handler=_compare_command)
+
+    args = parser.parse_args(argv)
+    args.argv = sys.argv[1:] if argv is None else list(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
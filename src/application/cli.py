@@ -0,0 +1,596 @@
+"""
+Headless command-line entry point (python -m src ...).
+
+Drives GraphLoader and CentralityAnalysisService directly. Nothing in this module
+(or the models it imports) may import tkinter or matplotlib, so it runs on
+headless compute nodes, from cron and in cluster job arrays.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Optional
+
+from src.models.graph_loader import GraphLoader
+from src.models.centrality_service import CentralityAnalysisService, centrality_functions
+from src.models.node_index import node_labels, node_ids
+from src.models.scenario_runner import ScenarioRunner, DEFAULT_TOP_K
+from src.models.critical_nodes import (
+    CriticalNodeSearch, OBJECTIVES, DEFAULT_BUDGET, DEFAULT_CANDIDATE_COUNT, top_degree_candidates,
+)
+from src.models.robustness import (
+    REMOVAL_STRATEGIES, DEFAULT_DIAMETER_CHECKPOINTS, removal_order, robustness_curve, robustness_index,
+)
+from src.models.job_store import (
+    JobStore, JobWorker, JOB_DB_ENV, JOB_QUEUED, JOB_RUNNING, JOB_DONE, JOB_FAILED, start_worker, describe_removed,
+    job_options,
+)
+
+# Exit codes
+EXIT_OK = 0
+EXIT_FAILURE = 1
+
+OUTPUT_FORMATS = ("csv", "tsv", "json")
+
+
+def _add_loader_arguments(parser: argparse.ArgumentParser, positional_input: bool = True) -> None:
+    """Input file and loader options shared by all subcommands"""
+    group = parser.add_argument_group("input")
+    if positional_input:
+        group.add_argument("input", help="Graph file (.tsv, .cys or .gexf, optionally gzip/bzip2/xz compressed)")
+    group.add_argument("--edge1", default="edge1", help="Source node column for TSV files (default: edge1)")
+    group.add_argument("--edge2", default="edge2", help="Destination node column for TSV files (default: edge2)")
+    group.add_argument("--weight", default="weight", help="Weight column for TSV files (default: weight)")
+    group.add_argument("--network", default=None, help="Network to load from a .cys file (default: first network)")
+    group.add_argument("--directed", action="store_true", help="Build a directed graph")
+    group.add_argument("--keep-self-edges", action="store_true", help="Keep self-edges (removed by default)")
+
+
+def _add_processing_arguments(parser: argparse.ArgumentParser) -> None:
+    """Graph processing flags shared by all subcommands"""
+    group = parser.add_argument_group("graph processing")
+    group.add_argument("--remove-zero-degree", action="store_true", help="Remove nodes with degree 0")
+    group.add_argument("--largest-component", action="store_true", help="Keep only the largest connected component")
+
+
+def _add_centrality_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--centralities",
+        default="degree,betweenness,closeness",
+        help=f"Comma-separated centralities (default: degree,betweenness,closeness; "
+             f"available: {','.join(centrality_functions)})",
+    )
+
+
+def _add_removal_arguments(parser: argparse.ArgumentParser) -> None:
+    removal = parser.add_argument_group("node removal")
+    removal.add_argument("--remove", action="append", default=[], metavar="NODES",
+                         help="Comma-separated node labels to remove (repeatable)")
+    removal.add_argument("--remove-file", default=None,
+                         help="File of removal sets, one per line: labels separated by commas or tabs, "
+                              "optionally prefixed with 'name: '")
+    removal.add_argument("--set-index", type=int, default=None,
+                         help="Use only the N-th removal set (0-based, one set per line) of --remove-file; "
+                              "e.g. --set-index $SLURM_ARRAY_TASK_ID")
+
+
+def _add_output_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("output")
+    group.add_argument("-o", "--output", default="-",
+                       help="Output path, '-' for stdout (default). May contain {index} and {name} placeholders")
+    group.add_argument("--format", choices=OUTPUT_FORMATS, default=None,
+                       help="Output format (default: from the output extension, csv otherwise)")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src",
+        description="Graph centrality node removal analysis (headless)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    analyze = subparsers.add_parser(
+        "analyze",
+        help="Compute the impact of removing nodes on node centralities",
+        description="Compute the impact of removing a set of nodes on the centrality of the remaining nodes.",
+    )
+    _add_loader_arguments(analyze)
+    _add_processing_arguments(analyze)
+    _add_removal_arguments(analyze)
+    _add_centrality_arguments(analyze)
+    _add_output_arguments(analyze)
+    analyze.set_defaults(handler=_run_analyze)
+
+    scenarios = subparsers.add_parser(
+        "scenarios",
+        help="Evaluate many removal sets against one shared baseline",
+        description="Evaluate every removal set of a file against one graph. The baseline centralities and "
+                    "diameter are computed once; removal sets are evaluated in parallel worker processes.",
+    )
+    _add_loader_arguments(scenarios)
+    _add_processing_arguments(scenarios)
+    scenarios.add_argument("--scenarios", required=True, metavar="FILE",
+                           help="File of removal sets, one per line (optionally 'name: A,B,C')")
+    _add_centrality_arguments(scenarios)
+    scenarios.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count)")
+    scenarios.add_argument("--top-k", type=int, default=DEFAULT_TOP_K,
+                           help=f"Most affected nodes listed per scenario (default: {DEFAULT_TOP_K})")
+    _add_output_arguments(scenarios)
+    scenarios.add_argument("--summary", default=None,
+                           help="Per-scenario summary output for CSV/TSV (default: <output>_summary.<ext>; "
+                                "JSON output embeds the summary)")
+    scenarios.set_defaults(handler=_run_scenarios)
+
+    critical = subparsers.add_parser(
+        "critical",
+        help="Search for the set of k nodes whose removal has the largest impact",
+        description="Greedily select the k candidate nodes whose removal maximizes the objective. Gains are "
+                    "evaluated lazily (CELF) in parallel worker processes against one shared baseline.",
+    )
+    _add_loader_arguments(critical)
+    _add_processing_arguments(critical)
+    critical.add_argument("-k", "--budget", type=int, default=DEFAULT_BUDGET,
+                          help=f"Number of nodes to select (default: {DEFAULT_BUDGET})")
+    critical.add_argument("--objective", choices=list(OBJECTIVES), default="delta",
+                          help="delta: total |Δ Combined| of the remaining nodes; diameter: diameter increase "
+                               "(default: delta)")
+    candidates = critical.add_argument_group("candidate pool")
+    candidates.add_argument("--candidates", action="append", default=[], metavar="NODES",
+                            help="Comma-separated node labels to choose from (repeatable)")
+    candidates.add_argument("--candidate-file", default=None,
+                            help="File with node labels to choose from (comma, tab or newline separated, no set names)")
+    candidates.add_argument("--candidate-count", type=int, default=DEFAULT_CANDIDATE_COUNT,
+                            help=f"Without --candidates or --candidate-file, choose from the N nodes with the "
+                                 f"highest degree (default: {DEFAULT_CANDIDATE_COUNT})")
+    _add_centrality_arguments(critical)
+    critical.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count)")
+    _add_output_arguments(critical)
+    critical.set_defaults(handler=_run_critical)
+
+    robustness = subparsers.add_parser(
+        "robustness",
+        help="Compute robustness curves: the component structure as nodes are removed in order",
+        description="Remove nodes one by one (by degree, betweenness or a given ranking) and report the size of "
+                    "the largest component and the number of components after every removal. The curve is "
+                    "computed in one pass with a union-find structure.",
+    )
+    _add_loader_arguments(robustness)
+    _add_processing_arguments(robustness)
+    robustness.add_argument("--order", choices=list(REMOVAL_STRATEGIES), default="degree",
+                            help="Removal order: highest degree or betweenness in the intact graph first, or the "
+                                 "nodes of --ranking in the given order (default: degree)")
+    robustness.add_argument("--ranking", action="append", default=[], metavar="NODES",
+                            help="Comma-separated node labels in removal order (repeatable; implies --order ranking)")
+    robustness.add_argument("--ranking-file", default=None,
+                            help="File with node labels in removal order (comma, tab or newline separated, no set "
+                                 "names; implies --order ranking)")
+    robustness.add_argument("--diameter-checkpoints", type=int, default=0, metavar="N",
+                            help=f"Compute the diameter of the largest component at N evenly spaced points of the "
+                                 f"curve (default: 0, not computed; e.g. {DEFAULT_DIAMETER_CHECKPOINTS})")
+    _add_output_arguments(robustness)
+    robustness.set_defaults(handler=_run_robustness)
+
+    serve = subparsers.add_parser(
+        "serve",
+        help="Run a local HTTP/JSON analysis service with resident graphs",
+        description="Load graphs once and answer analyze/knockout requests over HTTP. "
+                    "The loader options below are the defaults for every --graph.",
+    )
+    serve.add_argument("--graph", action="append", default=[], metavar="NAME=PATH",
+                       help="Network to serve (repeatable)")
+    serve.add_argument("--config", default=None,
+                       help="JSON file with a list of networks ({name, path, and optional loader options})")
+    _add_loader_arguments(serve, positional_input=False)
+    _add_processing_arguments(serve)
+    serve.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    serve.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count)")
+    serve.set_defaults(handler=_run_serve)
+
+    _add_jobs_parser(subparsers)
+
+    return parser
+
+
+def _add_jobs_parser(subparsers) -> None:
+    store_options = argparse.ArgumentParser(add_help=False)
+    store_options.add_argument("--db", default=None,
+                               help=f"Job database (default: ${JOB_DB_ENV} or ~/.graph-centrality-analysis/jobs.sqlite3)")
+
+    jobs = subparsers.add_parser(
+        "jobs",
+        help="Queue long analyses and reopen stored results",
+        description="Persistent job queue. Analyses are recorded in a SQLite database, executed by background "
+                    "workers and stored, so identical requests are answered without recomputing.",
+    )
+    actions = jobs.add_subparsers(dest="action", required=True)
+
+    submit = actions.add_parser("submit", parents=[store_options], help="Queue an analysis")
+    _add_loader_arguments(submit)
+    _add_processing_arguments(submit)
+    _add_removal_arguments(submit)
+    _add_centrality_arguments(submit)
+    submit.add_argument("--wait", action="store_true",
+                        help="Run the queue in this process until the job is finished "
+                             "(default: start a background worker and return)")
+    submit.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count)")
+    submit.set_defaults(handler=_run_jobs_submit)
+
+    list_jobs = actions.add_parser("list", parents=[store_options], help="List jobs, newest first")
+    list_jobs.add_argument("--status", choices=(JOB_QUEUED, JOB_RUNNING, JOB_DONE, JOB_FAILED), default=None)
+    list_jobs.add_argument("--limit", type=int, default=None, help="Show at most N jobs")
+    list_jobs.set_defaults(handler=_run_jobs_list)
+
+    work = actions.add_parser("work", parents=[store_options], help="Process queued jobs")
+    work.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count)")
+    work.add_argument("--poll", action="store_true", help="Keep waiting for new jobs instead of exiting when idle")
+    work.set_defaults(handler=_run_jobs_work)
+
+    resume = actions.add_parser("resume", parents=[store_options],
+                                help="Queue jobs interrupted by a worker that died again and process the queue")
+    resume.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count)")
+    resume.set_defaults(handler=_run_jobs_resume)
+
+    show = actions.add_parser("show", parents=[store_options], help="Write the stored result table of a finished job")
+    show.add_argument("job_id", type=int)
+    _add_output_arguments(show)
+    show.set_defaults(handler=_run_jobs_show)
+
+
+def parse_centralities(value: str) -> list[str]:
+    """Parse and validate a comma-separated list of centrality names"""
+    centralities = [c.strip() for c in value.split(",") if c.strip()]
+    if not centralities:
+        raise ValueError("At least one centrality measure is required")
+    unknown = [c for c in centralities if c not in centrality_functions]
+    if unknown:
+        raise ValueError(f"Unknown centrality measure(s): {', '.join(unknown)}. "
+                         f"Available: {', '.join(centrality_functions)}")
+    return centralities
+
+
+def load_graph(args, loader: GraphLoader):
+    """Load and process the input graph as configured by the shared arguments"""
+    G = loader.load(args.edge1, args.edge2, args.weight, args.input,
+                    remove_self_edges=not args.keep_self_edges,
+                    network_name=args.network,
+                    directed=args.directed)
+    return loader.process_graph(G, args.remove_zero_degree, args.largest_component)
+
+
+def _removal_labels(args, loader: GraphLoader) -> tuple[str, list[str]]:
+    """Collect the labels of the nodes to remove and a name for the removal set"""
+    labels = [label.strip() for value in args.remove for label in value.split(",") if label.strip()]
+    name = "inline" if labels else "none"
+
+    if args.remove_file:
+        removal_sets = loader.load_removal_sets(args.remove_file)
+        if args.set_index is None:
+            for _, nodes in removal_sets:
+                labels.extend(nodes)
+            name = os.path.splitext(os.path.basename(args.remove_file))[0]
+        else:
+            if not 0 <= args.set_index < len(removal_sets):
+                raise ValueError(f"--set-index {args.set_index} is out of range: "
+                                 f"{args.remove_file} has {len(removal_sets)} removal set(s)")
+            name, nodes = removal_sets[args.set_index]
+            labels.extend(nodes)
+    elif args.set_index is not None:
+        raise ValueError("--set-index requires --remove-file")
+
+    # Keep the first occurrence of each label
+    return name, list(dict.fromkeys(labels))
+
+
+def resolve_output(output: str, fmt: Optional[str], index: Optional[int] = None, name: str = "") -> tuple[str, str]:
+    """Expand output path placeholders and determine the output format"""
+    if output != "-":
+        output = output.format(index="" if index is None else index, name=name)
+    if fmt is None:
+        ext = os.path.splitext(output)[1].lower().lstrip(".")
+        fmt = ext if ext in OUTPUT_FORMATS else "csv"
+    return output, fmt
+
+
+def write_table(df, output: str, fmt: str, metadata: Optional[dict] = None) -> None:
+    """
+    Write a result table with node labels in the first column.
+
+    CSV/TSV outputs contain only the table; JSON outputs wrap the rows together
+    with the metadata (diameter, removed nodes, ...).
+    """
+    if fmt == "json":
+        document = dict(metadata or {})
+        document["rows"] = json.loads(df.to_json(orient="records"))
+        text = json.dumps(_json_safe(document), indent=2, ensure_ascii=False)
+        if output == "-":
+            sys.stdout.write(text + "\n")
+        else:
+            with open(output, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        return
+
+    sep = "\t" if fmt == "tsv" else ","
+    df.to_csv(sys.stdout if output == "-" else output, sep=sep, index=False)
+
+
+def _json_safe(value):
+    """Replace infinite floats (e.g. the diameter of a disconnected graph) with null"""
+    if isinstance(value, float) and value in (float("inf"), float("-inf")):
+        return None
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_json_safe(v) for v in value]
+    return value
+
+
+def _format_diameter(value) -> str:
+    return "inf" if value == float("inf") else f"{value:.0f}"
+
+
+def _run_analyze(args) -> int:
+    loader = GraphLoader()
+    centralities = parse_centralities(args.centralities)
+    set_name, removed_labels = _removal_labels(args, loader)
+
+    G = load_graph(args, loader)
+    removed_nodes = node_ids(G, removed_labels)
+
+    df, _, diameter_info = CentralityAnalysisService().compute(G, removed_nodes, centralities)
+    df.insert(0, "Node", node_labels(G, df.index))
+
+    output, fmt = resolve_output(args.output, args.format, args.set_index, set_name)
+    metadata = {
+        "input": args.input,
+        "removed_nodes": removed_labels,
+        "centralities": centralities,
+        "diameter": diameter_info,
+    }
+    write_table(df, output, fmt, metadata)
+
+    print(f"{G.number_of_nodes()} nodes, {G.number_of_edges()} edges; removed {len(removed_nodes)} node(s); "
+          f"diameter {_format_diameter(diameter_info['before'])} -> {_format_diameter(diameter_info['after'])}",
+          file=sys.stderr)
+    return EXIT_OK
+
+
+def _run_scenarios(args) -> int:
+    loader = GraphLoader()
+    centralities = parse_centralities(args.centralities)
+    removal_sets = loader.load_removal_sets(args.scenarios)
+    if not removal_sets:
+        raise ValueError(f"No removal sets found in {args.scenarios}")
+
+    G = load_graph(args, loader)
+    output, fmt = resolve_output(args.output, args.format)
+
+    def progress(done, total):
+        print(f"\r{done}/{total} scenarios", end="" if done < total else "\n", file=sys.stderr)
+
+    with ScenarioRunner(G, centralities, max_workers=args.workers) as runner:
+        results, summary = runner.run(removal_sets, top_k=args.top_k, progress=progress)
+
+    if fmt == "json":
+        metadata = {
+            "input": args.input,
+            "centralities": centralities,
+            "summary": json.loads(summary.to_json(orient="records")),
+        }
+        write_table(results, output, fmt, metadata)
+    else:
+        write_table(results, output, fmt)
+        if args.summary:
+            summary_path = args.summary
+        elif output == "-":
+            summary_path = None
+        else:
+            root, ext = os.path.splitext(output)
+            summary_path = f"{root}_summary{ext or '.' + fmt}"
+        if summary_path:
+            write_table(summary, summary_path, fmt)
+        else:
+            # Results went to stdout; report the summary on stderr
+            summary.to_csv(sys.stderr, sep="\t" if fmt == "tsv" else ",", index=False)
+
+    failed = int((summary["error"] != "").sum())
+    print(f"{len(summary) - failed} scenario(s) evaluated, {failed} failed", file=sys.stderr)
+    return EXIT_OK if failed == 0 else EXIT_FAILURE
+
+
+def _run_critical(args) -> int:
+    import pandas as pd
+
+    loader = GraphLoader()
+    centralities = parse_centralities(args.centralities)
+    labels = [label.strip() for value in args.candidates for label in value.split(",") if label.strip()]
+    if args.candidate_file:
+        labels.extend(loader.load_labels(args.candidate_file))
+
+    G = load_graph(args, loader)
+    if labels:
+        candidates = node_ids(G, list(dict.fromkeys(labels)))
+    else:
+        candidates = top_degree_candidates(G, args.candidate_count)
+    output, fmt = resolve_output(args.output, args.format)
+
+    def progress(selected, budget, evaluations):
+        print(f"\r{selected}/{budget} nodes selected, {evaluations} evaluations", end="", file=sys.stderr)
+
+    with CriticalNodeSearch(G, centralities, args.objective, max_workers=args.workers) as search:
+        result = search.run(args.budget, candidates, progress=progress)
+    print(file=sys.stderr)
+
+    steps = result["steps"]
+    df = pd.DataFrame({
+        "step": range(1, len(steps) + 1),
+        "node": node_labels(G, result["nodes"]),
+        "gain": [s["gain"] for s in steps],
+        "objective": [s["value"] for s in steps],
+        "evaluations": [s["evaluations"] for s in steps],
+    })
+    metadata = {
+        "input": args.input,
+        "objective": args.objective,
+        "centralities": centralities if args.objective == "delta" else [],
+        "baseline": result["baseline"],
+        "candidates": len(candidates),
+        "nodes": node_labels(G, result["nodes"]),
+        "evaluations": result["evaluations"],
+        "stopped": result["stopped"],
+    }
+    write_table(df, output, fmt, metadata)
+
+    print(f"selected {len(result['nodes'])} of {len(candidates)} candidate(s) with {result['evaluations']} "
+          f"evaluations (plain greedy: {result['greedy_evaluations']}) in {result['elapsed']:.1f} s"
+          + (f"; stopped: {result['stopped']}" if result["stopped"] else ""), file=sys.stderr)
+    return EXIT_OK
+
+
+def _run_robustness(args) -> int:
+    loader = GraphLoader()
+    labels = [label.strip() for value in args.ranking for label in value.split(",") if label.strip()]
+    if args.ranking_file:
+        labels.extend(loader.load_labels(args.ranking_file))
+    strategy = "ranking" if labels else args.order
+    if strategy == "ranking" and not labels:
+        raise ValueError("--order ranking requires --ranking or --ranking-file")
+
+    G = load_graph(args, loader)
+    ranking = node_ids(G, list(dict.fromkeys(labels))) if labels else None
+    output, fmt = resolve_output(args.output, args.format)
+
+    start_time = time.time()
+    order = removal_order(G, strategy, ranking)
+    curve = robustness_curve(G, order, args.diameter_checkpoints)
+    index = robustness_index(curve)
+    elapsed = time.time() - start_time
+
+    curve.insert(0, "Node", curve.index)
+    metadata = {
+        "input": args.input,
+        "order": strategy,
+        "nodes": G.number_of_nodes(),
+        "robustness_index": index,
+    }
+    write_table(curve, output, fmt, metadata)
+
+    print(f"{G.number_of_nodes()} nodes, {len(order)} removed by {strategy}; robustness index R = {index:.4f} "
+          f"({elapsed:.1f} s)", file=sys.stderr)
+    return EXIT_OK
+
+
+def _run_serve(args) -> int:
+    import asyncio
+    from src.application.server import load_network_specs, serve
+
+    defaults = {
+        "edge1": args.edge1,
+        "edge2": args.edge2,
+        "weight": args.weight,
+        "network": args.network,
+        "directed": args.directed,
+        "keep_self_edges": args.keep_self_edges,
+        "remove_zero_degree": args.remove_zero_degree,
+        "largest_component": args.largest_component,
+    }
+    networks = load_network_specs(args.graph, args.config, defaults)
+    try:
+        asyncio.run(serve(networks, args.host, args.port, args.workers))
+    except KeyboardInterrupt:
+        pass
+    return EXIT_OK
+
+
+def _print_job_progress(job: dict, status: str) -> None:
+    suffix = "" if status == JOB_DONE else f": {job.get('error') or 'see jobs list'}"
+    print(f"job {job['id']} {status}{suffix}", file=sys.stderr)
+
+
+def _run_jobs_submit(args) -> int:
+    loader = GraphLoader()
+    centralities = parse_centralities(args.centralities)
+    _, removed_labels = _removal_labels(args, loader)
+
+    G = load_graph(args, loader)
+    # Unknown labels are reported now rather than when the job runs
+    node_ids(G, removed_labels)
+
+    store = JobStore(args.db)
+    options = job_options(remove_self_edges=not args.keep_self_edges, directed=args.directed, network=args.network,
+                          remove_zero_degree=args.remove_zero_degree, largest_component=args.largest_component)
+    job, created = store.submit(G, removed_labels, centralities, options, source=os.path.abspath(args.input))
+    if not created:
+        print(f"job {job['id']}: identical request already {job['status']}", file=sys.stderr)
+    else:
+        print(f"job {job['id']} queued", file=sys.stderr)
+
+    if job["status"] in (JOB_QUEUED, JOB_RUNNING):
+        if args.wait:
+            JobWorker(store, args.workers).run(progress=_print_job_progress)
+            job = store.get_job(job["id"])
+        else:
+            start_worker(store, args.workers)
+
+    print(job["id"])
+    return EXIT_OK if job["status"] != JOB_FAILED else EXIT_FAILURE
+
+
+def _run_jobs_list(args) -> int:
+    jobs = JobStore(args.db).list_jobs(args.status, args.limit)
+    columns = ["id", "status", "nodes", "edges", "removed", "centralities", "created", "finished", "source", "error"]
+    print("\t".join(columns))
+    for job in jobs:
+        row = dict(job)
+        row["removed"] = describe_removed(job)
+        row["centralities"] = ",".join(job["centralities"])
+        for key in ("created", "finished"):
+            row[key] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(job[key])) if job[key] else ""
+        print("\t".join("" if row[c] is None else str(row[c]) for c in columns))
+    return EXIT_OK
+
+
+def _run_jobs_work(args) -> int:
+    processed = JobWorker(JobStore(args.db), args.workers).run(stop_when_idle=not args.poll,
+                                                              progress=_print_job_progress)
+    print(f"{processed} job(s) processed", file=sys.stderr)
+    return EXIT_OK
+
+
+def _run_jobs_resume(args) -> int:
+    store = JobStore(args.db)
+    print(f"{store.resume()} interrupted job(s) queued again", file=sys.stderr)
+    return _run_jobs_work(argparse.Namespace(db=args.db, workers=args.workers, poll=False))
+
+
+def _run_jobs_show(args) -> int:
+    store = JobStore(args.db)
+    stored = store.load_result(args.job_id)
+    job = stored["job"]
+    G = stored["graph"]
+
+    df, _, diameter_info = CentralityAnalysisService().build_table(
+        G, stored["removed_nodes"], job["centralities"], stored["baseline"], stored["removal"])
+    df.insert(0, "Node", node_labels(G, df.index))
+
+    output, fmt = resolve_output(args.output, args.format, args.job_id, f"job{args.job_id}")
+    metadata = {
+        "job": job["id"],
+        "input": job["source"],
+        "removed_nodes": job["removed"],
+        "centralities": job["centralities"],
+        "diameter": diameter_info,
+    }
+    write_table(df, output, fmt, metadata)
+    return EXIT_OK
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.handler(args)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return EXIT_FAILURE
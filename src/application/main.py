@@ -1,10 +1,15 @@
-from src.gui.main_window import GraphAnalysisGUI
+import multiprocessing
 
 def main() -> None:
+    # Imported here: spawned worker processes import this module but never open a window
+    from src.gui.main_window import GraphAnalysisGUI
+
     app = GraphAnalysisGUI()
     app.mainloop()
 
 if __name__ == "__main__":
+    # Frozen builds start the analysis worker processes through this executable
+    multiprocessing.freeze_support()
     main()
 
 
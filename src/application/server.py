@@ -0,0 +1,438 @@
+"""
+Local HTTP/JSON analysis service (python -m src serve ...).
+
+Graphs are loaded once through GraphLoader and kept resident together with their
+baseline centralities. CPU work runs on an AnalysisPool so concurrent requests
+don't block each other or the event loop. Like the command line, this module
+never imports tkinter or matplotlib.
+
+Endpoints:
+    GET  /health
+    GET  /networks                  list resident networks
+    POST /analyze                   impact table of one removal set (paginated)
+    POST /knockout                  summary per removal set (top-k affected nodes)
+"""
+import asyncio
+import json
+import math
+import sys
+from typing import Optional
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from src.models.analysis_pool import AnalysisPool, removal_task
+from src.models.centrality_service import (
+    CentralityAnalysisService, calculate_diameter, centrality_functions, id_space_size, to_dense,
+)
+from src.models.graph_loader import GraphLoader
+from src.models.node_index import get_node_index, node_labels
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Response size bounds
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+DEFAULT_TOP_K = 20
+MAX_TOP_K = 1000
+MAX_KNOCKOUT_SETS = 10_000
+
+# Largest accepted request body
+MAX_BODY_BYTES = 1 << 20
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _to_json_value(value):
+    """Convert numpy scalars and non-finite floats into JSON-compatible values"""
+    if isinstance(value, dict):
+        return {str(k): _to_json_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json_value(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def baseline_task(G, selected_centralities, include_diameter: bool) -> dict:
+    """Worker task: baseline centralities (and optionally the diameter) of a resident graph"""
+    size = id_space_size(G)
+    result = {
+        "centralities": {c: to_dense(centrality_functions[c](G), size) for c in selected_centralities},
+    }
+    if include_diameter:
+        result["diameter"] = calculate_diameter(G)
+    return result
+
+
+class ResidentNetwork:
+    """A loaded graph with its lazily computed, cached baseline"""
+
+    def __init__(self, name: str, graph, source: str):
+        self.name = name
+        self.graph = graph
+        self.source = source
+        self.index = get_node_index(graph)
+        self.pool_key = ("network", name)
+        # centrality name -> dense baseline array, plus the baseline diameter
+        self.baseline_centralities = {}
+        self.baseline_diameter = None
+        # centrality name or 'diameter' -> task computing it
+        self._pending = {}
+
+    def describe(self) -> dict:
+        return {
+            "name": self.name,
+            "source": self.source,
+            "nodes": self.graph.number_of_nodes(),
+            "edges": self.graph.number_of_edges(),
+            "directed": self.graph.is_directed(),
+            "baseline_centralities": sorted(self.baseline_centralities),
+        }
+
+    def resolve(self, labels) -> list[int]:
+        """Translate request labels to node ids"""
+        if not isinstance(labels, list):
+            raise HTTPError(400, "Removed nodes must be a list of node labels")
+        ids = []
+        for label in labels:
+            node = self.index.get_id(label) if self.index is not None else None
+            if node is None or node not in self.graph:
+                raise HTTPError(400, f"Node '{label}' is not in network '{self.name}'")
+            ids.append(node)
+        return list(dict.fromkeys(ids))
+
+
+class AnalysisServer:
+    def __init__(self, pool: AnalysisPool):
+        self.pool = pool
+        self.analysis = CentralityAnalysisService()
+        self.networks: dict[str, ResidentNetwork] = {}
+
+    def add_network(self, name: str, graph, source: str) -> None:
+        if name in self.networks:
+            raise ValueError(f"Duplicate network name '{name}'")
+        network = ResidentNetwork(name, graph, source)
+        self.pool.register_graph(network.pool_key, graph)
+        self.networks[name] = network
+
+    # ---- shared helpers ----
+
+    def _network(self, body: dict) -> ResidentNetwork:
+        name = body.get("network")
+        if name is None and len(self.networks) == 1:
+            name = next(iter(self.networks))
+        if name not in self.networks:
+            raise HTTPError(404, f"Unknown network '{name}'. Available: {sorted(self.networks)}")
+        return self.networks[name]
+
+    @staticmethod
+    def _centralities(body: dict) -> list[str]:
+        centralities = body.get("centralities", ["degree", "betweenness", "closeness"])
+        if isinstance(centralities, str):
+            centralities = [c.strip() for c in centralities.split(",") if c.strip()]
+        unknown = [c for c in centralities if c not in centrality_functions]
+        if not centralities or unknown:
+            raise HTTPError(400, f"Invalid centralities {unknown or centralities}. "
+                                 f"Available: {list(centrality_functions)}")
+        return list(dict.fromkeys(centralities))
+
+    @staticmethod
+    def _bounded_int(body: dict, key: str, default: int, maximum: int, minimum: int = 0) -> int:
+        value = body.get(key, default)
+        if not isinstance(value, int) or isinstance(value, bool) or value < minimum:
+            raise HTTPError(400, f"'{key}' must be an integer >= {minimum}")
+        return min(value, maximum)
+
+    async def _baseline(self, network: ResidentNetwork, centralities: list[str]) -> dict:
+        """
+        Return the resident baseline for the requested centralities.
+
+        Missing parts are computed once on the pool; concurrent requests needing
+        the same centralities wait on the same computation instead of repeating it.
+        """
+        needed = [c for c in centralities if c not in network.baseline_centralities]
+        if network.baseline_diameter is None:
+            needed.append("diameter")
+
+        to_start = [key for key in needed if key not in network._pending]
+        if to_start:
+            task = asyncio.ensure_future(self._compute_baseline(network, to_start))
+            for key in to_start:
+                network._pending[key] = task
+
+        pending = {network._pending[key] for key in needed if key in network._pending}
+        if pending:
+            await asyncio.gather(*pending)
+
+        return {
+            "centralities": {c: network.baseline_centralities[c] for c in centralities},
+            "diameter": network.baseline_diameter,
+        }
+
+    async def _compute_baseline(self, network: ResidentNetwork, keys: list[str]) -> None:
+        centralities = [key for key in keys if key != "diameter"]
+        try:
+            result = await asyncio.wrap_future(
+                self.pool.submit(baseline_task, network.pool_key, centralities, "diameter" in keys))
+            network.baseline_centralities.update(result["centralities"])
+            if "diameter" in result:
+                network.baseline_diameter = result["diameter"]
+        finally:
+            for key in keys:
+                network._pending.pop(key, None)
+
+    async def _removal(self, network: ResidentNetwork, removed: list[int], centralities: list[str],
+                       baseline: dict) -> dict:
+        if not removed:
+            return baseline
+        return await asyncio.wrap_future(self.pool.submit(removal_task, network.pool_key, removed, centralities))
+
+    # ---- endpoints ----
+
+    async def list_networks(self, _body: dict) -> dict:
+        return {"networks": [network.describe() for network in self.networks.values()]}
+
+    async def analyze(self, body: dict) -> dict:
+        """
+        Impact table of removing one set of nodes.
+
+        Body: network, removed (labels), centralities, offset, limit,
+              sort (column, default 'Δ Combined' by absolute value), descending
+        """
+        network = self._network(body)
+        centralities = self._centralities(body)
+        removed = network.resolve(body.get("removed", []))
+        offset = self._bounded_int(body, "offset", 0, sys.maxsize)
+        limit = self._bounded_int(body, "limit", DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, minimum=1)
+
+        baseline = await self._baseline(network, centralities)
+        removal = await self._removal(network, removed, centralities, baseline)
+
+        loop = asyncio.get_running_loop()
+        df, _, diameter_info = await loop.run_in_executor(
+            None, self.analysis.build_table, network.graph, removed, centralities, baseline, removal)
+
+        sort_column = body.get("sort", "Δ Combined")
+        if sort_column not in df.columns:
+            raise HTTPError(400, f"Unknown sort column '{sort_column}'. Available: {list(df.columns)}")
+        values = df[sort_column].to_numpy()
+        key = np.abs(values) if body.get("sort", None) is None else values
+        order = np.argsort(key, kind="stable")
+        if body.get("descending", True):
+            order = order[::-1]
+        page = df.iloc[order[offset:offset + limit]]
+
+        rows = []
+        for label, record in zip(node_labels(network.graph, page.index), page.to_dict(orient="records")):
+            record["Node"] = label
+            rows.append(record)
+
+        return {
+            "network": network.name,
+            "removed": node_labels(network.graph, removed),
+            "centralities": centralities,
+            "diameter": diameter_info,
+            "total_rows": len(df),
+            "offset": offset,
+            "limit": limit,
+            "rows": rows,
+        }
+
+    async def knockout(self, body: dict) -> dict:
+        """
+        Summary of one or more removal sets.
+
+        Body: network, centralities, top_k, and either
+              sets (list of label lists) or nodes (labels, one single-node knockout each)
+        """
+        network = self._network(body)
+        centralities = self._centralities(body)
+        top_k = self._bounded_int(body, "top_k", DEFAULT_TOP_K, MAX_TOP_K)
+
+        if "sets" in body:
+            sets = body["sets"]
+        elif "nodes" in body:
+            sets = [[label] for label in body["nodes"]] if isinstance(body["nodes"], list) else None
+        else:
+            raise HTTPError(400, "Provide 'sets' (list of node label lists) or 'nodes' (list of node labels)")
+        if not isinstance(sets, list) or len(sets) > MAX_KNOCKOUT_SETS:
+            raise HTTPError(400, f"Expected a list of at most {MAX_KNOCKOUT_SETS} removal sets")
+
+        resolved = [network.resolve(labels) for labels in sets]
+        baseline = await self._baseline(network, centralities)
+        removals = await asyncio.gather(*(
+            self._removal(network, removed, centralities, baseline) for removed in resolved))
+
+        loop = asyncio.get_running_loop()
+        results = []
+        for labels, removed, removal in zip(sets, resolved, removals):
+            df, _, diameter_info = await loop.run_in_executor(
+                None, self.analysis.build_table, network.graph, removed, centralities, baseline, removal)
+            delta = df["Δ Combined"].to_numpy()
+            top = np.argsort(-np.abs(delta), kind="stable")[:top_k]
+            top_labels = node_labels(network.graph, df.index[top])
+            results.append({
+                "removed": labels,
+                "sum_abs_delta": {
+                    **{c: float(np.nansum(np.abs(df[f"Δ {c.title()}"].to_numpy()))) for c in centralities},
+                    "combined": float(np.nansum(np.abs(delta))),
+                },
+                "diameter": diameter_info,
+                "top_affected": [{"node": label, "delta": float(delta[i])} for label, i in zip(top_labels, top)],
+            })
+
+        return {"network": network.name, "centralities": centralities, "results": results}
+
+    # ---- HTTP plumbing ----
+
+    def _route(self, method: str, path: str):
+        routes = {
+            "/health": ("GET", self.health),
+            "/networks": ("GET", self.list_networks),
+            "/analyze": ("POST", self.analyze),
+            "/knockout": ("POST", self.knockout),
+        }
+        if path not in routes:
+            raise HTTPError(404, f"Unknown endpoint {path}")
+        expected, handler = routes[path]
+        if method != expected:
+            raise HTTPError(405, f"{path} expects {expected}")
+        return handler
+
+    async def health(self, _body: dict) -> dict:
+        return {"status": "ok", "networks": len(self.networks), "workers": self.pool.max_workers}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                keep_alive = await self._handle_request(request_line, reader, writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, request_line: bytes, reader: asyncio.StreamReader,
+                              writer: asyncio.StreamWriter) -> bool:
+        keep_alive = False
+        try:
+            try:
+                method, target, version = request_line.decode("latin-1").split()
+            except ValueError:
+                raise HTTPError(400, "Malformed request line")
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            connection = headers.get("connection", "").lower()
+            keep_alive = connection == "keep-alive" or (version == "HTTP/1.1" and connection != "close")
+
+            try:
+                length = int(headers.get("content-length", "0") or 0)
+                if length < 0:
+                    raise ValueError
+            except ValueError:
+                # The body was not read, so the connection cannot be reused
+                keep_alive = False
+                raise HTTPError(400, "Invalid Content-Length")
+            if length > MAX_BODY_BYTES:
+                keep_alive = False
+                raise HTTPError(413, f"Request body exceeds {MAX_BODY_BYTES} bytes")
+            raw = await reader.readexactly(length) if length else b""
+
+            try:
+                body = json.loads(raw) if raw else {}
+            except json.JSONDecodeError as e:
+                raise HTTPError(400, f"Invalid JSON body: {e}")
+            if not isinstance(body, dict):
+                raise HTTPError(400, "The request body must be a JSON object")
+
+            handler = self._route(method.upper(), urlsplit(target).path.rstrip("/") or "/")
+            status, payload = 200, await handler(body)
+        except HTTPError as e:
+            status, payload = e.status, {"error": str(e)}
+        except Exception as e:
+            status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+
+        data = json.dumps(_to_json_value(payload), ensure_ascii=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + data)
+        return keep_alive
+
+
+def load_network_specs(specs: list[str], config_path: Optional[str], defaults: dict) -> list[dict]:
+    """
+    Collect the networks to serve.
+
+    Args:
+        specs: NAME=PATH strings from the command line (loader options from defaults)
+        config_path: Optional JSON file with a list of objects holding name, path and
+            any loader option (edge1, edge2, weight, network, directed, keep_self_edges,
+            remove_zero_degree, largest_component) overriding the defaults
+        defaults: Loader options shared by all networks
+    """
+    networks = []
+    for spec in specs:
+        name, sep, path = spec.partition("=")
+        if not sep or not name or not path:
+            raise ValueError(f"Expected NAME=PATH, got '{spec}'")
+        networks.append({**defaults, "name": name, "path": path})
+
+    if config_path:
+        with open(config_path, encoding="utf-8") as f:
+            entries = json.load(f)
+        for entry in entries:
+            if "name" not in entry or "path" not in entry:
+                raise ValueError(f"Network entries in {config_path} need 'name' and 'path'")
+            networks.append({**defaults, **entry})
+
+    if not networks:
+        raise ValueError("No networks to serve; use --graph NAME=PATH or --config FILE")
+    return networks
+
+
+async def serve(networks: list[dict], host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                max_workers: Optional[int] = None) -> None:
+    """Load the networks and serve requests until cancelled"""
+    loader = GraphLoader()
+    with AnalysisPool(max_workers) as pool:
+        server = AnalysisServer(pool)
+        for spec in networks:
+            G = loader.load(spec["edge1"], spec["edge2"], spec["weight"], spec["path"],
+                            remove_self_edges=not spec["keep_self_edges"],
+                            network_name=spec["network"], directed=spec["directed"])
+            G = loader.process_graph(G, spec["remove_zero_degree"], spec["largest_component"])
+            server.add_network(spec["name"], G, spec["path"])
+            print(f"Loaded '{spec['name']}': {G.number_of_nodes()} nodes, {G.number_of_edges()} edges",
+                  file=sys.stderr)
+
+        tcp_server = await asyncio.start_server(server.handle_connection, host, port)
+        print(f"Serving {len(server.networks)} network(s) on http://{host}:{port} "
+              f"with {pool.max_workers} worker(s)", file=sys.stderr)
+        async with tcp_server:
+            await tcp_server.serve_forever()
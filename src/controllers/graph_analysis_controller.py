@@ -1,7 +1,12 @@
-from os import path
-
+import queue
+import threading
 from typing import Any
 
+from src.models.node_index import node_labels, node_ids
+
+# Worker processes running the GUI's analyses: one for the baseline, one for the removal
+ANALYSIS_WORKERS = 2
+
 class GraphAnalysisController:
     def __init__(self, app: Any, loader, analysis, layout_cache, renderer):
         self.app = app
@@ -10,6 +15,13 @@ class GraphAnalysisController:
         self.layout_cache = layout_cache
         self.renderer = renderer
         self.random_graph = None  # Store random graph when generated
+        self._job_store = None  # Opened on first use (see job_store)
+        self._job_worker = None  # Background worker started for queued jobs
+        self._pool = None  # Worker processes for run_analysis, started on first use
+        self._analysis = None  # The analysis running on a background thread
+        self._search_pool = None  # Worker processes for find_critical_nodes (one per CPU), started on first use
+        self._search = None  # The running critical node search
+        self._robustness = None  # The robustness curve being computed
     def set_random_graph(self, graph):
         """Set a random graph for analysis"""
         self.random_graph = graph
@@ -45,6 +57,7 @@ class GraphAnalysisController:
                     "show_node_names": True,
                     "edge_thickness_by_weight": True,
                     "mark_removed_edges": False,
+                    "layout_type": self.app.toolbar.layout_type_var.get(),
                 }
 
                 self.renderer.render(self.app.plot.figure, preview_result, preview_options)
@@ -52,9 +65,8 @@ class GraphAnalysisController:
 
                 self.app.status.set_status(f"Preview loaded: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
 
-                # Populate the node selector with available nodes
-                nodes = sorted(G.nodes())
-                self.app.toolbar.update_node_list(nodes)
+                # Populate the node selector with the labels of the available nodes
+                self.app.toolbar.update_node_list(node_labels(G, G.nodes()))
 
                 # Populate the adjacency list and show it
                 self.app.adjacency_list.populate(G)
@@ -77,7 +89,7 @@ class GraphAnalysisController:
         network_name = self.app.toolbar.get_selected_network()
 
         # Only require column parameters for TSV files. GEXF/CYS (and other formats) may not need columns.
-        file_ext = path.splitext(file_path)[1].lower() if file_path else ""
+        file_ext = self.loader.get_file_format(file_path) if file_path else ""
         # If no file path provided, nothing to load
         if not file_path:
             return
@@ -108,6 +120,8 @@ class GraphAnalysisController:
                 "show_node_names": True,
                 "edge_thickness_by_weight": True,
                 "mark_removed_edges": False,
+                # The results reuse the preview's layout, so both use the selected type
+                "layout_type": self.app.toolbar.layout_type_var.get(),
             }
 
             self.renderer.render(self.app.plot.figure, preview_result, preview_options)
@@ -115,9 +129,8 @@ class GraphAnalysisController:
 
             self.app.status.set_status(f"Preview loaded: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
 
-            # Populate the node selector with available nodes
-            nodes = sorted(G.nodes())
-            self.app.toolbar.update_node_list(nodes)
+            # Populate the node selector with the labels of the available nodes
+            self.app.toolbar.update_node_list(node_labels(G, G.nodes()))
 
             # Populate the adjacency list and show it
             self.app.adjacency_list.populate(G)
@@ -126,64 +139,109 @@ class GraphAnalysisController:
         except Exception as e:
             self.app.status.set_status(f"Preview failed: {str(e)}")
 
-    def run_analysis(self) -> None:
+    @property
+    def job_store(self):
+        """The job store, opened on first use"""
+        if self._job_store is None:
+            from src.models.job_store import JobStore
+            self._job_store = JobStore()
+        return self._job_store
+
+    def _analysis_settings(self) -> dict:
         """
-        Runs the centrality analysis
-        Populates the table
-        Plots the result in the graph view
+        Reads the analysis request from the toolbar (Tk thread only)
+
+        Returns:
+            The graph settings of _graph_settings with the 'removed_labels' and
+            'centralities'; _load_request turns them into a graph
         """
-        # Get the selected nodes from the toolbar (these may be strings)
-        removed_nodes_str = self.app.toolbar.get_selected_nodes()
+        # Get the labels of the selected nodes from the toolbar
+        removed_labels = self.app.toolbar.get_selected_nodes()
         selected_centralities = [k for k, v in self.app.toolbar.centrality_vars.items() if v.get()]
 
         # If no nodes are selected, use an empty list to show centrality for all nodes
-        if not removed_nodes_str:
-            removed_nodes_str = []
+        if not removed_labels:
+            removed_labels = []
         if not selected_centralities:
             raise ValueError("Please select at least one centrality measure")
 
+        settings = self._graph_settings()
+        settings["removed_labels"] = removed_labels
+        settings["centralities"] = selected_centralities
+        return settings
+
+    def _load_request(self, settings: dict):
+        """
+        Loads the graph of an analysis request (any thread)
+
+        Returns:
+            (graph, removed node labels, selected centralities, graph type label, graph source for the job list)
+        """
+        G, file_type, source = self._load_graph(settings)
+
+        # Fail early on labels that are not in the graph
+        node_ids(G, settings["removed_labels"])
+        return G, settings["removed_labels"], settings["centralities"], file_type, source
+
+    def _graph_settings(self) -> dict:
+        """
+        Reads the graph configured in the toolbar and its processing options (Tk thread only)
+
+        Returns:
+            dict for _load_graph: the random graph or the file and its load options,
+            and the graph processing options
+        """
+        settings = {
+            "remove_zero_degree": self.app.toolbar.remove_zero_degree_var.get(),
+            "use_largest_component": self.app.toolbar.use_largest_component_var.get(),
+        }
         # Handle random graph mode
         if self.app.toolbar.is_random_graph_mode():
             if self.random_graph is None:
                 raise ValueError("Please generate a random graph first")
+            settings["random_graph"] = self.random_graph
+            settings["graph_type"] = self.app.toolbar.get_random_graph_params()['graph_type']
+            return settings
 
-            G = self.random_graph.copy()  # Make a copy to avoid modifying the original
+        # Handle file-based mode
+        file_path = self.app.toolbar.file_var.get().strip()
+        if not file_path:
+            raise ValueError("Please select a graph file")
+        settings.update({
+            "file_path": file_path,
+            "edge1": self.app.toolbar.edge1_var.get().strip() or "edge1",
+            "edge2": self.app.toolbar.edge2_var.get().strip() or "edge2",
+            "weight": self.app.toolbar.weight_var.get().strip() or "weight",
+            "remove_self_edges": self.app.toolbar.remove_self_edges_var.get(),
+            "directed": self.app.toolbar.directed_graph_var.get(),
+            "network_name": self.app.toolbar.get_selected_network(),
+        })
+        return settings
+
+    def _load_graph(self, settings: dict):
+        """
+        Loads a graph described by _graph_settings, with the graph processing options applied (any thread)
 
-            # Convert string node IDs back to the original type (int for random graphs)
-            removed_nodes = []
-            for node_str in removed_nodes_str:
-                try:
-                    # Try to convert to int first (for random graphs)
-                    removed_nodes.append(int(node_str))
-                except ValueError:
-                    # If conversion fails, keep as string
-                    removed_nodes.append(node_str)
+        Returns:
+            (graph, graph type label, graph source for the job list)
+        """
+        if "random_graph" in settings:
+            G = settings["random_graph"].copy()  # Make a copy to avoid modifying the original
 
-            params = self.app.toolbar.get_random_graph_params()
             from src.models.random_graph_generator import get_graph_type_display_names
             display_names = get_graph_type_display_names()
-            graph_type_display = display_names.get(params['graph_type'], params['graph_type'])
+            graph_type_display = display_names.get(settings['graph_type'], settings['graph_type'])
             file_type = f"Random {graph_type_display}"
+            source = f"{file_type} ({G.number_of_nodes()} nodes)"
         else:
-            # Handle file-based mode
-            file_path = self.app.toolbar.file_var.get().strip()
-            edge1 = self.app.toolbar.edge1_var.get().strip() or "edge1"
-            edge2 = self.app.toolbar.edge2_var.get().strip() or "edge2"
-            weight = self.app.toolbar.weight_var.get().strip() or "weight"
-            remove_self_edges = self.app.toolbar.remove_self_edges_var.get()
-            directed = self.app.toolbar.directed_graph_var.get()
-            network_name = self.app.toolbar.get_selected_network()
-
-            if not file_path:
-                raise ValueError("Please select a graph file")
-
-            G = self.loader.load(edge1, edge2, weight, file_path, remove_self_edges, network_name, directed)
-
-            # For file-based graphs, keep nodes as strings (they're usually strings anyway)
-            removed_nodes = removed_nodes_str
+            file_path = settings["file_path"]
+            network_name = settings["network_name"]
+            G = self.loader.load(settings["edge1"], settings["edge2"], settings["weight"], file_path,
+                                 settings["remove_self_edges"], network_name, settings["directed"])
+            source = file_path
 
             # Set file_type based on file extension
-            file_ext = path.splitext(file_path)[1].lower()
+            file_ext = self.loader.get_file_format(file_path)
             if file_ext == '.cys':
                 if network_name:
                     file_type = f"CYS file (network: {network_name})"
@@ -195,12 +253,369 @@ class GraphAnalysisController:
                 file_type = f"{file_ext.upper()} file"
 
         # Apply graph processing options to both random and file-based graphs
-        remove_zero_degree = self.app.toolbar.remove_zero_degree_var.get()
-        use_largest_component = self.app.toolbar.use_largest_component_var.get()
-        G = self.loader.process_graph(G, remove_zero_degree, use_largest_component)
+        G = self.loader.process_graph(G, settings["remove_zero_degree"], settings["use_largest_component"])
         file_type = f"Read from {file_type}"
+        return G, file_type, source
+
+    @staticmethod
+    def _job_options(settings: dict) -> dict:
+        """Load and graph processing options of a request (see _graph_settings), as stored with its job"""
+        from src.models.job_store import job_options
+
+        return job_options(
+            remove_self_edges=settings.get("remove_self_edges"),
+            directed=settings.get("directed"),
+            network=settings.get("network_name"),
+            remove_zero_degree=settings["remove_zero_degree"],
+            largest_component=settings["use_largest_component"],
+        )
+
+    def _current_graph(self):
+        """
+        Loads the graph configured in the toolbar, with the graph processing options applied
+
+        Returns:
+            (graph, graph type label, graph source for the job list)
+        """
+        return self._load_graph(self._graph_settings())
+
+    @property
+    def analysis_running(self) -> bool:
+        return self._analysis is not None
+
+    def run_analysis(self) -> None:
+        """
+        Starts the centrality analysis
+
+        Only the toolbar is read on the Tk thread. Loading the graph, the job
+        store lookup and registering the graph with the workers run on a
+        background thread, which waits for the baseline and the removal computed
+        on an AnalysisPool and builds the table; the caller polls poll_analysis
+        (with after()) until the results are shown. An identical earlier request
+        is reopened from the job store instead of being recomputed, and stored
+        baselines are reused.
+        """
+        from src.models.analysis_pool import AnalysisPool
+
+        if self._analysis is not None:
+            raise ValueError("An analysis is already running")
+
+        settings = self._analysis_settings()
+        if self._pool is None:
+            self._pool = AnalysisPool(ANALYSIS_WORKERS)
+        pool = self._pool
+        messages = queue.Queue()
+
+        def run():
+            try:
+                messages.put(("done", self._compute_analysis(settings, pool)))
+            except Exception as e:
+                messages.put(("error", e))
+
+        # An abandoned analysis (see shutdown) reports to a queue nobody reads
+        self._analysis = {"messages": messages}
+        threading.Thread(target=run, daemon=True).start()
+
+    def _compute_analysis(self, settings: dict, pool) -> tuple:
+        """
+        Loads, computes (or reopens) and tabulates an analysis request (background thread)
+
+        Returns:
+            Arguments of _show_result
+        """
+        from src.models.analysis_pool import removal_task
+        from src.models.graph_fingerprint import graph_cache_key
+        from src.models.job_store import JOB_DONE, job_task
+
+        G, removed_labels, selected_centralities, file_type, source = self._load_request(settings)
+        options = self._job_options(settings)
+
+        try:
+            store = self.job_store
+            # Stored results are indexed by the ids of the stored copy of the graph
+            fingerprint, G = store.canonical_graph(G)
+            job = store.find(fingerprint, removed_labels, selected_centralities, options)
+        except Exception as e:
+            # The analysis does not depend on the job store being available
+            print(f"Job store unavailable: {e}")
+            store, job = None, None
+
+        if job is not None and job["status"] == JOB_DONE:
+            return self._stored_result(job["id"], file_type)
+
+        # Models work on interned node ids; labels are only used for display
+        removed_nodes = node_ids(G, removed_labels)
+
+        # Workers keep the graph resident, so running again on it only sends the removal set
+        key = ("gui-graph", graph_cache_key(G))
+        pool.register_graph(key, G)
+
+        baseline = store.load_baseline(fingerprint, selected_centralities, options) if store is not None else None
+        baseline_future = None
+        if baseline is None:
+            baseline_future = pool.submit(job_task, key, [], selected_centralities, None)
+        removal_future = pool.submit(removal_task, key, removed_nodes, selected_centralities) if removed_nodes else None
+        if baseline_future is not None:
+            baseline, _ = baseline_future.result()
+        removal = removal_future.result() if removal_future is not None else baseline
+
+        if store is not None:
+            try:
+                store.record(G, removed_labels, selected_centralities, baseline, removal, options, source)
+            except Exception as e:
+                print(f"Failed to record job: {e}")
+
+        df, impact, diameter_info = self.analysis.build_table(G, removed_nodes, selected_centralities,
+                                                              baseline, removal)
+        return G, removed_nodes, df, impact, diameter_info, file_type
+
+    def poll_analysis(self) -> bool:
+        """
+        Shows the results of the running analysis once they are ready (Tk thread only)
+
+        Returns:
+            Whether the analysis is finished; a failed analysis raises its error
+        """
+        analysis = self._analysis
+        if analysis is None:
+            return True
+        try:
+            kind, value = analysis["messages"].get_nowait()
+        except queue.Empty:
+            return False
+        self._analysis = None
+        if kind == "error":
+            raise value
+        self._show_result(*value)
+        return True
+
+    @property
+    def search_running(self) -> bool:
+        return self._search is not None
+
+    def find_critical_nodes(self, budget: int, objective: str, candidate_count: int) -> None:
+        """
+        Starts a critical node search (CriticalNodeSearch) on the current graph
+
+        The candidates are the nodes selected in the node list, or the
+        candidate_count nodes with the highest degree. Only the toolbar is read
+        on the Tk thread; loading the graph, choosing the candidates and the
+        search itself run on a background thread that only waits for the worker
+        processes. The caller polls poll_critical_nodes (with after()) for its
+        progress and result.
+        """
+        from src.models.analysis_pool import AnalysisPool
+        from src.models.critical_nodes import CriticalNodeSearch, top_degree_candidates
+
+        if self._search is not None:
+            raise ValueError("A critical node search is already running")
+
+        settings = self._analysis_settings()
+        if self._search_pool is None:
+            self._search_pool = AnalysisPool()
+        pool = self._search_pool
+        messages = queue.Queue()
+        # Set by cancel_critical_nodes, which may run before the search exists
+        cancelled = threading.Event()
+        state = {
+            "search": None,
+            "cancelled": cancelled,
+            "messages": messages,
+            "progress": (0, budget, 0),
+        }
+
+        def run():
+            try:
+                G, selected_labels, selected_centralities, _, _ = self._load_request(settings)
+                if selected_labels:
+                    candidates = node_ids(G, selected_labels)
+                else:
+                    candidates = top_degree_candidates(G, candidate_count)
+                search = CriticalNodeSearch(G, selected_centralities, objective, pool=pool)
+                state["search"] = search
+                if cancelled.is_set():
+                    search.cancel()
+                result = search.run(budget, candidates,
+                                    progress=lambda selected, k, evaluations: messages.put(
+                                        ("progress", (selected, k, evaluations))))
+                messages.put(("done", (node_labels(G, result["nodes"]), result)))
+            except Exception as e:
+                messages.put(("error", e))
 
-        df, impact, diameter_info = self.analysis.compute(G, removed_nodes, selected_centralities)
+        self._search = state
+        threading.Thread(target=run, daemon=True).start()
+
+    def poll_critical_nodes(self):
+        """
+        Checks on the running critical node search (Tk thread only)
+
+        Returns:
+            None while the search runs (see critical_nodes_progress), otherwise
+            (labels of the selected nodes, search result); a failed search raises its error
+        """
+        search = self._search
+        if search is None:
+            return None
+        while True:
+            try:
+                kind, value = search["messages"].get_nowait()
+            except queue.Empty:
+                return None
+            if kind == "progress":
+                search["progress"] = value
+                continue
+            self._search = None
+            if kind == "error":
+                raise value
+            return value
+
+    @property
+    def critical_nodes_progress(self) -> tuple[int, int, int]:
+        """(nodes selected, budget, evaluations) of the running search"""
+        return self._search["progress"] if self._search is not None else (0, 0, 0)
+
+    def cancel_critical_nodes(self) -> None:
+        """Stops the running search after the evaluations in progress; it still reports the nodes selected so far"""
+        search = self._search
+        if search is not None:
+            search["cancelled"].set()
+            if search["search"] is not None:
+                search["search"].cancel()
+
+    @property
+    def robustness_running(self) -> bool:
+        return self._robustness is not None
+
+    def run_robustness(self, strategy: str, ranking_path: str = None, diameter_checkpoints: int = 0) -> None:
+        """
+        Starts computing a robustness curve of the current graph in a worker process
+
+        Only the toolbar is read on the Tk thread. Loading the graph and the
+        ranking and registering the graph with the workers run on a background
+        thread, which waits for the curve; the caller polls poll_robustness
+        (with after()) until the curve is shown.
+
+        Args:
+            strategy: Key of REMOVAL_STRATEGIES
+            ranking_path: File of node labels in removal order, for the 'ranking' strategy
+            diameter_checkpoints: Number of points at which the diameter is sampled (0: none)
+        """
+        from src.models.analysis_pool import AnalysisPool
+        from src.models.graph_fingerprint import graph_cache_key
+        from src.models.robustness import robustness_task
+
+        if self._robustness is not None:
+            raise ValueError("A robustness curve is already being computed")
+
+        if strategy == "ranking" and not ranking_path:
+            raise ValueError("Please select a ranking file")
+
+        settings = self._graph_settings()
+        if self._pool is None:
+            self._pool = AnalysisPool(ANALYSIS_WORKERS)
+        pool = self._pool
+        messages = queue.Queue()
+
+        def run():
+            try:
+                G, _, _ = self._load_graph(settings)
+                ranking = node_ids(G, self.loader.load_labels(ranking_path)) if strategy == "ranking" else None
+                key = ("gui-graph", graph_cache_key(G))
+                pool.register_graph(key, G)
+                curve = pool.submit(robustness_task, key, strategy, ranking, diameter_checkpoints).result()
+                messages.put(("done", (G, curve)))
+            except Exception as e:
+                messages.put(("error", e))
+
+        # An abandoned computation (see shutdown) reports to a queue nobody reads
+        self._robustness = {"strategy": strategy, "messages": messages}
+        threading.Thread(target=run, daemon=True).start()
+
+    def poll_robustness(self) -> bool:
+        """
+        Shows the robustness curve as a table and a plot once it is computed (Tk thread only)
+
+        Returns:
+            Whether the computation is finished; a failed computation raises its error
+        """
+        from src.models.robustness import REMOVAL_STRATEGIES, robustness_index
+
+        robustness = self._robustness
+        if robustness is None:
+            return True
+        try:
+            kind, value = robustness["messages"].get_nowait()
+        except queue.Empty:
+            return False
+        self._robustness = None
+        if kind == "error":
+            raise value
+        G, curve = value
+
+        index = robustness_index(curve)
+        self.app._show_analysis_table()
+        self.app.table.populate(curve)
+        self.app.table.show_summary(f"Robustness index R = {index:.4f}")
+
+        title = (f"Robustness ({REMOVAL_STRATEGIES[robustness['strategy']]}): {G.number_of_nodes()} nodes, "
+                 f"R = {index:.3f}")
+        self.renderer.render_robustness(self.app.plot.figure, curve, title)
+        self.app.plot.canvas.draw_idle()
+        return True
+
+    def shutdown(self) -> None:
+        """Stops the analysis workers, abandoning a running analysis or search"""
+        self._analysis = None
+        self._robustness = None
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+        self.cancel_critical_nodes()
+        self._search = None
+        if self._search_pool is not None:
+            self._search_pool.terminate()
+            self._search_pool = None
+
+    def queue_analysis(self) -> dict:
+        """
+        Queues the current analysis request as a job and makes sure a background worker runs it
+
+        Returns:
+            The job; it may already be finished if an identical request was run before
+        """
+        from src.models.job_store import JOB_QUEUED, start_worker, worker_alive
+
+        settings = self._analysis_settings()
+        G, removed_labels, selected_centralities, _, source = self._load_request(settings)
+        job, _ = self.job_store.submit(G, removed_labels, selected_centralities, self._job_options(settings), source)
+        if job["status"] == JOB_QUEUED and not worker_alive(self._job_worker):
+            self._job_worker = start_worker(self.job_store)
+        return job
+
+    def resume_jobs(self) -> int:
+        """Queues interrupted jobs again and starts a background worker for them"""
+        from src.models.job_store import JOB_QUEUED, start_worker, worker_alive
+
+        count = self.job_store.resume()
+        if self.job_store.list_jobs(JOB_QUEUED, limit=1) and not worker_alive(self._job_worker):
+            self._job_worker = start_worker(self.job_store)
+        return count
+
+    def open_job(self, job_id: int, file_type: str = None) -> None:
+        """Shows the stored result of a finished job without recomputing it"""
+        self._show_result(*self._stored_result(job_id, file_type))
+
+    def _stored_result(self, job_id: int, file_type: str = None) -> tuple:
+        """Loads and tabulates the stored result of a finished job (any thread); returns arguments of _show_result"""
+        stored = self.job_store.load_result(job_id)
+        job = stored["job"]
+        df, impact, diameter_info = self.analysis.build_table(
+            stored["graph"], stored["removed_nodes"], job["centralities"], stored["baseline"], stored["removal"])
+        return (stored["graph"], stored["removed_nodes"], df, impact, diameter_info,
+                file_type or f"Job {job_id}: {job['source']}")
+
+    def _show_result(self, G, removed_nodes, df, impact, diameter_info, file_type) -> None:
+        df.index = node_labels(G, df.index)
 
         # Switch to analysis table view and populate it
         self.app._show_analysis_table()
@@ -219,7 +634,7 @@ class GraphAnalysisController:
 
         # Create a readable list of removed nodes
         if removed_nodes:
-            removed_nodes_str = ", ".join(str(node) for node in removed_nodes)
+            removed_nodes_str = ", ".join(node_labels(G, removed_nodes))
             label = f"Removed Nodes: {removed_nodes_str}"
         else:
             label = "All Nodes (No Removal)"
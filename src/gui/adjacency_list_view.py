@@ -1,12 +1,24 @@
 import tkinter as tk
 from tkinter import ttk
-import networkx as nx
+from typing import TYPE_CHECKING
+
+from src.gui.virtual_tree import VirtualTreeview
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+# Adjacent nodes listed in a row before the list is cut short (double-click expands it)
+ADJACENCY_PREVIEW = 50
 
 
 class AdjacencyListView(ttk.Frame):
     """
     A view component that displays the adjacency list of a graph in table format.
     Shows each node and its adjacent nodes.
+
+    Rows are shown through a VirtualTreeview: a row's list of adjacent nodes is
+    only built when the row scrolls into view, and lists longer than
+    ADJACENCY_PREVIEW are cut short until the row is expanded.
     """
 
     def __init__(self, master: tk.Misc):
@@ -16,49 +28,26 @@ class AdjacencyListView(ttk.Frame):
         label = ttk.Label(self, text="Graph Adjacency List", font=("Segoe UI", 11, "bold"))
         label.pack(side=tk.TOP, fill=tk.X, padx=5, pady=(5, 2))
 
-        # Create frame for the treeview and scrollbars
-        tree_frame = ttk.Frame(self)
-        tree_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
-
-        # Initialize treeview with two columns
+        # Initialize the virtual treeview with one column besides the node names
         self.columns = ("adjacent_nodes",)
-        self.tree = ttk.Treeview(
-            tree_frame,
-            columns=self.columns,
-            show="tree headings",
-            selectmode="extended"
-        )
+        self.view = VirtualTreeview(self, self.columns, show="tree headings", selectmode="extended")
+        self.tree = self.view.tree
 
         # Configure the tree column (node names)
-        self.tree.heading("#0", text="Node", command=lambda: self._sort_column("#0", False))
+        self.tree.heading("#0", text="Node",
+                          command=lambda: self._sort_column("#0", self.sort_reverse.get("#0", False)))
         self.tree.column("#0", width=150, minwidth=100, anchor=tk.W, stretch=False)
 
         # Configure the adjacent nodes column with better width handling
         self.tree.heading("adjacent_nodes", text="Adjacent Nodes",
-                         command=lambda: self._sort_column("adjacent_nodes", False))
+                         command=lambda: self._sort_column("adjacent_nodes",
+                                                           self.sort_reverse.get("adjacent_nodes", False)))
         # Set a larger initial width and allow stretching for long adjacency lists
         self.tree.column("adjacent_nodes", width=600, minwidth=300, anchor=tk.W, stretch=True)
 
-        # Add scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscroll=v_scrollbar.set, xscroll=h_scrollbar.set)
-
-        # Pack treeview and scrollbars using grid for better control
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        v_scrollbar.grid(row=0, column=1, sticky="ns")
-        h_scrollbar.grid(row=1, column=0, sticky="ew")
-
-        # Configure grid weights to ensure proper resizing
-        tree_frame.grid_rowconfigure(0, weight=1)
-        tree_frame.grid_columnconfigure(0, weight=1)
-
-        # Configure alternating row colors (zebra striping)
-        try:
-            self.tree.tag_configure('evenrow', background='#f0f0f0')  # Light grey
-            self.tree.tag_configure('oddrow', background='#e0e0e0')   # Medium grey
-        except Exception:
-            pass
+        # Double-click or Enter expands a row's cut-short list, or collapses it again
+        self.tree.bind("<Double-1>", self._on_toggle_row, add="+")
+        self.tree.bind("<Return>", self._on_toggle_row, add="+")
 
         # Track sort direction for each column
         self.sort_reverse = {}
@@ -67,27 +56,30 @@ class AdjacencyListView(ttk.Frame):
         self.node_count_label = ttk.Label(self, text="Nodes: 0, Edges: 0",
                                          font=("Segoe UI", 9), foreground="gray")
         self.node_count_label.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=(2, 5))
+        self.view.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+
+        self._graph = None
+        self._nodes = None      # Node ids, by row position
+        self._labels = None     # Node labels, by row position
+        self._position = None   # Row position of each node id (-1 for ids not in the graph)
+        self._rank = None       # Place of each row in label order
+        self._by_label = None   # Row positions in label order
+        self._order = None      # Row positions in display order
+        self._expanded = set()  # Row positions whose full list is shown
 
     def _sort_column(self, col, reverse):
-        """Sort treeview contents by the specified column"""
-        # Get all items and their values
-        items = []
-        for child in self.tree.get_children(''):
-            if col == "#0":
-                value = self.tree.item(child, "text")
-            else:
-                value = self.tree.set(child, col)
-            items.append((value, child))
-
-        # Sort items (string sort for node names and adjacency lists)
-        items.sort(key=lambda x: str(x[0]).lower(), reverse=reverse)
-
-        # Rearrange items in sorted positions
-        for index, (val, child) in enumerate(items):
-            self.tree.move(child, '', index)
-            # Update row colors
-            tag = 'oddrow' if index % 2 else 'evenrow'
-            self.tree.item(child, tags=(tag,))
+        """Sort the rows by the specified column"""
+        import numpy as np
+
+        if self._graph is None:
+            return
+
+        if col == "#0":
+            order = np.argsort(np.char.lower(self._labels), kind="stable")
+        else:
+            order = self._adjacency_order()
+        self._order = order[::-1] if reverse else order
+        self.view.refresh()
 
         # Update sort direction for next click
         self.sort_reverse[col] = not reverse
@@ -99,77 +91,123 @@ class AdjacencyListView(ttk.Frame):
             arrow = " ↓" if reverse else " ↑"
             self.tree.heading(col, text=base_text + arrow)
 
-    def clear(self):
-        """Clear all items from the treeview"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+    def _adjacency_order(self):
+        """
+        Row positions ordered by adjacency list: by the first adjacent node in label
+        order, then by the number of adjacent nodes; rows without any come first.
+        """
+        import numpy as np
+
+        count = len(self._nodes)
+        first = np.full(count, count, dtype=np.int64)
+        source, target = self._edge_positions()
+        np.minimum.at(first, source, self._rank[target])
+        degree = np.bincount(source, minlength=count)
+        first[degree == 0] = -1
+        return np.lexsort((degree, first))
+
+    def _edge_positions(self):
+        """(row, adjacent row) position arrays of all adjacency entries"""
+        import numpy as np
+        from itertools import chain
+
+        graph = self._graph
+        edges = graph.number_of_edges()
+        flat = np.fromiter(chain.from_iterable(graph.edges()), dtype=np.int64, count=2 * edges)
+        source, target = self._position[flat[0::2]], self._position[flat[1::2]]
+        if not graph.is_directed():
+            source, target = np.concatenate([source, target]), np.concatenate([target, source])
+        return source, target
 
-    def populate(self, graph: nx.Graph):
+    def clear(self):
+        """Clear all rows from the view"""
+        self.view.clear()
+        self._graph = None
+        self._nodes = None
+        self._labels = None
+        self._position = None
+        self._rank = None
+        self._by_label = None
+        self._order = None
+        self._expanded = set()
+
+    def populate(self, graph: "nx.Graph"):
         """
-        Populate the treeview with adjacency list data from a NetworkX graph.
+        Show the adjacency list of a NetworkX graph.
+
+        Only the sort index is computed here; the lists of adjacent nodes are
+        formatted when their rows come into view.
 
         Args:
-            graph: A NetworkX Graph object
+            graph: A NetworkX Graph object with interned node ids
         """
+        import numpy as np
+        from src.models.node_index import node_labels
+
         self.clear()
 
         if graph is None or graph.number_of_nodes() == 0:
+            self.node_count_label.config(text="Nodes: 0, Edges: 0")
             return
 
-        # Get sorted list of nodes
-        nodes = sorted(graph.nodes())
-
-        # Track the maximum width needed for the adjacent nodes column
-        max_adjacent_width = 0
-
-        # Populate data
-        for idx, node in enumerate(nodes):
-            # Get adjacent nodes (neighbors)
-            neighbors = sorted(graph.neighbors(node))
-
-            # Format the adjacent nodes as a comma-separated string
-            if neighbors:
-                adjacent_str = ", ".join(str(n) for n in neighbors)
-                # Track the length for width calculation (approximate)
-                max_adjacent_width = max(max_adjacent_width, len(adjacent_str))
-            else:
-                adjacent_str = "(no adjacent nodes)"
-
-            # Insert row with alternating colors
-            tag = 'oddrow' if idx % 2 else 'evenrow'
-            self.tree.insert("", tk.END, text=str(node), values=(adjacent_str,), tags=(tag,))
-
-        # Adjust the adjacent nodes column width based on content
-        # Use a reasonable character width estimate (about 7 pixels per character)
-        # Allow for very wide columns to accommodate long adjacency lists
-        estimated_width = max(max_adjacent_width * 7, 400)  # Minimum 400px
-        self.tree.column("adjacent_nodes", width=estimated_width, minwidth=400)
+        # Nodes are interned ids; display and sort them by label
+        self._graph = graph
+        self._nodes = np.fromiter(graph.nodes(), dtype=np.int64, count=graph.number_of_nodes())
+        self._labels = np.array(node_labels(graph, self._nodes.tolist()), dtype=str)
+        self._position = np.full(int(self._nodes.max()) + 1, -1, dtype=np.int64)
+        self._position[self._nodes] = np.arange(len(self._nodes))
+        self._by_label = np.argsort(self._labels, kind="stable")
+        self._rank = np.empty_like(self._by_label)
+        self._rank[self._by_label] = np.arange(len(self._by_label))
+        self._order = self._by_label
+
+        # Estimate the width of the longest (cut short) list, about 7 pixels per character
+        degrees = np.fromiter((d for _, d in graph.degree()), dtype=np.int64, count=len(self._nodes))
+        label_width = float(np.char.str_len(self._labels).mean()) + 2
+        estimated_width = int(min(int(degrees.max()), ADJACENCY_PREVIEW) * label_width * 7)
+        self.tree.column("adjacent_nodes", width=max(estimated_width, 400), minwidth=400)
 
         # Update the node count label
         node_count = graph.number_of_nodes()
         edge_count = graph.number_of_edges()
         self.node_count_label.config(text=f"Nodes: {node_count}, Edges: {edge_count}")
 
-        # Force the treeview to update its scrollable region
-        self.tree.update_idletasks()
-
-        # Update scrollbars to reflect new content
-        self.update_idletasks()
-
-        # Ensure the horizontal scrollbar is properly configured
-        self._update_scrollbars()
-
-    def _update_scrollbars(self):
-        """Ensure scrollbars are properly updated after content changes"""
-        # Force update of the scrollable region
-        self.tree.update()
-
-        # Get the scrollbar widgets
-        for child in self.tree.master.winfo_children():
-            if isinstance(child, ttk.Scrollbar):
-                if child.cget('orient') == 'horizontal':
-                    # Force horizontal scrollbar to update
-                    child.set(*self.tree.xview())
-                elif child.cget('orient') == 'vertical':
-                    # Force vertical scrollbar to update
-                    child.set(*self.tree.yview())
\ No newline at end of file
+        self.view.set_rows(node_count, self._fetch_rows)
+
+    def _fetch_rows(self, start: int, stop: int) -> list:
+        """(row position, node label, (adjacent nodes,)) of the rows at display positions start..stop"""
+        return [(int(p), self._labels[p], (self._adjacency_text(int(p)),)) for p in self._order[start:stop]]
+
+    def _adjacency_text(self, position: int) -> str:
+        """Comma-separated labels of a row's adjacent nodes in label order, cut short unless expanded"""
+        import numpy as np
+
+        adjacency = self._graph[int(self._nodes[position])]
+        if not adjacency:
+            return "(no adjacent nodes)"
+
+        ranks = self._rank[self._position[np.fromiter(adjacency, dtype=np.int64, count=len(adjacency))]]
+        hidden = 0
+        if position not in self._expanded and len(ranks) > ADJACENCY_PREVIEW:
+            # Only the first labels in order are needed: partition, then sort those
+            hidden = len(ranks) - ADJACENCY_PREVIEW
+            ranks = np.partition(ranks, ADJACENCY_PREVIEW - 1)[:ADJACENCY_PREVIEW]
+        text = ", ".join(self._labels[self._by_label[np.sort(ranks)]].tolist())
+        if hidden:
+            text += f", … (+{hidden} more, double-click to expand)"
+        return text
+
+    def _on_toggle_row(self, event):
+        """Expand the row's full list of adjacent nodes, or cut it short again"""
+        if event.type == tk.EventType.KeyPress:
+            item = self.tree.focus()
+        else:
+            item = self.tree.identify_row(event.y)
+        position = self.view.key_of(item)
+        if position is None:
+            return
+        if position in self._expanded:
+            self._expanded.discard(position)
+        else:
+            self._expanded.add(position)
+        self.view.refresh()
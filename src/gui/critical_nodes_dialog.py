@@ -0,0 +1,66 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+from typing import Callable
+
+from src.models.critical_nodes import OBJECTIVES, DEFAULT_BUDGET, DEFAULT_CANDIDATE_COUNT
+
+
+class CriticalNodesDialog(tk.Toplevel):
+    """
+    Asks for the budget, objective and candidate pool of a critical node search.
+
+    on_search receives a dict with 'budget', 'objective' (key of OBJECTIVES) and
+    'candidate_count'.
+    """
+
+    def __init__(self, master: tk.Misc, on_search: Callable[[dict], None]):
+        super().__init__(master)
+        self.title("Find Critical Nodes")
+        self.resizable(False, False)
+        self.transient(master)
+        self.on_search = on_search
+
+        # Display name -> objective key
+        self._objectives = {name: key for key, name in OBJECTIVES.items()}
+
+        form = ttk.Frame(self)
+        form.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        ttk.Label(form, text="Nodes to remove (k):").grid(row=0, column=0, sticky=tk.W, padx=(0, 6), pady=4)
+        self.budget_var = tk.StringVar(value=str(DEFAULT_BUDGET))
+        ttk.Entry(form, textvariable=self.budget_var, width=8).grid(row=0, column=1, sticky=tk.W, pady=4)
+
+        ttk.Label(form, text="Maximize:").grid(row=1, column=0, sticky=tk.W, padx=(0, 6), pady=4)
+        self.objective_var = tk.StringVar(value=OBJECTIVES["delta"])
+        ttk.Combobox(form, textvariable=self.objective_var, values=list(self._objectives),
+                     state="readonly", width=24).grid(row=1, column=1, sticky=tk.W, pady=4)
+
+        ttk.Label(form, text="Candidates (highest degree):").grid(row=2, column=0, sticky=tk.W, padx=(0, 6), pady=4)
+        self.candidate_var = tk.StringVar(value=str(DEFAULT_CANDIDATE_COUNT))
+        ttk.Entry(form, textvariable=self.candidate_var, width=8).grid(row=2, column=1, sticky=tk.W, pady=4)
+
+        ttk.Label(form, text="Nodes selected in the node list are used as the candidates instead.",
+                  foreground="gray").grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(4, 0))
+
+        buttons = ttk.Frame(self)
+        buttons.pack(side=tk.TOP, fill=tk.X, padx=10, pady=(0, 10))
+        ttk.Button(buttons, text="Cancel", command=self.destroy).pack(side=tk.RIGHT)
+        ttk.Button(buttons, text="Search", command=self._search).pack(side=tk.RIGHT, padx=(0, 6))
+
+    def _search(self):
+        try:
+            budget = int(self.budget_var.get())
+            candidate_count = int(self.candidate_var.get())
+            if budget <= 0 or candidate_count <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Find Critical Nodes", "k and the number of candidates must be positive whole numbers",
+                                 parent=self)
+            return
+        options = {
+            "budget": budget,
+            "objective": self._objectives[self.objective_var.get()],
+            "candidate_count": candidate_count,
+        }
+        self.destroy()
+        self.on_search(options)
@@ -0,0 +1,79 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+from typing import Callable
+
+from src.gui.plot_export import DEFAULT_EXPORT_DPI, DEFAULT_TILE_PIXELS, EXPORT_FORMATS, TILED_FORMATS
+
+
+class ExportDialog(tk.Toplevel):
+    """
+    Asks for the export format, resolution and poster tiling of the plot.
+
+    on_export receives a dict with 'format', 'dpi' and 'tile_pixels' (None for
+    a single file) and chooses the file itself.
+    """
+
+    def __init__(self, master: tk.Misc, on_export: Callable[[dict], None]):
+        super().__init__(master)
+        self.title("Export Plot")
+        self.resizable(False, False)
+        self.transient(master)
+        self.on_export = on_export
+
+        # Display name -> format key
+        self._formats = {name: key for key, (name, _ext) in EXPORT_FORMATS.items()}
+
+        form = ttk.Frame(self)
+        form.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        ttk.Label(form, text="Format:").grid(row=0, column=0, sticky=tk.W, padx=(0, 6), pady=4)
+        self.format_var = tk.StringVar(value=EXPORT_FORMATS["png"][0])
+        format_combo = ttk.Combobox(form, textvariable=self.format_var, values=list(self._formats),
+                                    state="readonly", width=42)
+        format_combo.grid(row=0, column=1, sticky=tk.W, pady=4)
+        format_combo.bind("<<ComboboxSelected>>", lambda _event: self._update_tiling())
+
+        ttk.Label(form, text="Resolution (dpi):").grid(row=1, column=0, sticky=tk.W, padx=(0, 6), pady=4)
+        self.dpi_var = tk.StringVar(value=str(DEFAULT_EXPORT_DPI))
+        ttk.Entry(form, textvariable=self.dpi_var, width=8).grid(row=1, column=1, sticky=tk.W, pady=4)
+
+        self.tiled_var = tk.BooleanVar(value=False)
+        self.tiled_check = ttk.Checkbutton(form, text="Split into tiles (poster size)", variable=self.tiled_var,
+                                           command=self._update_tiling)
+        self.tiled_check.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=4)
+
+        ttk.Label(form, text="Tile size (px):").grid(row=3, column=0, sticky=tk.W, padx=(0, 6), pady=4)
+        self.tile_var = tk.StringVar(value=str(DEFAULT_TILE_PIXELS))
+        self.tile_entry = ttk.Entry(form, textvariable=self.tile_var, width=8)
+        self.tile_entry.grid(row=3, column=1, sticky=tk.W, pady=4)
+
+        buttons = ttk.Frame(self)
+        buttons.pack(side=tk.TOP, fill=tk.X, padx=10, pady=(0, 10))
+        ttk.Button(buttons, text="Cancel", command=self.destroy).pack(side=tk.RIGHT)
+        ttk.Button(buttons, text="Export...", command=self._export).pack(side=tk.RIGHT, padx=(0, 6))
+
+        self._update_tiling()
+
+    def _update_tiling(self):
+        """Tiling only applies to image formats"""
+        fmt = self._formats[self.format_var.get()]
+        if fmt in TILED_FORMATS:
+            self.tiled_check.state(["!disabled"])
+        else:
+            self.tiled_check.state(["disabled"])
+            self.tiled_var.set(False)
+        self.tile_entry.state(["!disabled"] if self.tiled_var.get() else ["disabled"])
+
+    def _export(self):
+        try:
+            dpi = int(self.dpi_var.get())
+            tile_pixels = int(self.tile_var.get()) if self.tiled_var.get() else None
+            if dpi <= 0 or (tile_pixels is not None and tile_pixels <= 0):
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Export Plot", "Resolution and tile size must be positive whole numbers",
+                                 parent=self)
+            return
+        options = {"format": self._formats[self.format_var.get()], "dpi": dpi, "tile_pixels": tile_pixels}
+        self.destroy()
+        self.on_export(options)
@@ -0,0 +1,116 @@
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox
+from typing import Callable
+
+
+class JobsDialog(tk.Toplevel):
+    """
+    Lists the jobs of the job store and reopens finished ones.
+
+    The list refreshes itself while the dialog is open, so queued jobs can be
+    followed until they finish.
+    """
+
+    REFRESH_MS = 2000
+
+    COLUMNS = (
+        ("id", "Job", 50),
+        ("status", "Status", 80),
+        ("size", "Nodes / Edges", 110),
+        ("removed", "Removed", 180),
+        ("centralities", "Centralities", 200),
+        ("created", "Created", 140),
+        ("source", "Source", 220),
+    )
+
+    def __init__(self, master: tk.Misc, store, on_reopen: Callable[[int], None], on_resume: Callable[[], None]):
+        super().__init__(master)
+        self.title("Jobs")
+        self.geometry("1000x420")
+        self.store = store
+        self.on_reopen = on_reopen
+        self.on_resume = on_resume
+        self._errors = {}
+
+        tree_frame = ttk.Frame(self)
+        tree_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=10, pady=(10, 0))
+        self.tree = ttk.Treeview(tree_frame, columns=[c[0] for c in self.COLUMNS], show="headings",
+                                 selectmode="browse")
+        for key, heading, width in self.COLUMNS:
+            self.tree.heading(key, text=heading)
+            self.tree.column(key, width=width, anchor=tk.W, stretch=key in ("removed", "source"))
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscroll=scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.bind("<Double-1>", lambda _event: self._reopen())
+        self.tree.bind("<<TreeviewSelect>>", lambda _event: self._show_error())
+
+        self.error_var = tk.StringVar(value="")
+        ttk.Label(self, textvariable=self.error_var, foreground="#a00000").pack(side=tk.TOP, fill=tk.X, padx=10)
+
+        buttons = ttk.Frame(self)
+        buttons.pack(side=tk.TOP, fill=tk.X, padx=10, pady=10)
+        ttk.Button(buttons, text="Reopen", command=self._reopen).pack(side=tk.LEFT, padx=(0, 6))
+        ttk.Button(buttons, text="Resume Interrupted", command=self._resume).pack(side=tk.LEFT, padx=(0, 6))
+        ttk.Button(buttons, text="Refresh", command=self.refresh).pack(side=tk.LEFT, padx=(0, 6))
+        ttk.Button(buttons, text="Close", command=self.destroy).pack(side=tk.RIGHT)
+
+        self.refresh()
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        self.after(self.REFRESH_MS, self._auto_refresh)
+
+    def _auto_refresh(self):
+        if not self.winfo_exists():
+            return
+        self.refresh()
+        self._schedule_refresh()
+
+    def refresh(self):
+        """Reload the job list, keeping the selection"""
+        selected = self.tree.selection()
+        try:
+            jobs = self.store.list_jobs(limit=500)
+        except Exception as e:
+            self.error_var.set(f"Failed to read jobs: {e}")
+            return
+
+        self.tree.delete(*self.tree.get_children())
+        self._errors = {}
+        from src.models.job_store import describe_removed
+
+        for job in jobs:
+            size = f"{job['nodes']} / {job['edges']}" if job["nodes"] is not None else ""
+            created = time.strftime("%Y-%m-%d %H:%M", time.localtime(job["created"]))
+            values = (job["id"], job["status"], size, describe_removed(job),
+                      ", ".join(job["centralities"]), created, job["source"])
+            self.tree.insert("", tk.END, iid=str(job["id"]), values=values)
+            if job["error"]:
+                self._errors[str(job["id"])] = job["error"]
+
+        if selected and self.tree.exists(selected[0]):
+            self.tree.selection_set(selected[0])
+        self._show_error()
+
+    def _show_error(self):
+        selected = self.tree.selection()
+        self.error_var.set(self._errors.get(selected[0], "") if selected else "")
+
+    def _reopen(self):
+        selected = self.tree.selection()
+        if not selected:
+            messagebox.showwarning("Jobs", "Select a job first.", parent=self)
+            return
+        status = self.tree.set(selected[0], "status")
+        if status != "done":
+            messagebox.showwarning("Jobs", f"Job {selected[0]} is {status}; only finished jobs can be reopened.",
+                                   parent=self)
+            return
+        self.on_reopen(int(selected[0]))
+
+    def _resume(self):
+        self.on_resume()
+        self.refresh()
@@ -1,25 +1,39 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
+import time
 import os
-import pandas as pd
 
 from src.gui.toolbar_view import ToolbarView
 from src.gui.table_view import TableView
 from src.gui.plot_view import PlotView
-from src.gui.plot_renderer import PlotRenderer
-from src.controllers.graph_analysis_controller import GraphAnalysisController
-from src.models.graph_loader import GraphLoader
-from src.models.centrality_service import CentralityAnalysisService
-from src.models.layout_cache import LayoutCache
-from src.models.centrality_service import centrality_functions
+from src.models.centrality_names import CENTRALITY_KEYS
+from src.models.graph_type_names import GRAPH_TYPE_KEYS
+
+# Modules holding networkx, scipy, pandas and matplotlib. They are imported on a
+# background thread after the window is painted, so they don't delay startup.
+BACKEND_MODULES = (
+    "src.models.graph_loader",
+    "src.models.centrality_service",
+    "src.models.layout_cache",
+    "src.gui.plot_renderer",
+    "src.controllers.graph_analysis_controller",
+    "matplotlib.backends.backend_tkagg",
+)
+
+# Milliseconds between checks for the results of a running analysis (one frame at 60 fps)
+ANALYSIS_POLL_MS = 16
+
+# Milliseconds between progress updates of a running critical node search
+SEARCH_POLL_MS = 200
 
 
 class GraphAnalysisGUI(tk.Tk):
     def __init__(self):
         """
         Initializes the GUI
-        Binds the controller, which handles UI events
+        Only the Tk widgets are built here; the controller and the models are bound
+        once the window has been painted (see _on_first_map)
         """
         # start Tkinter
         super().__init__()
@@ -34,19 +48,74 @@ class GraphAnalysisGUI(tk.Tk):
         self.pos_cache = {}
         self.last_save_dir = "."
         self.last_analysis_result = None  # Store the last analysis result
+        self._jobs_dialog = None
+        self.startup_complete = False  # Set once the backend and initial graph are ready
+
+        # import the heavy modules and build the initial random graph after first paint
+        self._backend_thread = None
+        self._backend_error = None
+        self.bind("<Map>", self._on_first_map, add="+")
+        self._analysis_started = None  # time.monotonic() at the start of the running analysis
+        self._search_started = None  # time.monotonic() at the start of the running critical node search
+        self._robustness_started = None  # time.monotonic() at the start of the robustness curve computation
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_first_map(self, event):
+        """Starts loading the backend once the main window is mapped"""
+        # <Map> on the root also fires for every child widget and on de-iconify
+        if event.widget is not self or self._backend_thread is not None:
+            return
+        self.status.set_status("Starting...")
+
+        self._backend_thread = threading.Thread(target=self._import_backend, daemon=True)
+        self._backend_thread.start()
+        self.after(20, self._poll_backend)
+
+    def _import_backend(self):
+        """Imports the heavy modules (runs on a background thread)"""
+        import importlib
+        try:
+            for module in BACKEND_MODULES:
+                importlib.import_module(module)
+        except Exception as e:
+            self._backend_error = e
+
+    def _poll_backend(self):
+        """Waits on the Tk thread until the backend modules are imported"""
+        if self._backend_thread.is_alive():
+            self.after(20, self._poll_backend)
+            return
+
+        if self._backend_error is not None:
+            self.status.set_status("Error")
+            messagebox.showerror("Error", f"Failed to start:\n{self._backend_error}")
+            return
 
-        # bind controller - maps gui events to handlers
+        self._bind_controller()
+        # Initialize with a random Watts-Strogatz graph
+        self._initialize_with_random_graph()
+        self.startup_complete = True
+
+    def _bind_controller(self):
+        """
+        Binds the controller - maps gui events to handlers
+        """
+        from src.controllers.graph_analysis_controller import GraphAnalysisController
+        from src.models.graph_loader import GraphLoader
+        from src.models.centrality_service import CentralityAnalysisService
+        from src.models.layout_cache import LayoutCache, default_layout_dir
+        from src.gui.plot_renderer import PlotRenderer
+
+        # One cache for the preview and the analysis plots, persisted across sessions
+        layout_cache = LayoutCache(default_layout_dir())
         self._controller = GraphAnalysisController(
             app=self,
             loader=GraphLoader(),
             analysis=CentralityAnalysisService(),
-            layout_cache=LayoutCache(),
-            renderer=PlotRenderer(LayoutCache()),
+            layout_cache=layout_cache,
+            renderer=PlotRenderer(layout_cache),
         )
 
-        # Initialize with a random Watts-Strogatz graph of size 100
-        self._initialize_with_random_graph()
-
     def _init_style(self):
         """
         Initializes the global styles of the widgets, sets colors and common configs
@@ -108,11 +177,15 @@ class GraphAnalysisGUI(tk.Tk):
         Initializes the visual elements of the GUI and binds UI events to handlers
         """
         # toolbar initialization, binds events
-        self.toolbar = ToolbarView(self, list(centrality_functions.keys()))
+        self.toolbar = ToolbarView(self, list(CENTRALITY_KEYS), list(GRAPH_TYPE_KEYS))
         self.toolbar.pack(side=tk.TOP, fill=tk.X)
         self.toolbar.browse_button.configure(command=self._browse_file)
         self.toolbar.generate_button.configure(command=self._generate_random_graph)
         self.toolbar.run_button.configure(command=self._on_run)
+        self.toolbar.queue_button.configure(command=self._on_queue_job)
+        self.toolbar.jobs_button.configure(command=self._on_show_jobs)
+        self.toolbar.critical_button.configure(command=self._on_find_critical_nodes)
+        self.toolbar.robustness_button.configure(command=self._on_robustness)
         self.toolbar.refresh_plot_button.configure(command=self._on_refresh_plot)
         self.toolbar.save_button.configure(command=self._on_save_as)
         self.toolbar.export_cys_button.configure(command=self._on_export_cys)
@@ -164,10 +237,10 @@ class GraphAnalysisGUI(tk.Tk):
         path = filedialog.askopenfilename(
             title="Select graph file",
             filetypes=[
-                ("Graph files", "*.tsv *.cys *.gexf"),
-                ("TSV files", "*.tsv"),
+                ("Graph files", "*.tsv *.cys *.gexf *.gz *.bz2 *.xz"),
+                ("TSV files", "*.tsv *.tsv.gz *.tsv.bz2 *.tsv.xz"),
                 ("Cytoscape files", "*.cys"),
-                ("GEXF files", "*.gexf"),
+                ("GEXF files", "*.gexf *.gexf.gz *.gexf.bz2 *.gexf.xz"),
                 ("All files", "*.*")
             ]
         )
@@ -176,9 +249,9 @@ class GraphAnalysisGUI(tk.Tk):
             # displays file name is toolbar
             self.toolbar.file_var.set(path)
 
-            # gets file extensior
-            _, ext = os.path.splitext(path)
-            ext = ext.lower()
+            # gets the graph format, ignoring compression suffixes like .gz
+            from src.models.graph_loader import GraphLoader
+            ext = GraphLoader().get_file_format(path)
 
             if ext == ".tsv" or ext == ".cys" or ext == ".gexf":
                 self._handle_file_upload(path)
@@ -193,7 +266,9 @@ class GraphAnalysisGUI(tk.Tk):
         for GEXF: reads graph from file and loads preview, disables column selections
         """
         try:
-            file_ext = os.path.splitext(path)[1].lower()
+            from src.models.graph_loader import GraphLoader
+            loader = GraphLoader()
+            file_ext = loader.get_file_format(path)
 
             if file_ext == '.cys':
                 self.toolbar.update_column_suggestions([])
@@ -201,7 +276,6 @@ class GraphAnalysisGUI(tk.Tk):
                 self.toolbar.hide_tsv_options()  # Hide TSV-specific options for CYS files
                 self.toolbar.set_loaded_file(path, file_ext)  # Track loaded CYS file
 
-                loader = GraphLoader()
                 networks = loader.get_available_networks(path)
 
                 if networks:
@@ -233,8 +307,7 @@ class GraphAnalysisGUI(tk.Tk):
                 self.toolbar.show_tsv_options()  # Show TSV-specific options for TSV files
                 self.toolbar.set_loaded_file(path, file_ext)  # Track loaded TSV file
 
-                df = pd.read_csv(path, sep='\t', nrows=0)
-                columns = df.columns.tolist()
+                columns = loader.read_columns(path)
                 self.toolbar.update_column_suggestions(columns)
                 self.toolbar.enable_column_selection()
                 self.status.set_status(f"Loaded {len(columns)} columns from file")
@@ -261,10 +334,6 @@ class GraphAnalysisGUI(tk.Tk):
             seed = int(time.time() * 1000) % 10000  # Use current time as seed
             graph = make_graph(params['graph_type'], params['size'], seed=seed)
 
-            # Clear any existing layout cache to force new positions
-            if hasattr(self, '_controller') and hasattr(self._controller, 'layout_cache'):
-                self._controller.layout_cache.clear()
-
             # Store the graph in the controller for preview generation
             if hasattr(self, '_controller'):
                 self._controller.set_random_graph(graph)
@@ -288,15 +357,185 @@ class GraphAnalysisGUI(tk.Tk):
             self.status.set_status("Error generating graph")
 
     def _on_run(self):
-        thread = threading.Thread(target=self._run_analysis_safe)
-        thread.daemon = True
-        messagebox.showerror("Error", f"Failed to generate random graph:\n{str(e)}")
-        self.status.set_status("Error generating graph")
+        if not hasattr(self, '_controller'):
+            self.status.set_status("Still starting, please wait...")
+            return
+        if self._controller.analysis_running:
+            self.status.set_status("An analysis is already running")
+            return
+        try:
+            self.status.set_status("Running analysis...")
+            self._controller.run_analysis()
+        except Exception as e:
+            self.status.set_status("Error")
+            messagebox.showerror("Error", str(e))
+            return
+        # The analysis runs on a background thread and worker processes; its results are applied here, on the Tk thread
+        self._analysis_started = time.monotonic()
+        self.after(ANALYSIS_POLL_MS, self._poll_analysis)
 
-    def _on_run(self):
-        thread = threading.Thread(target=self._run_analysis_safe)
-        thread.daemon = True
-        thread.start()
+    def _poll_analysis(self):
+        """Shows the analysis results once the workers are done, checking every ANALYSIS_POLL_MS"""
+        try:
+            done = self._controller.poll_analysis()
+        except Exception as e:
+            self.status.set_status("Error")
+            messagebox.showerror("Error", str(e))
+            return
+        if done:
+            self._on_analysis_done()
+            return
+        elapsed = int(time.monotonic() - self._analysis_started)
+        self.status.set_status(f"Running analysis... {elapsed} s")
+        self.after(ANALYSIS_POLL_MS, self._poll_analysis)
+
+    def _on_analysis_done(self):
+        self.status.set_status("Done")
+        self._on_refresh_plot()
+        # Auto-collapse the configuration section after successful analysis
+        self.toolbar.collapse()
+
+    def _on_find_critical_nodes(self):
+        """Ask for the search options and start a critical node search, or offer to stop the running one"""
+        if not hasattr(self, '_controller'):
+            self.status.set_status("Still starting, please wait...")
+            return
+        if self._controller.search_running:
+            if messagebox.askyesno("Find Critical Nodes",
+                                   "Stop the running search and show the nodes selected so far?"):
+                self._controller.cancel_critical_nodes()
+            return
+        from src.gui.critical_nodes_dialog import CriticalNodesDialog
+        CriticalNodesDialog(self, self._start_critical_node_search)
+
+    def _start_critical_node_search(self, options: dict):
+        try:
+            self._controller.find_critical_nodes(options["budget"], options["objective"],
+                                                 options["candidate_count"])
+        except Exception as e:
+            self.status.set_status("Error")
+            messagebox.showerror("Find Critical Nodes", str(e))
+            return
+        self._search_started = time.monotonic()
+        self.after(SEARCH_POLL_MS, self._poll_critical_nodes)
+
+    def _poll_critical_nodes(self):
+        """Selects the found nodes and analyzes their removal once the search is done"""
+        try:
+            found = self._controller.poll_critical_nodes()
+        except Exception as e:
+            self.status.set_status("Error")
+            messagebox.showerror("Find Critical Nodes", str(e))
+            return
+        if found is None:
+            selected, budget, evaluations = self._controller.critical_nodes_progress
+            elapsed = int(time.monotonic() - self._search_started)
+            self.status.set_status(f"Finding critical nodes... {selected}/{budget} selected, "
+                                   f"{evaluations} evaluations, {elapsed} s")
+            self.after(SEARCH_POLL_MS, self._poll_critical_nodes)
+            return
+
+        labels, result = found
+        if not labels:
+            self.status.set_status(f"Critical node search stopped: {result['stopped']}")
+            return
+        self.toolbar.set_selected_nodes(labels)
+        if result["stopped"]:
+            messagebox.showinfo("Find Critical Nodes",
+                                f"Selected {len(labels)} node(s): {result['stopped']}")
+        # Show the impact of removing the found nodes
+        self._on_run()
+
+    def _on_robustness(self):
+        """Ask for the removal order and compute a robustness curve of the current graph"""
+        if not hasattr(self, '_controller'):
+            self.status.set_status("Still starting, please wait...")
+            return
+        if self._controller.robustness_running:
+            self.status.set_status("A robustness curve is already being computed")
+            return
+        from src.gui.robustness_dialog import RobustnessDialog
+        RobustnessDialog(self, self._start_robustness, initial_dir=self.last_save_dir)
+
+    def _start_robustness(self, options: dict):
+        try:
+            self.status.set_status("Computing robustness curve...")
+            self._controller.run_robustness(options["strategy"], options["ranking_path"],
+                                            options["diameter_checkpoints"])
+        except Exception as e:
+            self.status.set_status("Error")
+            messagebox.showerror("Robustness Curve", str(e))
+            return
+        self._robustness_started = time.monotonic()
+        self.after(ANALYSIS_POLL_MS, self._poll_robustness)
+
+    def _poll_robustness(self):
+        """Shows the robustness curve and table once the worker is done"""
+        try:
+            done = self._controller.poll_robustness()
+        except Exception as e:
+            self.status.set_status("Error")
+            messagebox.showerror("Robustness Curve", str(e))
+            return
+        if done:
+            self.status.set_status("Robustness curve done")
+            self.toolbar.collapse()
+            return
+        elapsed = int(time.monotonic() - self._robustness_started)
+        self.status.set_status(f"Computing robustness curve... {elapsed} s")
+        self.after(ANALYSIS_POLL_MS, self._poll_robustness)
+
+    def _on_close(self):
+        """Stops the analysis workers before closing the window"""
+        if hasattr(self, '_controller'):
+            self._controller.shutdown()
+        self.destroy()
+
+    def _on_queue_job(self):
+        """Queue the current analysis as a background job that survives closing the GUI"""
+        if not hasattr(self, '_controller'):
+            self.status.set_status("Still starting, please wait...")
+            return
+        try:
+            job = self._controller.queue_analysis()
+            if job["status"] == "done":
+                self.status.set_status(f"Job {job['id']} already finished - reopen it from Jobs...")
+            else:
+                self.status.set_status(f"Job {job['id']} {job['status']}")
+        except Exception as e:
+            self.status.set_status("Error")
+            messagebox.showerror("Queue Job", str(e))
+
+    def _on_show_jobs(self):
+        """Open the jobs dialog to follow queued jobs and reopen finished ones"""
+        if not hasattr(self, '_controller'):
+            self.status.set_status("Still starting, please wait...")
+            return
+        if self._jobs_dialog is not None and self._jobs_dialog.winfo_exists():
+            self._jobs_dialog.lift()
+            return
+        try:
+            from src.gui.jobs_dialog import JobsDialog
+            self._jobs_dialog = JobsDialog(self, self._controller.job_store,
+                                           on_reopen=self._on_reopen_job, on_resume=self._on_resume_jobs)
+        except Exception as e:
+            messagebox.showerror("Jobs", str(e))
+
+    def _on_reopen_job(self, job_id):
+        try:
+            self._controller.open_job(job_id)
+            self._on_refresh_plot()
+            self.toolbar.collapse()
+            self.status.set_status(f"Reopened job {job_id}")
+        except Exception as e:
+            messagebox.showerror("Jobs", str(e))
+
+    def _on_resume_jobs(self):
+        try:
+            count = self._controller.resume_jobs()
+            self.status.set_status(f"Resumed {count} interrupted job(s)")
+        except Exception as e:
+            messagebox.showerror("Jobs", str(e))
 
     def _on_refresh_plot(self):
         """Refresh the plot with current options without re-running analysis"""
@@ -313,22 +552,38 @@ class GraphAnalysisGUI(tk.Tk):
             self.status.set_status("Error refreshing plot")
 
     def _on_save_as(self):
+        """Ask for the export options, then the file name, and export the plot"""
+        from src.gui.export_dialog import ExportDialog
+        ExportDialog(self, self._export_plot)
+
+    def _export_plot(self, options: dict):
+        from src.gui.plot_export import EXPORT_FORMATS, export_figure, export_tiles
+
+        fmt = options["format"]
+        name, ext = EXPORT_FORMATS[fmt]
         try:
             path = filedialog.asksaveasfilename(
-                title="Save SVG",
-                defaultextension=".svg",
-                filetypes=[("SVG", "*.svg")],
+                title="Export Plot",
+                defaultextension=ext,
+                filetypes=[(name, "*" + ext)],
                 initialdir=self.last_save_dir,
-                initialfile="Read from TSV.svg",
+                initialfile="graph" + ext,
             )
             if not path:
                 return
 
             self.last_save_dir = os.path.dirname(path)
-            self.plot.figure.savefig(path, dpi=300, bbox_inches='tight', facecolor='white', format='svg')
-            self.status.set_status(f"Saved: {path}")
+            self.status.set_status("Exporting plot...")
+            self.update_idletasks()
+            if options["tile_pixels"]:
+                tiles = export_tiles(self.plot.figure, path, fmt, options["dpi"], options["tile_pixels"])
+                self.status.set_status(f"Saved {len(tiles)} tiles: {os.path.splitext(path)[0]}_r*_c*{ext}")
+            else:
+                export_figure(self.plot.figure, path, fmt, options["dpi"])
+                self.status.set_status(f"Saved: {path}")
         except Exception as e:
-            messagebox.showerror("Save SVG", str(e))
+            messagebox.showerror("Export Plot", str(e))
+            self.status.set_status("Error exporting plot")
 
     def _on_export_cys(self):
         """Export the current graph with analysis results as a CYS file"""
@@ -371,7 +626,7 @@ class GraphAnalysisGUI(tk.Tk):
 
             # Get the current graph from the controller
             # We need to load the original graph again to get the full structure
-            loader = GraphLoader()
+            loader = self._controller.loader
             original_file_path = self.toolbar.get_loaded_file_path()
             network_name = self.toolbar.get_selected_network()
 
@@ -410,21 +665,6 @@ class GraphAnalysisGUI(tk.Tk):
         self.toolbar.expand()
         self.status.set_status("Cleared")
 
-    def _run_analysis_safe(self):
-        try:
-            self.status.set_status("Running analysis...")
-            self._run_analysis()
-            self.status.set_status("Done")
-            self._on_refresh_plot()
-            # Auto-collapse the configuration section after successful analysis
-            self.toolbar.collapse()
-        except Exception as e:
-            self.status.set_status("Error")
-            messagebox.showerror("Error", str(e))
-
-    def _run_analysis(self):
-        self._controller.run_analysis()
-
     def _render_plot(self):
         """Render the plot with current plot options"""
         if self.last_analysis_result is None:
@@ -1,8 +1,20 @@
 import tkinter as tk
 from tkinter import ttk
 
+from src.gui.virtual_tree import VirtualTreeview
+
+# Milliseconds without typing before the search runs
+SEARCH_DEBOUNCE_MS = 150
+
+
 class NodeSelectorView(ttk.Frame):
-    """A widget for selecting multiple nodes from a list with search functionality"""
+    """
+    A widget for selecting multiple nodes from a list with search functionality
+
+    Searching uses a LabelSearchIndex, runs once typing pauses for SEARCH_DEBOUNCE_MS,
+    and only the matches in view are inserted (see VirtualTreeview). Selected nodes
+    stay selected when the search hides them.
+    """
 
     def __init__(self, master: tk.Misc):
         super().__init__(master)
@@ -17,67 +29,57 @@ class NodeSelectorView(ttk.Frame):
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=30)
         search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
-        # Listbox with scrollbar
-        listbox_frame = ttk.Frame(self)
-        listbox_frame.pack(fill=tk.BOTH, expand=True)
-
-        scrollbar = ttk.Scrollbar(listbox_frame, orient=tk.VERTICAL)
-        self.listbox = tk.Listbox(
-            listbox_frame,
-            selectmode=tk.EXTENDED,
-            yscrollcommand=scrollbar.set,
-            height=8,
-            exportselection=False
-        )
-        scrollbar.config(command=self.listbox.yview)
-
-        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # List of matching nodes with scrollbar
+        self.view = VirtualTreeview(self, (), show="tree", selectmode="extended", height=8)
+        self.view.pack(fill=tk.BOTH, expand=True)
 
-        # Store all nodes for filtering
-        self._all_nodes = []
+        # LabelSearchIndex over all nodes (None without nodes), and the positions of the current matches
+        self._index = None
+        self._matches = []
+        self._pending_search = None  # after() id of the debounced search
 
     def set_nodes(self, nodes: list):
-        """Set the available nodes in the listbox"""
+        """Set the available nodes in the list, keeping selected nodes that are still available"""
+        # Imported here, so numpy is not needed to build the window
+        from src.models.label_search import LabelSearchIndex
+
+        selected = self.get_selected_nodes()
         # Convert all nodes to strings to handle both string and integer node IDs
-        self._all_nodes = sorted([str(node) for node in nodes])
+        self._index = LabelSearchIndex(sorted(str(node) for node in nodes))
         self._update_listbox()
+        self.set_selected_nodes(selected)
 
     def get_selected_nodes(self) -> list[str]:
-        """Get the currently selected nodes"""
-        selected_indices = self.listbox.curselection()
-        return [self.listbox.get(i) for i in selected_indices]
+        """Get the currently selected nodes, including those hidden by the search"""
+        if self._index is None:
+            return []
+        labels = self._index.labels
+        return [labels[i] for i in sorted(self.view.selected_keys())]
 
     def set_selected_nodes(self, nodes: list):
         """Set which nodes should be selected"""
+        if self._index is None:
+            return
         # Convert nodes to strings for comparison
-        nodes_str = [str(node) for node in nodes]
-        self.listbox.selection_clear(0, tk.END)
-        for i in range(self.listbox.size()):
-            if self.listbox.get(i) in nodes_str:
-                self.listbox.selection_set(i)
+        self.view.select_keys(self._index.positions(str(node) for node in nodes))
 
     def _update_listbox(self):
-        """Update the listbox based on current filter"""
-        # Store current selection
-        current_selection = self.get_selected_nodes()
-
-        # Clear and repopulate
-        self.listbox.delete(0, tk.END)
-
-        search_term = self.search_var.get().lower()
-        filtered_nodes = [n for n in self._all_nodes if search_term in str(n).lower()]
+        """Show the nodes matching the current search"""
+        self._pending_search = None
+        self._matches = self._index.search(self.search_var.get()) if self._index is not None else []
+        self.view.set_rows(len(self._matches), self._fetch_rows, keep_selection=True)
 
-        for node in filtered_nodes:
-            self.listbox.insert(tk.END, node)
-
-        # Restore selection
-        self.set_selected_nodes(current_selection)
+    def _fetch_rows(self, start: int, stop: int) -> list:
+        labels = self._index.labels
+        return [(int(i), labels[i], ()) for i in self._matches[start:stop]]
 
     def _on_search(self, *_args):
-        """Called when search text changes"""
-        self._update_listbox()
+        """Called when search text changes; searches once typing pauses"""
+        if self._pending_search is not None:
+            self.after_cancel(self._pending_search)
+        self._pending_search = self.after(SEARCH_DEBOUNCE_MS, self._update_listbox)
 
     def clear(self):
-        self._all_nodes = []
-        self._update_listbox()
\ No newline at end of file
+        self._index = None
+        self._update_listbox()
+        self.view.select_keys(())
@@ -0,0 +1,71 @@
+"""
+Saving the plot figure as an image, a vector file, or a set of poster tiles.
+
+Dense edge layers are rasterized by PlotRenderer, so SVG and PDF exports hold
+one embedded image for the edges and vector paths for nodes and labels.
+"""
+import math
+import os
+
+# Format key -> (display name, file extension)
+EXPORT_FORMATS = {
+    "png": ("PNG image", ".png"),
+    "tiff": ("TIFF image", ".tiff"),
+    "svg": ("SVG (vector nodes, rasterized dense edges)", ".svg"),
+    "pdf": ("PDF (vector nodes, rasterized dense edges)", ".pdf"),
+}
+
+# Formats that can be split into tiles
+TILED_FORMATS = ("png", "tiff")
+
+DEFAULT_EXPORT_DPI = 300
+
+# Width and height in pixels of poster tiles (Agg renders at most 2^16 pixels per side)
+DEFAULT_TILE_PIXELS = 4096
+
+
+def export_figure(figure, path: str, fmt: str, dpi: int = DEFAULT_EXPORT_DPI) -> None:
+    """Save the figure in one file, cropped to its content"""
+    figure.savefig(path, format=fmt, dpi=dpi, bbox_inches="tight", facecolor="white", **_format_options(fmt))
+
+
+def export_tiles(figure, path: str, fmt: str, dpi: int = DEFAULT_EXPORT_DPI,
+                 tile_pixels: int = DEFAULT_TILE_PIXELS) -> list[str]:
+    """
+    Save the figure at poster resolution as a grid of tiles.
+
+    Each tile is rendered on its own, so memory use is bounded by the tile size
+    instead of the full image. Tiles are named <name>_r<row>_c<column><ext>,
+    numbered from the top left.
+
+    Returns:
+        The paths of the written tiles
+    """
+    from matplotlib.transforms import Bbox
+
+    width, height = figure.get_size_inches()
+    tile_inches = tile_pixels / dpi
+    columns = max(1, math.ceil(width / tile_inches))
+    rows = max(1, math.ceil(height / tile_inches))
+
+    stem, ext = os.path.splitext(path)
+    paths = []
+    for row in range(rows):
+        # Figure coordinates start at the bottom; tiles are numbered from the top
+        top = height - row * tile_inches
+        bottom = max(0.0, top - tile_inches)
+        for column in range(columns):
+            left = column * tile_inches
+            right = min(width, left + tile_inches)
+            tile_path = f"{stem}_r{row + 1}_c{column + 1}{ext}"
+            figure.savefig(tile_path, format=fmt, dpi=dpi, facecolor="white",
+                           bbox_inches=Bbox.from_extents(left, bottom, right, top), **_format_options(fmt))
+            paths.append(tile_path)
+    return paths
+
+
+def _format_options(fmt: str) -> dict:
+    if fmt == "tiff":
+        # Lossless compression; uncompressed poster TIFFs are several hundred MB
+        return {"pil_kwargs": {"compression": "tiff_lzw"}}
+    return {}
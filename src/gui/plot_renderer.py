@@ -1,19 +1,127 @@
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
 from matplotlib.figure import Figure
-from typing import Any
+from typing import Any, Optional
 from matplotlib import cm, colors
+from matplotlib.artist import Artist
+from matplotlib.collections import LineCollection
+from matplotlib.text import Text
 import networkx as nx
 
+from src.models.graph_fingerprint import graph_cache_key
+from src.models.node_index import node_labels
+
+_LIGHTBLUE = colors.to_rgba("lightblue")
+_YELLOW = colors.to_rgba("yellow")
+_LIGHTGREY = colors.to_rgba("lightgrey")
+_ORANGE = colors.to_rgba("orange")
+_HIDDEN = (0.0, 0.0, 0.0, 0.0)
+
+# Graphs with more nodes are drawn at reduced detail (see _detail_budget)
+LOD_NODE_THRESHOLD = 10_000
+
+# Figure pixels per individually drawn node and per drawn edge at reduced detail
+LOD_PIXELS_PER_NODE = 400
+LOD_PIXELS_PER_EDGE = 50
+
+# Number of labeled nodes at reduced detail, besides the removed nodes
+LOD_LABEL_COUNT = 25
+
+# Size in pixels of the density cells the other nodes are aggregated into
+LOD_CELL_PIXELS = 6
+
+# Opacity of the densest cell
+LOD_DENSITY_ALPHA = 0.6
+
+# Edge layers with more segments are rasterized in vector exports (SVG, PDF)
+RASTERIZE_EDGE_THRESHOLD = 5000
+
+
+class _LabelLayer(Artist):
+    """Node labels drawn as one artist, so showing or hiding them is a single call"""
+
+    zorder = 3
+
+    def __init__(self, texts: list[Text]):
+        super().__init__()
+        self.texts = texts
+
+    def draw(self, renderer):
+        if not self.get_visible():
+            return
+        for text in self.texts:
+            text.draw(renderer)
+        self.stale = False
+
+
+class _Scene:
+    """
+    Artists of one graph drawn with one layout.
+
+    Nodes are a single PathCollection and edges a single LineCollection, built
+    from position and edge arrays. Option changes (node names, edge thickness,
+    removed edges, a new impact) restyle these artists in place.
+    """
+
+    def __init__(self, figure: Figure, ax, G, layout_type: str):
+        self.figure = figure
+        self.ax = ax
+        self.graph = G
+        self.layout_type = layout_type
+        self.nodes = list(G.nodes())
+        self.xy = None
+        self.edge_u = None
+        self.edge_v = None
+        self.weights = None
+        self.segments = None
+        self.node_collection = None
+        self.edge_collection = None
+        self.highlight_collection = None
+        self.arrows = None
+        self.labels = None
+        self.removed = None
+        self.colorbar = None
+        self.thickness = (0.4, 3.0)
+        self.weight_range = (1.0, 1.0)
+        # Reduced detail only: budgets, all edges, node degrees, sampled edges,
+        # drawn and labeled node positions, density image and the note saying what is shown
+        self.detail = None
+        self.all_edges = None
+        self.degree = None
+        self.sample = None
+        self.drawn = None
+        self.labeled = None
+        self.density = None
+        self.note = None
+        # Inputs of the styles currently applied, so unchanged ones are not reapplied
+        self.result = None
+        self.by_weight = None
+        self.highlight = None
+
+    def matches(self, figure: Figure, G, layout_type: str) -> bool:
+        # The figure may have been cleared by someone else since the scene was built
+        return (self.figure is figure and self.graph is G and self.layout_type == layout_type
+                and self.ax in figure.axes)
+
+
 class PlotRenderer:
     def __init__(self, layout_cache):
         self.layout_cache = layout_cache
+        self._scene = None
+        # (graph, layout type, positions) of the last layout not derived from another
+        self._base = None
 
     def _calculate_layout(self, G, layout_type: str, size: int):
         if layout_type == "Circular":
             # Use circular layout with better node positioning
             pos = nx.circular_layout(G, scale=1.2)
 
+        elif layout_type == "Multilevel":
+            # Scales to large graphs; stops refining after LAYOUT_TIME_BUDGET seconds.
+            # Imported on first use, so scipy's sparse solvers don't slow down startup
+            from src.models.multilevel_layout import LAYOUT_TIME_BUDGET, multilevel_layout
+            pos = multilevel_layout(G, seed=42, time_budget=LAYOUT_TIME_BUDGET)
+
         else:  # Default to Spring layout
             if size >= 500:
                 pos = nx.spring_layout(G, seed=42, k=1 / np.sqrt(size))
@@ -22,10 +130,45 @@ class PlotRenderer:
 
         return pos
 
+    def _layout(self, G, layout_type: str) -> dict:
+        """
+        Positions of the graph's nodes: cached, derived from the base layout, or computed.
+
+        The base layout is the last one computed in full or found in the cache.
+        Graphs that mostly match it by label (the job store's copy of a previewed
+        graph, a filtered version of it, ...) keep its positions and only relax
+        the nodes near the differences, so nodes don't jump between the preview
+        and the results. Circular layouts are cheap and always computed.
+        """
+        # The layout parameters only depend on the layout type and the graph, so the
+        # preview and the analysis results of the same graph share one layout
+        key = (graph_cache_key(G), layout_type)
+        pos = self.layout_cache.get(key)
+        if pos is not None:
+            self._base = (G, layout_type, pos)
+            return pos
+
+        base = self._base
+        if base is not None and base[1] == layout_type and layout_type != "Circular":
+            from src.models.multilevel_layout import incremental_layout
+            pos = incremental_layout(G, base[0], base[2])
+            if pos is not None:
+                self.layout_cache.set(key, pos)
+                return pos
+
+        pos = self._calculate_layout(G, layout_type, G.number_of_nodes())
+        self.layout_cache.set(key, pos)
+        self._base = (G, layout_type, pos)
+        return pos
+
     def render(self, figure: Figure, result: dict[str, Any], plot_options: dict[str, bool] = None) -> None:
         """
         Render the graph plot with configurable options.
 
+        The artists are built once per graph, layout type and figure; rendering the
+        same graph again (e.g. after toggling an option) only restyles them, so the
+        caller's draw_idle redraws without rebuilding anything.
+
         Args:
             figure: The matplotlib figure to render on
             result: Dictionary containing graph, impact, removed_nodes, etc.
@@ -33,7 +176,7 @@ class PlotRenderer:
                 - show_node_names: Whether to display node labels
                 - edge_thickness_by_weight: Whether edge thickness reflects weight
                 - mark_removed_edges: Whether to highlight edges connected to removed nodes
-                - layout_type: Layout algorithm to use ("Spring", "Circular")
+                - layout_type: Layout algorithm to use ("Spring", "Circular", "Multilevel")
         """
         # Default plot options
         if plot_options is None:
@@ -45,8 +188,59 @@ class PlotRenderer:
             }
 
         G = result["graph"]
-        impact = result["impact"]
-        removed_nodes = result["removed_nodes"]
+        layout_type = plot_options.get("layout_type", "Spring")
+
+        scene = self._scene
+        if scene is None or not scene.matches(figure, G, layout_type):
+            scene = self._scene = self._build_scene(figure, result, layout_type)
+        self._restyle(scene, result, plot_options)
+
+    def render_robustness(self, figure: Figure, curve, title: str) -> None:
+        """
+        Plot a robustness curve (see src.models.robustness.robustness_curve).
+
+        The largest component (as a fraction of the nodes) and the number of
+        components are drawn against the fraction of removed nodes; a second panel
+        shows the diameter at the sampled checkpoints, if any. The graph scene is
+        discarded and rebuilt by the next render.
+        """
+        figure.clf()
+        self._scene = None
+        diameter = curve.get("Largest Component Diameter")
+        if diameter is not None:
+            ax, diameter_ax = figure.subplots(2, 1, sharex=True, gridspec_kw={"height_ratios": (3, 1)})
+        else:
+            ax, diameter_ax = figure.add_subplot(111), None
+
+        x = curve["Fraction Removed"].to_numpy()
+        ax.plot(x, curve["Largest Component Fraction"].to_numpy(), color="tab:blue", linewidth=1.5,
+                label="Largest component")
+        ax.set_ylabel("Largest component (fraction of nodes)")
+        ax.set_ylim(0, 1.02)
+        ax.grid(True, alpha=0.3)
+        ax.set_title(title, fontsize=11)
+
+        components_ax = ax.twinx()
+        components_ax.plot(x, curve["Components"].to_numpy(), color="tab:orange", linewidth=1.2, linestyle="--",
+                           label="Components")
+        components_ax.set_ylabel("Number of components")
+        handles = ax.get_legend_handles_labels()[0] + components_ax.get_legend_handles_labels()[0]
+        ax.legend(handles=handles, loc="center right", fontsize=9)
+
+        if diameter_ax is not None:
+            sampled = ~np.isnan(diameter.to_numpy(dtype=float))
+            diameter_ax.plot(x[sampled], diameter.to_numpy(dtype=float)[sampled], color="tab:green", marker="o",
+                             markersize=4, linewidth=1.2)
+            diameter_ax.set_ylabel("Diameter")
+            diameter_ax.grid(True, alpha=0.3)
+            diameter_ax.set_xlabel("Fraction of nodes removed")
+        else:
+            ax.set_xlabel("Fraction of nodes removed")
+        figure.tight_layout()
+
+    def _build_scene(self, figure: Figure, result: dict[str, Any], layout_type: str) -> _Scene:
+        """Clear the figure and draw the nodes and edges of the graph with default styles"""
+        G = result["graph"]
         size = G.number_of_nodes()
 
         figure.clf()
@@ -56,136 +250,75 @@ class PlotRenderer:
         # Remove axis borders and ticks to maximize graph area
         ax.set_xticks([])
         ax.set_yticks([])
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['bottom'].set_visible(False)
-        ax.spines['left'].set_visible(False)  # Also hide the left spine
-
-        # Get layout type from plot options
-        layout_type = plot_options.get("layout_type", "Spring")
+        for spine in ax.spines.values():
+            spine.set_visible(False)
 
-        # Create cache key that includes layout type and graph structure
-        # Use a hash of the graph structure to ensure different graphs get different layouts
-        graph_hash = hash(tuple(sorted(G.edges())))
-        key = (result["gtype"], size, layout_type, graph_hash)
+        scene = _Scene(figure, ax, G, layout_type)
+        scene.detail = _detail_budget(G, figure)
 
-        pos = self.layout_cache.get(key)
-        if pos is None:
-            pos = self._calculate_layout(G, layout_type, size)
-            self.layout_cache.set(key, pos)
-
-        max_abs = max((abs(v) for v in impact.values()), default=0.0)
-        if max_abs == 0:
-            norm = colors.TwoSlopeNorm(vmin=-1.0, vcenter=0.0, vmax=1.0)
-        else:
-            norm = colors.TwoSlopeNorm(vmin=-max_abs, vcenter=0.0, vmax=max_abs)
-
-        cmap = plt.get_cmap("bwr")
-        node_colors = []
-
-        # Check if this is a preview (no impact data)
-        has_impact_data = impact and any(impact.values())
-
-        for n in G.nodes():
-            if n in removed_nodes:
-                node_colors.append("yellow")
-            elif has_impact_data:
-                # Use impact-based coloring for analysis
-                node_colors.append(cmap(norm(impact.get(n, 0.0))))
-            else:
-                # Use neutral color for preview
-                node_colors.append("lightblue")
+        pos = self._layout(G, layout_type)
 
         if size >= 500:
             node_size = 10
-            min_thick, max_thick = 0.1, 0.8
+            scene.thickness = (0.1, 0.8)
         elif size >= 100:
             node_size = 25
-            min_thick, max_thick = 0.2, 1.2
+            scene.thickness = (0.2, 1.2)
         else:
             node_size = 200
-            min_thick, max_thick = 0.4, 3.0
-
-        edges_all = list(G.edges())
-        weights_all = [G[u][v].get("weight", 1.0) for u, v in edges_all]
-
-        # Calculate edge widths based on plot options
-        if plot_options.get("edge_thickness_by_weight", True):
-            if len(weights_all) > 0:
-                w = np.array(weights_all, dtype=float)
-                w_min = float(np.min(w))
-                w_max = float(np.max(w))
-                if w_max == w_min:
-                    widths_all = [0.5 * (min_thick + max_thick)] * len(weights_all)
-                else:
-                    widths_all = list(min_thick + (w - w_min) / (w_max - w_min) * (max_thick - min_thick))
-            else:
-                widths_all = []
+            scene.thickness = (0.4, 3.0)
+
+        scene.xy = np.array([pos[n] for n in scene.nodes], dtype=float).reshape(-1, 2)
+        position = {n: i for i, n in enumerate(scene.nodes)}
+        edges = list(G.edges(data="weight", default=1.0))
+        scene.edge_u = np.fromiter((position[u] for u, _, _ in edges), dtype=np.intp, count=len(edges))
+        scene.edge_v = np.fromiter((position[v] for _, v, _ in edges), dtype=np.intp, count=len(edges))
+        scene.weights = np.fromiter((w for _, _, w in edges), dtype=float, count=len(edges))
+        if len(edges):
+            scene.weight_range = (float(scene.weights.min()), float(scene.weights.max()))
+
+        if scene.detail is not None:
+            # Only a sample of the edges and the most important nodes are drawn; which
+            # nodes are important depends on the impact, so _restyle_nodes selects them again
+            scene.all_edges = (scene.edge_u, scene.edge_v, scene.weights)
+            scene.degree = (np.bincount(scene.edge_u, minlength=size)
+                            + np.bincount(scene.edge_v, minlength=size))
+            scene.sample = _sample_edges(scene.weights, scene.detail["edges"])
+            scene.note = ax.text(0.01, 0.01, "", transform=ax.transAxes, fontsize=7, color="#555", zorder=4)
+            self._select_detail(scene, np.zeros(size), np.zeros(size, dtype=bool))
         else:
-            # Use uniform edge width
-            uniform_width = 0.5 * (min_thick + max_thick)
-            widths_all = [uniform_width] * len(edges_all)
-
-        # Separate edges based on whether they connect to removed nodes
-        removed_set = set(removed_nodes)
-        highlight_edges = []
-        highlight_widths = []
-        base_edges = []
-        base_widths = []
-
-        if plot_options.get("mark_removed_edges", True):
-            # Separate edges connected to removed nodes
-            for (e, w) in zip(edges_all, widths_all):
-                u, v = e
-                if u in removed_set or v in removed_set:
-                    highlight_edges.append((u, v))
-                    highlight_widths.append(w)
-                else:
-                    base_edges.append((u, v))
-                    base_widths.append(w)
-        else:
-            # Treat all edges the same
-            base_edges = edges_all
-            base_widths = widths_all
-
-        nx.draw_networkx_nodes(
-            G,
-            pos,
-            node_color=node_colors,
-            node_size=node_size,
-            linewidths=0.8,
-            edgecolors="black",
-            ax=ax,
-        )
-
-        if base_edges:
-            nx.draw_networkx_edges(
-                G,
-                pos,
-                edgelist=base_edges,
-                edge_color="lightgrey",
-                width=base_widths,
-                ax=ax,
-            )
-
-        if highlight_edges:
-            nx.draw_networkx_edges(
-                G,
-                pos,
-                edgelist=highlight_edges,
-                edge_color="orange",
-                style="dashed",
-                width=highlight_widths,
-                ax=ax,
-            )
-
-        # Draw node labels based on plot options
-        if plot_options.get("show_node_names", True):
-            nx.draw_networkx_labels(G, pos, ax=ax, font_size=8, font_color="#111")
-
-        # Set a smaller title
-        ax.set_title(result["label"], fontsize=10)
-
+            scene.drawn = slice(None)
+            scene.segments = np.stack([scene.xy[scene.edge_u], scene.xy[scene.edge_v]], axis=1)
+
+        # Same z-order as networkx: edges below nodes below labels
+        scene.edge_collection = LineCollection(scene.segments, colors=[_LIGHTGREY], zorder=1)
+        ax.add_collection(scene.edge_collection)
+        # Dense edges are drawn by Agg into one image when saving as SVG or PDF, while nodes
+        # and labels stay vector; thousands of path elements make files huge and slow to open
+        rasterize = len(scene.segments) > RASTERIZE_EDGE_THRESHOLD
+        scene.edge_collection.set_rasterized(rasterize)
+
+        # Arrows are left out at reduced detail, where the drawn edges change with each result
+        if G.is_directed() and len(edges) and scene.detail is None:
+            # One arrow per edge, on the segment's last part so the head stays outside the target node
+            direction = scene.xy[scene.edge_v] - scene.xy[scene.edge_u]
+            tail = scene.xy[scene.edge_u] + 0.6 * direction
+            head = 0.25 * direction
+            scene.arrows = ax.quiver(tail[:, 0], tail[:, 1], head[:, 0], head[:, 1], color=[_LIGHTGREY],
+                                     angles="xy", scale_units="xy", scale=1, units="dots", width=1,
+                                     headwidth=6, headlength=8, headaxislength=7, zorder=1)
+            scene.arrows.set_rasterized(rasterize)
+
+        drawn_xy = scene.xy[scene.drawn]
+        scene.node_collection = ax.scatter(drawn_xy[:, 0], drawn_xy[:, 1], s=node_size, c=[_LIGHTBLUE],
+                                           linewidths=0.8, edgecolors="black", zorder=2)
+
+        # Pad the data limits by 5% like networkx does, so border nodes are not cut off
+        if len(scene.xy):
+            low, high = scene.xy.min(axis=0), scene.xy.max(axis=0)
+            pad = 0.05 * (high - low)
+            ax.update_datalim([low - pad, high + pad])
+        ax.autoscale_view()
         # Remove margins and make the graph fill the whole area
         ax.set_aspect('equal')
         ax.margins(0)
@@ -195,13 +328,249 @@ class PlotRenderer:
 
         # Adjust subplot parameters to minimize whitespace with a bit more top margin for title
         figure.subplots_adjust(left=0.02, right=0.98, top=0.90, bottom=0.02)
+        return scene
+
+    def _restyle(self, scene: _Scene, result: dict[str, Any], plot_options: dict[str, bool]) -> None:
+        """Apply impact colors, edge widths, highlighting, labels and the colorbar to the scene"""
+        new_result = scene.result is not result
+        scene.result = result
+        if new_result:
+            self._restyle_nodes(scene, result)
+
+        # Calculate edge widths based on plot options
+        by_weight = plot_options.get("edge_thickness_by_weight", True)
+        if by_weight != scene.by_weight:
+            scene.by_weight = by_weight
+            scene.edge_collection.set_linewidths(self._edge_widths(scene, by_weight))
+
+        # Edges connected to removed nodes are drawn dashed on top, and hidden in the base edges
+        mark = plot_options.get("mark_removed_edges", True)
+        highlight = (mark, by_weight if mark else None)
+        if new_result or highlight != scene.highlight:
+            scene.highlight = highlight
+            self._restyle_highlight(scene, mark, by_weight)
+
+        # Draw node labels based on plot options
+        show_names = plot_options.get("show_node_names", True)
+        if show_names and scene.labels is None:
+            scene.labels = self._label_layer(scene)
+        if scene.labels is not None and scene.labels.get_visible() != show_names:
+            scene.labels.set_visible(show_names)
+
+    def _edge_widths(self, scene: _Scene, by_weight: bool):
+        """Widths by weight between the size-dependent bounds, or one uniform width"""
+        min_thick, max_thick = scene.thickness
+        weights = scene.weights
+        if by_weight and len(weights):
+            # The range of all edges, so widths don't change with the edges drawn at reduced detail
+            w_min, w_max = scene.weight_range
+            if w_max != w_min:
+                return min_thick + (weights - w_min) / (w_max - w_min) * (max_thick - min_thick)
+        return 0.5 * (min_thick + max_thick)
+
+    def _restyle_nodes(self, scene: _Scene, result: dict[str, Any]) -> None:
+        """Node colors from the impact, the title and the colorbar"""
+        impact = result["impact"]
+        removed_set = set(result["removed_nodes"])
+        count = len(scene.nodes)
+        scene.removed = np.fromiter((n in removed_set for n in scene.nodes), dtype=bool, count=count)
+
+        max_abs = max((abs(v) for v in impact.values()), default=0.0)
+        if max_abs == 0:
+            norm = colors.TwoSlopeNorm(vmin=-1.0, vcenter=0.0, vmax=1.0)
+        else:
+            norm = colors.TwoSlopeNorm(vmin=-max_abs, vcenter=0.0, vmax=max_abs)
+        cmap = matplotlib.colormaps["bwr"]
+
+        # Check if this is a preview (no impact data)
+        has_impact_data = impact and any(impact.values())
+        if has_impact_data:
+            # Use impact-based coloring for analysis
+            values = np.fromiter((impact.get(n, 0.0) for n in scene.nodes), dtype=float, count=count)
+            face_colors = cmap(norm(values)).reshape(-1, 4)
+        else:
+            # Use neutral color for preview
+            face_colors = np.tile(_LIGHTBLUE, (count, 1))
+        face_colors[scene.removed] = _YELLOW
+
+        if scene.detail is not None:
+            score = np.abs(values) if has_impact_data else np.zeros(count)
+            self._select_detail(scene, score, scene.removed)
+            self._restyle_density(scene, values if has_impact_data else None, cmap, norm)
+        scene.node_collection.set_facecolor(face_colors[scene.drawn])
+
+        # Set a smaller title
+        scene.ax.set_title(result["label"], fontsize=10)
 
         # Only show colorbar if there's impact data (not for preview)
-        if impact and any(impact.values()):
-            sm = cm.ScalarMappable(cmap=cmap, norm=norm)
-            sm.set_array([])
-            # Adjust colorbar positioning when present
-            figure.subplots_adjust(left=0.02, right=0.85, top=0.90, bottom=0.02)
-            figure.colorbar(sm, ax=ax, fraction=0.04, pad=0.05).set_label("Δ centrality")
+        if has_impact_data:
+            if scene.colorbar is None:
+                sm = cm.ScalarMappable(cmap=cmap, norm=norm)
+                sm.set_array([])
+                # Adjust colorbar positioning when present
+                scene.figure.subplots_adjust(left=0.02, right=0.85, top=0.90, bottom=0.02)
+                scene.colorbar = scene.figure.colorbar(sm, ax=scene.ax, fraction=0.04, pad=0.05)
+                scene.colorbar.set_label("Δ centrality")
+            else:
+                scene.colorbar.mappable.set_norm(norm)
+                scene.colorbar.update_normal(scene.colorbar.mappable)
+        elif scene.colorbar is not None:
+            scene.colorbar.remove()
+            scene.colorbar = None
+            scene.figure.subplots_adjust(left=0.02, right=0.98, top=0.90, bottom=0.02)
+
+    def _restyle_highlight(self, scene: _Scene, mark: bool, by_weight: bool) -> None:
+        if mark:
+            highlight = scene.removed[scene.edge_u] | scene.removed[scene.edge_v]
+        else:
+            highlight = np.zeros(len(scene.weights), dtype=bool)
+
+        edge_colors = np.tile(_LIGHTGREY, (len(highlight), 1))
+        edge_colors[highlight] = _HIDDEN
+        scene.edge_collection.set_color(edge_colors)
+
+        if scene.arrows is not None:
+            arrow_colors = np.tile(_LIGHTGREY, (len(highlight), 1))
+            arrow_colors[highlight] = _ORANGE
+            scene.arrows.set_color(arrow_colors)
+
+        if not highlight.any():
+            if scene.highlight_collection is not None:
+                scene.highlight_collection.set_visible(False)
+            return
+
+        if scene.highlight_collection is None:
+            # Above the density cells (zorder 1.5) of reduced detail, below the nodes
+            scene.highlight_collection = LineCollection([], colors=[_ORANGE], linestyles="dashed", zorder=1.75)
+            scene.ax.add_collection(scene.highlight_collection, autolim=False)
+        widths = self._edge_widths(scene, by_weight)
+        scene.highlight_collection.set_segments(scene.segments[highlight])
+        scene.highlight_collection.set_linewidths(widths[highlight] if np.ndim(widths) else widths)
+        scene.highlight_collection.set_visible(True)
+
+    def _select_detail(self, scene: _Scene, score: np.ndarray, removed: np.ndarray) -> None:
+        """
+        Choose the nodes, edges and labels drawn at reduced detail.
 
+        The removed nodes and all their edges are always drawn. Of the other nodes,
+        the detail budget's worth with the largest score (|Δ|, then degree) are drawn
+        and the first LOD_LABEL_COUNT of them labeled; the rest are only shown as
+        density. The sampled edges are drawn as well.
+        """
+        order = np.lexsort((scene.degree, score))[::-1]
+        drawn = removed.copy()
+        drawn[order[:scene.detail["nodes"]]] = True
+        scene.drawn = np.flatnonzero(drawn)
+        scene.labeled = np.union1d(order[:LOD_LABEL_COUNT], np.flatnonzero(removed))
+
+        edge_u, edge_v, weights = scene.all_edges
+        shown = removed[edge_u] | removed[edge_v]
+        shown[scene.sample] = True
+        scene.edge_u, scene.edge_v, scene.weights = edge_u[shown], edge_v[shown], weights[shown]
+        scene.segments = np.stack([scene.xy[scene.edge_u], scene.xy[scene.edge_v]], axis=1)
+
+        if scene.node_collection is not None:
+            scene.node_collection.set_offsets(scene.xy[scene.drawn])
+            scene.edge_collection.set_segments(scene.segments)
+            # Widths and labels belong to the previous selection
+            scene.by_weight = None
+            if scene.labels is not None:
+                scene.labels.remove()
+                scene.labels = None
+        scene.note.set_text(f"Reduced detail: {len(scene.drawn)} of {len(scene.nodes)} nodes, "
+                            f"{len(scene.weights)} of {len(weights)} edges drawn")
+
+    def _restyle_density(self, scene: _Scene, values: Optional[np.ndarray], cmap, norm) -> None:
+        """
+        Shade the nodes that are not drawn as density cells.
 
+        The opacity grows with the log of the number of nodes in a cell; with impact
+        data a cell has the (darkened) color of its nodes' mean Δ, otherwise the node color.
+        """
+        hidden = np.ones(len(scene.nodes), dtype=bool)
+        hidden[scene.drawn] = False
+        xy = scene.xy[hidden]
+
+        low, high = scene.xy.min(axis=0), scene.xy.max(axis=0)
+        span = np.maximum(high - low, 1e-9)
+        bins = np.maximum(np.ceil(span / span.max() * scene.detail["cells"]), 1).astype(int)
+        extent = [(low[0], high[0]), (low[1], high[1])]
+
+        counts, _, _ = np.histogram2d(xy[:, 0], xy[:, 1], bins=bins, range=extent)
+        image = np.zeros(counts.shape + (4,))
+        if values is not None:
+            sums, _, _ = np.histogram2d(xy[:, 0], xy[:, 1], bins=bins, range=extent, weights=values[hidden])
+            # Darkened, so cells of nodes without impact (white) stay visible
+            image[:] = cmap(norm(sums / np.maximum(counts, 1)))
+            image[..., :3] *= 0.8
+        else:
+            image[:] = _LIGHTBLUE
+        if counts.max() > 0:
+            image[..., 3] = LOD_DENSITY_ALPHA * np.log1p(counts) / np.log1p(counts.max())
+        else:
+            image[..., 3] = 0.0
+        # histogram2d indexes by (x, y); images by (row, column) = (y, x)
+        image = image.transpose(1, 0, 2)
+
+        if scene.density is None:
+            # Above the sampled edges, so they don't hide where the nodes are; the edges
+            # of removed nodes (highlight_collection) and the nodes are drawn above it
+            scene.density = scene.ax.imshow(image, origin="lower", interpolation="nearest", zorder=1.5,
+                                            extent=(low[0], high[0], low[1], high[1]))
+        else:
+            scene.density.set_data(image)
+
+    def _label_layer(self, scene: _Scene) -> _LabelLayer:
+        texts = []
+        # At reduced detail only the selected nodes are labeled
+        index = scene.labeled if scene.detail is not None else slice(None)
+        nodes = [scene.nodes[i] for i in np.arange(len(scene.nodes))[index]]
+        for (x, y), label in zip(scene.xy[index].tolist(), node_labels(scene.graph, nodes)):
+            text = Text(x, y, label, size=8, color="#111", horizontalalignment="center", verticalalignment="center")
+            if scene.detail is not None:
+                # The labeled nodes lie among many others; a backdrop keeps the text readable
+                text.set_bbox(dict(facecolor="white", alpha=0.7, edgecolor="none", pad=1))
+            text.set_transform(scene.ax.transData)
+            text.set_figure(scene.figure)
+            text.set_clip_path(scene.ax.patch)
+            texts.append(text)
+        layer = _LabelLayer(texts)
+        scene.ax.add_artist(layer)
+        return layer
+
+
+def _detail_budget(G, figure: Figure) -> Optional[dict]:
+    """
+    Node and edge budgets for drawing a graph at reduced detail, or None for full detail.
+
+    Graphs above LOD_NODE_THRESHOLD nodes are reduced unless the figure has room
+    for all of their nodes and edges; the budgets grow with the figure's pixels.
+    """
+    size = G.number_of_nodes()
+    if size <= LOD_NODE_THRESHOLD:
+        return None
+    width, height = figure.get_size_inches() * figure.dpi
+    pixels = width * height
+    budget = {
+        "nodes": max(LOD_LABEL_COUNT, int(pixels / LOD_PIXELS_PER_NODE)),
+        "edges": int(pixels / LOD_PIXELS_PER_EDGE),
+        "cells": max(1, int(max(width, height) / LOD_CELL_PIXELS)),
+    }
+    if size <= budget["nodes"] and G.number_of_edges() <= budget["edges"]:
+        return None
+    return budget
+
+
+def _sample_edges(weights: np.ndarray, count: int, seed: int = 0) -> np.ndarray:
+    """
+    Positions of `count` edges sampled without replacement, with probability proportional to weight.
+
+    Uses Efraimidis-Spirakis keys (log(u) / w, largest first), so heavy edges are
+    likely kept and equal weights give a uniform sample. The sample is deterministic.
+    """
+    if len(weights) <= count:
+        return np.arange(len(weights))
+    rng = np.random.default_rng(seed)
+    strength = np.maximum(np.nan_to_num(np.abs(weights)), 1e-12)
+    keys = np.log(rng.random(len(weights))) / strength
+    return np.sort(np.argpartition(keys, len(keys) - count)[len(keys) - count:])
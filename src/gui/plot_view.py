@@ -1,22 +1,47 @@
 import tkinter as tk
 from tkinter import ttk
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 
 class PlotView(ttk.Frame):
     def __init__(self, master: tk.Misc):
         super().__init__(master)
+        # The matplotlib figure and canvas are created on first use, so that
+        # importing matplotlib does not delay the first paint of the window
+        self._figure = None
+        self._canvas = None
+        self.canvas_widget = None
+
+    def _ensure_canvas(self):
+        if self._canvas is not None:
+            return
+
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         # Create figure with minimal padding
-        self.figure = Figure(figsize=(5, 4), dpi=100, tight_layout=True)
+        self._figure = Figure(figsize=(5, 4), dpi=100, tight_layout=True)
         # Set figure background to match the widget
-        self.figure.patch.set_facecolor('white')
+        self._figure.patch.set_facecolor('white')
 
-        self.canvas = FigureCanvasTkAgg(self.figure, master=self)
-        self.canvas_widget = self.canvas.get_tk_widget()
+        self._canvas = FigureCanvasTkAgg(self._figure, master=self)
+        self.canvas_widget = self._canvas.get_tk_widget()
         self.canvas_widget.pack(fill=tk.BOTH, expand=True)
 
+    @property
+    def figure(self):
+        self._ensure_canvas()
+        return self._figure
+
+    @property
+    def canvas(self):
+        self._ensure_canvas()
+        return self._canvas
+
     def clear(self):
+        if self._canvas is None:
+            # Nothing has been drawn yet
+            return
+
         # Clear the figure and re-apply the background and tight layout
         self.figure.clf()
         try:
@@ -31,5 +56,3 @@ class PlotView(ttk.Frame):
 
     def draw_idle(self):
         self.canvas.draw_idle()
-
-
@@ -0,0 +1,99 @@
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+from typing import Callable
+
+from src.models.robustness import REMOVAL_STRATEGIES, DEFAULT_DIAMETER_CHECKPOINTS
+
+
+class RobustnessDialog(tk.Toplevel):
+    """
+    Asks for the removal order and the diameter checkpoints of a robustness curve.
+
+    on_compute receives a dict with 'strategy' (key of REMOVAL_STRATEGIES),
+    'ranking_path' (None unless the strategy is 'ranking') and
+    'diameter_checkpoints' (0 when the diameter is not sampled).
+    """
+
+    def __init__(self, master: tk.Misc, on_compute: Callable[[dict], None], initial_dir: str = "."):
+        super().__init__(master)
+        self.title("Robustness Curve")
+        self.resizable(False, False)
+        self.transient(master)
+        self.on_compute = on_compute
+        self.initial_dir = initial_dir
+
+        # Display name -> strategy key
+        self._strategies = {name: key for key, name in REMOVAL_STRATEGIES.items()}
+
+        form = ttk.Frame(self)
+        form.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        ttk.Label(form, text="Remove nodes by:").grid(row=0, column=0, sticky=tk.W, padx=(0, 6), pady=4)
+        self.strategy_var = tk.StringVar(value=REMOVAL_STRATEGIES["degree"])
+        strategy_combo = ttk.Combobox(form, textvariable=self.strategy_var, values=list(self._strategies),
+                                      state="readonly", width=28)
+        strategy_combo.grid(row=0, column=1, columnspan=2, sticky=tk.W, pady=4)
+        strategy_combo.bind("<<ComboboxSelected>>", lambda _event: self._update_ranking())
+
+        ttk.Label(form, text="Ranking file:").grid(row=1, column=0, sticky=tk.W, padx=(0, 6), pady=4)
+        self.ranking_var = tk.StringVar()
+        self.ranking_entry = ttk.Entry(form, textvariable=self.ranking_var, width=32)
+        self.ranking_entry.grid(row=1, column=1, sticky=tk.W, pady=4)
+        self.ranking_button = ttk.Button(form, text="Browse...", command=self._browse_ranking)
+        self.ranking_button.grid(row=1, column=2, sticky=tk.W, padx=(6, 0), pady=4)
+
+        self.diameter_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(form, text="Sample the diameter at", variable=self.diameter_var,
+                        command=self._update_checkpoints).grid(row=2, column=0, sticky=tk.W, pady=4)
+        self.checkpoints_var = tk.StringVar(value=str(DEFAULT_DIAMETER_CHECKPOINTS))
+        self.checkpoints_entry = ttk.Entry(form, textvariable=self.checkpoints_var, width=8)
+        self.checkpoints_entry.grid(row=2, column=1, sticky=tk.W, pady=4)
+        ttk.Label(form, text="points (slow on large graphs)", foreground="gray").grid(
+            row=3, column=0, columnspan=3, sticky=tk.W)
+
+        buttons = ttk.Frame(self)
+        buttons.pack(side=tk.TOP, fill=tk.X, padx=10, pady=(0, 10))
+        ttk.Button(buttons, text="Cancel", command=self.destroy).pack(side=tk.RIGHT)
+        ttk.Button(buttons, text="Compute", command=self._compute).pack(side=tk.RIGHT, padx=(0, 6))
+
+        self._update_ranking()
+        self._update_checkpoints()
+
+    def _update_ranking(self):
+        """The ranking file only applies to the 'ranking' strategy"""
+        state = ["!disabled"] if self._strategies[self.strategy_var.get()] == "ranking" else ["disabled"]
+        self.ranking_entry.state(state)
+        self.ranking_button.state(state)
+
+    def _update_checkpoints(self):
+        self.checkpoints_entry.state(["!disabled"] if self.diameter_var.get() else ["disabled"])
+
+    def _browse_ranking(self):
+        path = filedialog.askopenfilename(
+            title="Select Ranking File",
+            filetypes=[("Text files", "*.txt *.tsv *.csv"), ("All files", "*.*")],
+            initialdir=self.initial_dir,
+            parent=self,
+        )
+        if path:
+            self.ranking_var.set(path)
+
+    def _compute(self):
+        strategy = self._strategies[self.strategy_var.get()]
+        ranking_path = self.ranking_var.get().strip() if strategy == "ranking" else None
+        if strategy == "ranking" and not ranking_path:
+            messagebox.showerror("Robustness Curve", "Please select a ranking file", parent=self)
+            return
+        checkpoints = 0
+        if self.diameter_var.get():
+            try:
+                checkpoints = int(self.checkpoints_var.get())
+                if checkpoints <= 0:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Robustness Curve", "The number of points must be a positive whole number",
+                                     parent=self)
+                return
+        options = {"strategy": strategy, "ranking_path": ranking_path, "diameter_checkpoints": checkpoints}
+        self.destroy()
+        self.on_compute(options)
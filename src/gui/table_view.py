@@ -1,9 +1,21 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import pandas as pd
-import numpy as np
+from typing import TYPE_CHECKING
+
+from src.gui.virtual_tree import VirtualTreeview
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class TableView(ttk.Frame):
+    """
+    Analysis results table.
+
+    The DataFrame stays the source of truth: the treeview only shows the rows in
+    view, formatted when they scroll in (see VirtualTreeview), and sorting reorders
+    an array of row positions with argsort on the column.
+    """
+
     def __init__(self, master: tk.Misc):
         super().__init__(master)
         
@@ -18,66 +30,31 @@ class TableView(ttk.Frame):
         self.export_button = ttk.Button(button_frame, text="Export as CSV", command=self._export_csv)
         self.export_button.pack(side=tk.RIGHT)
         
-        # Create frame for the treeview and scrollbars
-        tree_frame = ttk.Frame(self)
-        tree_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
-        
         # Initialize with default columns (will be updated dynamically)
         self.columns = ("node",)
-        self.tree = ttk.Treeview(tree_frame, columns=self.columns, show="tree headings", selectmode="extended")
-        
+        self.view = VirtualTreeview(self, self.columns, show="tree headings", selectmode="extended")
+        self.view.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        self.tree = self.view.tree
+
         # Configure the tree column (node names)
-        self.tree.heading("#0", text="Node", command=lambda: self._sort_column("#0", False))
+        self.tree.heading("#0", text="Node",
+                          command=lambda: self._sort_column("#0", self.sort_reverse.get("#0", False)))
         self.tree.column("#0", width=140, anchor=tk.W, stretch=True)
-        
-        # Add scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscroll=v_scrollbar.set, xscroll=h_scrollbar.set)
-        
-        # Pack treeview and scrollbars
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        v_scrollbar.grid(row=0, column=1, sticky="ns")
-        h_scrollbar.grid(row=1, column=0, sticky="ew")
-        
-        # Configure grid weights
-        tree_frame.grid_rowconfigure(0, weight=1)
-        tree_frame.grid_columnconfigure(0, weight=1)
-        
-        # Configure alternating row colors (zebra striping)
-        try:
-            self.tree.tag_configure('evenrow', background='#f0f0f0')  # Light grey
-            self.tree.tag_configure('oddrow', background='#e0e0e0')   # Medium grey
-        except Exception:
-            pass
-        
+
         # Store current data for export
         self.current_data = None
         self.sort_reverse = {}  # Track sort direction for each column
+        self._order = None      # Row positions in display order
+        self._labels = None     # Node labels as strings, by row position
+        self._values = []       # Column arrays, by row position
 
     def _sort_column(self, col, reverse):
-        """Sort treeview contents by the specified column"""
+        """Sort the rows by the specified column"""
         if self.current_data is None:
             return
 
-        # Get all items and their values
-        items = [(self.tree.set(child, col) if col != "#0" else self.tree.item(child, "text"), child)
-                for child in self.tree.get_children('')]
-
-        # Sort items
-        try:
-            # Try numeric sort first
-            items.sort(key=lambda x: float(x[0]) if x[0] and x[0] != 'nan' else float('-inf'), reverse=reverse)
-        except (ValueError, TypeError):
-            # Fall back to string sort
-            items.sort(key=lambda x: str(x[0]).lower(), reverse=reverse)
-
-        # Rearrange items in sorted positions
-        for index, (val, child) in enumerate(items):
-            self.tree.move(child, '', index)
-            # Update row colors
-            tag = 'oddrow' if index % 2 else 'evenrow'
-            self.tree.item(child, tags=(tag,))
+        self._order = self._sort_order(col, reverse)
+        self.view.refresh()
 
         # Update sort direction for next click
         self.sort_reverse[col] = not reverse
@@ -126,47 +103,76 @@ class TableView(ttk.Frame):
                 messagebox.showerror("Export Error", f"Failed to export CSV:\n{str(e)}")
 
     def clear(self):
-        """Clear all items from the treeview"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        """Clear all rows from the table"""
+        self.view.clear()
         self.current_data = None
+        self._order = None
+        self._labels = None
+        self._values = []
         self.clear_diameter_display()
 
-    def populate(self, df: pd.DataFrame):
-        """Populate the treeview with data from DataFrame"""
+    def populate(self, df: "pd.DataFrame"):
+        """Show a DataFrame; only the rows in view are formatted and inserted"""
+        import numpy as np
+
         self.clear()
         self.current_data = df.copy()
-        
+
         if df.empty:
             return
-        
+
         # Update columns dynamically based on DataFrame
         new_columns = list(df.columns)
         if new_columns != list(self.columns):
             self.columns = tuple(new_columns)
             self.tree.configure(columns=self.columns)
-            
+
             # Configure column headings and sorting
             for col in self.columns:
-                self.tree.heading(col, text=col, 
+                self.tree.heading(col, text=col,
                                 command=lambda c=col: self._sort_column(c, self.sort_reverse.get(c, False)))
                 self.tree.column(col, width=120, anchor=tk.W, stretch=True)
                 self.sort_reverse[col] = False
-        
-        # Populate data
-        for idx, (node, row) in enumerate(df.iterrows()):
-            values = []
-            for col in self.columns:
-                val = row.get(col, np.nan)
-                if pd.isna(val):
-                    values.append("N/A")
-                elif isinstance(val, (int, float)):
-                    values.append(f"{val:.6f}")
-                else:
-                    values.append(str(val))
 
-            tag = 'oddrow' if idx % 2 else 'evenrow'
-            self.tree.insert("", tk.END, text=str(node), values=values, tags=(tag,))
+        self._labels = df.index.astype(str).to_numpy()
+        self._values = [df[col].to_numpy() for col in self.columns]
+        self._order = np.arange(len(df))
+        self.view.set_rows(len(df), self._fetch_rows)
+
+    def _fetch_rows(self, start: int, stop: int) -> list:
+        """(row position, node label, formatted values) of the rows at display positions start..stop"""
+        positions = self._order[start:stop]
+        columns = [_format_column(values[positions]) for values in self._values]
+        rows = zip(*columns) if columns else ((),) * len(positions)
+        return [(int(p), self._labels[p], row) for p, row in zip(positions, rows)]
+
+    def _sort_order(self, col, reverse):
+        """
+        Row positions sorted by a column (or by the node label for "#0"), with a stable argsort.
+
+        Numbers sort numerically with missing values lowest; labels sort numerically
+        if they are all numbers, otherwise case-insensitively.
+        """
+        import numpy as np
+        import pandas as pd
+
+        if col == "#0":
+            numeric = pd.to_numeric(pd.Series(self._labels), errors="coerce").to_numpy()
+            if np.isnan(numeric).any():
+                keys = np.char.lower(self._labels.astype(str))
+                order = np.argsort(keys, kind="stable")
+                return order[::-1] if reverse else order
+            keys = numeric
+        else:
+            keys = self._values[self.columns.index(col)]
+            if keys.dtype.kind not in "biuf":
+                keys = np.char.lower(keys.astype(str))
+                order = np.argsort(keys, kind="stable")
+                return order[::-1] if reverse else order
+        keys = keys.astype(float)
+        keys = np.where(np.isnan(keys), -np.inf, keys)
+        # Negated keys keep equal rows in their original order, as the stable sort does
+        return np.argsort(-keys if reverse else keys, kind="stable")
 
     def update_diameter_display(self, diameter_before, diameter_after):
         """Update the diameter display label"""
@@ -182,6 +188,25 @@ class TableView(ttk.Frame):
 
         self.diameter_label.config(text=f"Diameter Before: {before_text}; Diameter After: {after_text}")
 
+    def show_summary(self, text: str):
+        """Show a one-line summary of the table in place of the diameter display"""
+        self.diameter_label.config(text=text)
+
     def clear_diameter_display(self):
         """Clear the diameter display"""
-        self.diameter_label.config(text="")
\ No newline at end of file
+        self.diameter_label.config(text="")
+
+
+def _format_column(values) -> list:
+    """Display strings of column values: counts as integers, other numbers with 6 decimals, missing values as N/A"""
+    import numpy as np
+
+    if values.dtype.kind in "biu":
+        return values.astype(str).tolist()
+    if values.dtype.kind == "f":
+        values = values.astype(float)
+        text = np.char.mod("%.6f", values).tolist()
+        for i in np.flatnonzero(np.isnan(values)):
+            text[i] = "N/A"
+        return text
+    return ["N/A" if value is None or value != value else str(value) for value in values]
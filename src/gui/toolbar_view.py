@@ -3,7 +3,7 @@ from tkinter import ttk
 from .node_selector_view import NodeSelectorView
 
 class ToolbarView(ttk.Frame):
-    def __init__(self, master: tk.Misc, centrality_keys):
+    def __init__(self, master: tk.Misc, centrality_keys, graph_types=("erdos_renyi",)):
         super().__init__(master, padding=(10, 10, 10, 6))
 
         # Optional callback that can be set by the controller to generate a preview
@@ -84,7 +84,7 @@ class ToolbarView(ttk.Frame):
         ttk.Label(self.random_graph_frame, text="Graph type:").grid(row=0, column=0, sticky=tk.W, padx=(0, 4))
         self.random_graph_type_var = tk.StringVar(value="erdos_renyi")
         self.random_graph_type_combo = ttk.Combobox(self.random_graph_frame, textvariable=self.random_graph_type_var,
-                                                   values=["erdos_renyi", "barabasi_albert", "watts_strogatz"],
+                                                   values=list(graph_types),
                                                    state="readonly", width=18)
         self.random_graph_type_combo.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 8))
         self.random_graph_type_combo.bind('<<ComboboxSelected>>', self._on_random_graph_changed)
@@ -231,7 +231,7 @@ class ToolbarView(ttk.Frame):
         ttk.Label(layout_frame, text="Layout:").grid(row=0, column=0, padx=(0, 4), sticky=tk.W)
         self.layout_type_var = tk.StringVar(value="Spring")
         self.layout_type_combo = ttk.Combobox(layout_frame, textvariable=self.layout_type_var,
-                                            values=["Spring", "Circular"],
+                                            values=["Spring", "Circular", "Multilevel"],
                                             state="readonly", width=12)
         self.layout_type_combo.grid(row=0, column=1, padx=4, sticky=tk.W)
 
@@ -252,9 +252,17 @@ class ToolbarView(ttk.Frame):
         actions_frame.grid(row=7, column=0, columnspan=4, sticky=(tk.W, tk.E), padx=0, pady=(6, 0))
         self.run_button = ttk.Button(actions_frame, text="Run Analysis")
         self.run_button.pack(side=tk.LEFT, padx=(0, 6))
+        self.queue_button = ttk.Button(actions_frame, text="Queue Job")
+        self.queue_button.pack(side=tk.LEFT, padx=(0, 6))
+        self.jobs_button = ttk.Button(actions_frame, text="Jobs...")
+        self.jobs_button.pack(side=tk.LEFT, padx=(0, 6))
+        self.critical_button = ttk.Button(actions_frame, text="Find Critical Nodes...")
+        self.critical_button.pack(side=tk.LEFT, padx=(0, 6))
+        self.robustness_button = ttk.Button(actions_frame, text="Robustness...")
+        self.robustness_button.pack(side=tk.LEFT, padx=(0, 6))
         self.refresh_plot_button = ttk.Button(actions_frame, text="Refresh Plot")
         self.refresh_plot_button.pack(side=tk.LEFT, padx=(0, 6))
-        self.save_button = ttk.Button(actions_frame, text="Save SVG As...")
+        self.save_button = ttk.Button(actions_frame, text="Export Plot...")
         self.save_button.pack(side=tk.LEFT, padx=(0, 6))
         self.export_cys_button = ttk.Button(actions_frame, text="Export CYS...")
         self.export_cys_button.pack(side=tk.LEFT, padx=(0, 6))
@@ -338,6 +346,10 @@ class ToolbarView(ttk.Frame):
         """Get the selected nodes from the node selector"""
         return self.node_selector.get_selected_nodes()
 
+    def set_selected_nodes(self, nodes):
+        """Select nodes in the node selector"""
+        self.node_selector.set_selected_nodes(nodes)
+
     def clear_node_selector(self):
         """Clear the node selector"""
         self.node_selector.clear()
@@ -373,7 +385,7 @@ class ToolbarView(ttk.Frame):
 
     def show_export_cys_button(self):
         """Show the export CYS button when a CYS file is loaded"""
-        self.export_cys_button.pack(side=tk.LEFT, padx=(0, 6))
+        self.export_cys_button.pack(side=tk.LEFT, padx=(0, 6), before=self.clear_button)
 
     def hide_export_cys_button(self):
         """Hide the export CYS button when no CYS file is loaded"""
@@ -426,22 +438,7 @@ class ToolbarView(ttk.Frame):
 
     def _on_random_graph_changed(self, _event=None):
         """Handle random graph parameter changes"""
-        # Clear any existing layout cache when parameters change
-        if hasattr(self, 'master') and hasattr(self.master, '_controller'):
-            controller = getattr(self.master, '_controller', None)
-            if controller is not None and hasattr(controller, 'layout_cache'):
-                try:
-                    controller.layout_cache.clear()
-                    # Trigger callback if set
-                    if getattr(self, "on_column_selected_callback", None):
-                        self.on_column_selected_callback()
-                except Exception:
-                    # If layout_cache does not support clear(), try to reset it
-                    try:
-                        controller.layout_cache = {}
-                    except Exception:
-                        pass
-
+        # Layouts are cached by graph content, so a new graph never reuses a stale layout
         if getattr(self, "on_column_selected_callback", None):
             self.on_column_selected_callback()
 
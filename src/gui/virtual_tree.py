@@ -0,0 +1,194 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, Hashable, Optional, Sequence
+
+# Rows moved per mouse wheel step
+WHEEL_ROWS = 3
+
+# A row: (key identifying it across sorting, text of the tree column, values of the other columns)
+Row = tuple[Hashable, str, Sequence[Any]]
+
+
+class VirtualTreeview(ttk.Frame):
+    """
+    A ttk.Treeview showing a window of rows from a large row source.
+
+    The treeview only holds as many items as fit on screen. Scrolling (scrollbar,
+    mouse wheel, keys) moves the window and asks the row source for the rows that
+    come into view, so neither filling nor scrolling depends on the number of rows.
+    Selection is kept by row key, so it survives scrolling and reordering.
+
+    Views configure headings and columns on `tree` and call set_rows with the row
+    count and a fetch(start, stop) callable returning the rows at those display
+    positions.
+    """
+
+    def __init__(self, master: tk.Misc, columns: Sequence[str], **tree_options):
+        super().__init__(master)
+        self.tree = ttk.Treeview(self, columns=tuple(columns), **tree_options)
+
+        self.v_scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._yview)
+        h_scrollbar = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.tree.xview)
+        self.tree.configure(xscroll=h_scrollbar.set)
+
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.v_scrollbar.grid(row=0, column=1, sticky="ns")
+        h_scrollbar.grid(row=1, column=0, sticky="ew")
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        # Configure alternating row colors (zebra striping)
+        try:
+            self.tree.tag_configure('evenrow', background='#f0f0f0')  # Light grey
+            self.tree.tag_configure('oddrow', background='#e0e0e0')   # Medium grey
+        except Exception:
+            pass
+
+        self._count = 0
+        self._fetch: Optional[Callable[[int, int], list[Row]]] = None
+        self._first = 0         # Display position of the first visible row
+        self._slots = []        # Treeview items showing the visible rows, top to bottom
+        self._keys = []         # Keys of the rows currently shown in the slots
+        self._selected = set()  # Keys of the selected rows
+
+        self.tree.bind("<Configure>", lambda _e: self.refresh(), add="+")
+        self.tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
+        self.tree.bind("<MouseWheel>", self._on_wheel)
+        self.tree.bind("<Button-4>", lambda _e: self._scroll(-WHEEL_ROWS))
+        self.tree.bind("<Button-5>", lambda _e: self._scroll(WHEEL_ROWS))
+        self.tree.bind("<Up>", lambda _e: self._on_arrow(-1))
+        self.tree.bind("<Down>", lambda _e: self._on_arrow(1))
+        self.tree.bind("<Prior>", lambda _e: self._scroll(-self._page()))
+        self.tree.bind("<Next>", lambda _e: self._scroll(self._page()))
+        self.tree.bind("<Home>", lambda _e: self._scroll(-self._count))
+        self.tree.bind("<End>", lambda _e: self._scroll(self._count))
+
+    @property
+    def row_count(self) -> int:
+        return self._count
+
+    def set_rows(self, count: int, fetch: Callable[[int, int], list[Row]], keep_selection: bool = False) -> None:
+        """Show a new row source, scrolled to the top; the selection is cleared unless kept"""
+        self._count = count
+        self._fetch = fetch
+        self._first = 0
+        if not keep_selection:
+            self._selected.clear()
+        self.refresh()
+
+    def clear(self) -> None:
+        self._count = 0
+        self._fetch = None
+        self._first = 0
+        self._selected.clear()
+        self.refresh()
+
+    def selected_keys(self) -> set:
+        return set(self._selected)
+
+    def select_keys(self, keys) -> None:
+        """Replace the selection, including rows that are not in view"""
+        self._selected = set(keys)
+        self.refresh()
+
+    def key_of(self, item: str) -> Optional[Hashable]:
+        """Key of the row shown by a treeview item, or None"""
+        if item in self._slots:
+            return self._keys[self._slots.index(item)]
+        return None
+
+    def see(self, position: int) -> None:
+        """Scroll the row at a display position into view"""
+        rows = self._visible_rows()
+        if position < self._first:
+            self._first = position
+        elif position >= self._first + rows:
+            self._first = position - rows + 1
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Fetch and show the rows in the window, e.g. after the order of the rows changed"""
+        rows = min(self._visible_rows(), self._count)
+        self._first = max(0, min(self._first, self._count - rows))
+
+        # Reuse the existing items; only their number changes with the window height
+        while len(self._slots) < rows:
+            self._slots.append(self.tree.insert("", tk.END, text=""))
+        if len(self._slots) > rows:
+            self.tree.delete(*self._slots[rows:])
+            del self._slots[rows:]
+
+        fetched = self._fetch(self._first, self._first + rows) if rows else []
+        self._keys = [key for key, _text, _values in fetched]
+        selection = []
+        for offset, (slot, (key, text, values)) in enumerate(zip(self._slots, fetched)):
+            tag = 'oddrow' if (self._first + offset) % 2 else 'evenrow'
+            self.tree.item(slot, text=text, values=tuple(values), tags=(tag,))
+            if key in self._selected:
+                selection.append(slot)
+
+        # <<TreeviewSelect>> fires for this as well; _on_select then finds the same selection
+        self.tree.selection_set(selection)
+        if self._count:
+            self.v_scrollbar.set(self._first / self._count, (self._first + rows) / self._count)
+        else:
+            self.v_scrollbar.set(0.0, 1.0)
+
+    def _visible_rows(self) -> int:
+        """Number of rows that fit in the treeview's current height"""
+        style = ttk.Style(self)
+        row_height = int(style.lookup(self.tree.cget("style") or "Treeview", "rowheight") or 20)
+        heading = row_height
+        if self._slots:
+            box = self.tree.bbox(self._slots[0])
+            if box:
+                heading = box[1]
+        return max(1, (self.tree.winfo_height() - heading) // row_height)
+
+    def _page(self) -> int:
+        return max(1, self._visible_rows() - 1)
+
+    def _scroll(self, rows: int) -> str:
+        self._first += rows
+        self.refresh()
+        return "break"
+
+    def _yview(self, *args) -> None:
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units' | 'pages')"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._first = int(round(float(args[1]) * self._count))
+            self.refresh()
+        elif args[0] == "scroll":
+            step = self._page() if args[2] == "pages" else 1
+            self._scroll(int(args[1]) * step)
+
+    def _on_wheel(self, event) -> str:
+        return self._scroll(-WHEEL_ROWS if event.delta > 0 else WHEEL_ROWS)
+
+    def _on_arrow(self, step: int) -> Optional[str]:
+        """Scroll when the arrow keys move past the first or last visible row"""
+        focus = self.tree.focus()
+        if focus not in self._slots:
+            return None
+        index = self._slots.index(focus) + step
+        if 0 <= index < len(self._slots):
+            return None
+        self._first += step
+        self.refresh()
+        # Move the focus and the selection to the row that came into view, like the arrow keys do
+        index = 0 if step < 0 else len(self._slots) - 1
+        self._selected = {self._keys[index]}
+        self.tree.focus(self._slots[index])
+        self.tree.selection_set(self._slots[index])
+        return "break"
+
+    def _on_select(self, _event) -> None:
+        # The selection of the visible rows replaces their previous selection
+        selected = set(self.tree.selection())
+        for slot, key in zip(self._slots, self._keys):
+            if slot in selected:
+                self._selected.add(key)
+            else:
+                self._selected.discard(key)
@@ -0,0 +1,109 @@
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+import networkx as nx
+
+
+# Number of graphs each worker process keeps unpickled in memory
+WORKER_GRAPH_CACHE_SIZE = 4
+
+# Per-process cache of resident graphs: key -> graph (only used inside workers)
+_resident_graphs: "OrderedDict[Any, nx.Graph]" = OrderedDict()
+
+
+def _resident_graph(key, path: str) -> nx.Graph:
+    """Return a worker's resident copy of a graph, loading it on first use"""
+    G = _resident_graphs.get(key)
+    if G is None:
+        with open(path, "rb") as f:
+            G = pickle.load(f)
+        _resident_graphs[key] = G
+        while len(_resident_graphs) > WORKER_GRAPH_CACHE_SIZE:
+            _resident_graphs.popitem(last=False)
+    else:
+        _resident_graphs.move_to_end(key)
+    return G
+
+
+def _call_with_graph(fn: Callable, key, path: str, args: tuple) -> Any:
+    return fn(_resident_graph(key, path), *args)
+
+
+class AnalysisPool:
+    """
+    Persistent process pool whose workers keep graphs resident.
+
+    A graph is registered once: it is pickled to a temporary file, and each worker
+    loads it from there the first time it runs a task for that graph. Later tasks
+    only send the graph key and the task arguments, so per-task overhead does not
+    grow with the graph size.
+
+    Task functions receive the graph as their first argument and must be picklable
+    (module-level functions). Workers are started with 'spawn' on every platform:
+    forking the GUI process would copy its Tk state and the locks held by its
+    other threads into the workers.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                             mp_context=multiprocessing.get_context("spawn"))
+        self._dir = tempfile.mkdtemp(prefix="gca-pool-")
+        self._graph_paths = {}
+        self._lock = threading.Lock()
+
+    def register_graph(self, key, G: nx.Graph) -> None:
+        """Make a graph available to the workers under a hashable key"""
+        # Graphs may be registered from several threads (e.g. the GUI's analysis thread)
+        with self._lock:
+            if key in self._graph_paths:
+                return
+            path = os.path.join(self._dir, f"graph{len(self._graph_paths)}.pickle")
+            with open(path, "wb") as f:
+                pickle.dump(G, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self._graph_paths[key] = path
+
+    def has_graph(self, key) -> bool:
+        return key in self._graph_paths
+
+    def submit(self, fn: Callable, key, *args) -> Future:
+        """Run fn(graph, *args) in a worker on the graph registered under key"""
+        return self._executor.submit(_call_with_graph, fn, key, self._graph_paths[key], args)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def terminate(self) -> None:
+        """Stop the workers immediately, abandoning running tasks (shutdown waits for them)"""
+        # ProcessPoolExecutor has no public way to stop running workers before Python 3.14
+        processes = list((self._executor._processes or {}).values())
+        self.shutdown(wait=False)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.shutdown()
+
+
+def removal_task(G: nx.Graph, removed_nodes, selected_centralities) -> dict:
+    """
+    Worker task: centralities and diameter of G after removing nodes.
+
+    Returns the compact result of CentralityAnalysisService.compute_removal
+    (dense float arrays indexed by node id), which pickles as raw buffers.
+    """
+    from src.models.centrality_service import CentralityAnalysisService
+
+    return CentralityAnalysisService().compute_removal(G, removed_nodes, selected_centralities)
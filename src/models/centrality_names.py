@@ -0,0 +1,12 @@
+# Names of the available centrality measures, in display order.
+# This module has no heavy imports so the GUI can build its widgets before
+# networkx and scipy are loaded; centrality_service.centrality_functions
+# provides one function per name.
+CENTRALITY_KEYS = (
+    "degree",
+    "unnormalized_degree",
+    "betweenness",
+    "closeness",
+    "eigenvector",
+    "katz",
+)
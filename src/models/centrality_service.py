@@ -1,9 +1,14 @@
 from typing import Any
 import time
+from collections import OrderedDict
 import numpy as np
 import pandas as pd
 import networkx as nx
-from scipy.sparse.linalg import eigs
+
+from src.models.betweenness import betweenness_centrality
+from src.models.centrality_names import CENTRALITY_KEYS
+from src.models.graph_fingerprint import graph_cache_key
+from src.models.node_index import get_node_index
 
 def get_node_removal_impact(graph, nodes_to_remove, centrality_metric_function):
     """
@@ -36,9 +41,9 @@ def get_node_removal_impact(graph, nodes_to_remove, centrality_metric_function):
         elapsed_time = time.time() - start_time
         return elapsed_time, impact, original_centrality
 
+    nodes_to_remove = set(nodes_to_remove)
     temp_graph = graph.copy()
-    for node in nodes_to_remove:
-        temp_graph.remove_node(node)
+    temp_graph.remove_nodes_from(nodes_to_remove)
 
     new_centrality = centrality_metric_function(temp_graph)
 
@@ -110,84 +115,190 @@ def calculate_diameter(G):
 
 
 
+def katz_centrality(G):
+    """
+    Compute Katz centrality with alpha set to 80% of the inverse spectral radius.
+
+    scipy.sparse.linalg is imported on first use because it is slow to import
+    and only needed for this measure.
+    """
+    from scipy.sparse.linalg import eigs
+
+    A = nx.adjacency_matrix(G)
+    alpha = 0.8 / float(abs(eigs(A, k=1, which="LM", return_eigenvectors=False)[0]))
+    return nx.katz_centrality(G, alpha=alpha, beta=1)
+
+
 centrality_functions = {
     "degree": nx.degree_centrality,
     "unnormalized_degree": unnormalized_degree_centrality,
-    "betweenness": nx.betweenness_centrality,
+    # Checkpointed Brandes engine: long runs resume after a crash (see betweenness.py)
+    "betweenness": betweenness_centrality,
     "closeness": nx.closeness_centrality,
     "eigenvector": lambda G: nx.eigenvector_centrality(G, max_iter=5000),
-    "katz": lambda G: (
-        lambda A: nx.katz_centrality(
-            G,
-            alpha=0.8 / float(abs(eigs(A, k=1, which="LM", return_eigenvectors=False)[0])),
-            beta=1
-        )
-    )(nx.adjacency_matrix(G))
+    "katz": katz_centrality,
 }
+# The GUI builds its checkboxes from CENTRALITY_KEYS before this module is imported.
+# Checked explicitly rather than with assert, which python -O strips.
+if tuple(centrality_functions) != CENTRALITY_KEYS:
+    raise RuntimeError(f"centrality_functions {tuple(centrality_functions)} do not match "
+                       f"centrality_names.CENTRALITY_KEYS {CENTRALITY_KEYS}")
 
 
-class CentralityAnalysisService:
-    def compute(self, G: nx.Graph, removed_nodes, selected_centralities) -> tuple[pd.DataFrame, dict[Any, float], dict[str, float]]:
-        # Calculate diameter before node removal
-        diameter_before = calculate_diameter(G)
+def id_space_size(G: nx.Graph) -> int:
+    """Number of slots needed to index per-node arrays of a graph by node id"""
+    index = get_node_index(G)
+    if index is not None:
+        return len(index)
+    return max(G.nodes(), default=-1) + 1
 
-        # Create a copy of the graph for diameter calculation after removal
-        temp_graph = G.copy()
-        for node in removed_nodes:
-            temp_graph.remove_node(node)
 
-        # Calculate diameter after node removal
-        diameter_after = calculate_diameter(temp_graph)
+def to_dense(values: dict, size: int) -> np.ndarray:
+    """
+    Store per-node values in a float array indexed by node id.
 
-        diameter_info = {
-            'before': diameter_before,
-            'after': diameter_after
-        }
+    Nodes without a value are NaN. Dense arrays are the compact form in which
+    centralities are cached, shipped between processes and diffed.
+    """
+    dense = np.full(size, np.nan)
+    if values:
+        ids = np.fromiter(values.keys(), dtype=np.int64, count=len(values))
+        dense[ids] = np.fromiter(values.values(), dtype=float, count=len(values))
+    return dense
 
-        overall_centrality_delta = {}
-        centrality_results = {}  # Store individual centrality results
 
+# Number of graphs whose baselines each service keeps in memory
+BASELINE_CACHE_SIZE = 4
+
+
+class CentralityAnalysisService:
+    def __init__(self):
+        # graph cache key -> {'centralities': {...}, 'diameter': ...}, least recently used first
+        self._baselines = OrderedDict()
+
+    def compute_baseline(self, G: nx.Graph, selected_centralities) -> dict:
+        """
+        Compute the centralities and diameter of the intact graph.
+
+        The baseline only depends on the graph, so it can be computed once and
+        shared by any number of removal sets (see compute and ScenarioRunner).
+        Baselines are cached by graph_cache_key for the last BASELINE_CACHE_SIZE
+        graphs; only centralities not computed before for the graph are computed.
+        The returned arrays are shared with the cache and must not be modified.
+
+        Returns:
+            dict with 'centralities' (name -> dense array indexed by node id)
+            and 'diameter'
+        """
+        key = graph_cache_key(G)
+        cached = self._baselines.get(key)
+        if cached is None:
+            cached = {'centralities': {}}
+            self._baselines[key] = cached
+            while len(self._baselines) > BASELINE_CACHE_SIZE:
+                self._baselines.popitem(last=False)
+        else:
+            self._baselines.move_to_end(key)
+
+        size = id_space_size(G)
         for centrality in selected_centralities:
-            _, node_removal_impact, new_centrality = get_node_removal_impact(
-                G, removed_nodes, centrality_functions[centrality]
-            )
+            if centrality not in cached['centralities']:
+                cached['centralities'][centrality] = to_dense(centrality_functions[centrality](G), size)
+        if 'diameter' not in cached:
+            cached['diameter'] = calculate_diameter(G)
+
+        return {
+            'centralities': {
+                centrality: cached['centralities'][centrality]
+                for centrality in selected_centralities
+            },
+            'diameter': cached['diameter'],
+        }
 
-            # Store individual centrality results
-            centrality_results[centrality] = {
-                'new': new_centrality,
-                'diff': node_removal_impact
-            }
+    def compute_removal(self, G: nx.Graph, removed_nodes, selected_centralities) -> dict:
+        """
+        Compute the centralities and diameter of the graph after removing nodes.
 
-            for k, v in node_removal_impact.items():
-                overall_centrality_delta[k] = overall_centrality_delta.get(k, 0) + v
+        Returns:
+            dict with the same layout as compute_baseline
+        """
+        temp_graph = G.copy()
+        temp_graph.remove_nodes_from(removed_nodes)
+
+        size = id_space_size(G)
+        return {
+            'centralities': {
+                centrality: to_dense(centrality_functions[centrality](temp_graph), size)
+                for centrality in selected_centralities
+            },
+            'diameter': calculate_diameter(temp_graph),
+        }
 
-        # Build the table with individual centrality columns
-        centrality_table = {}
-        all_nodes = set()
+    def build_table(self, G: nx.Graph, removed_nodes, selected_centralities, baseline: dict,
+                    removal: dict) -> tuple[pd.DataFrame, dict[Any, float], dict[str, float]]:
+        """
+        Combine a baseline and a removal result into the per-node impact table.
 
-        # Collect all nodes from all centrality measures
-        for centrality_data in centrality_results.values():
-            all_nodes.update(centrality_data['new'].keys())
+        Returns:
+            The same (table, combined impact, diameter info) tuple as compute
+        """
+        diameter_info = {
+            'before': baseline['diameter'],
+            'after': removal['diameter']
+        }
+
+        # Nodes are integer ids, so the table is built column-wise over an id array
+        removed_set = set(removed_nodes)
+        nodes = np.array(sorted(n for n in G.nodes() if n not in removed_set), dtype=np.int64)
+
+        columns = {}
+        combined_new = np.zeros(len(nodes))
+        combined_diff = np.zeros(len(nodes))
 
-        for node in all_nodes:
-            row_data = {}
+        for centrality in selected_centralities:
+            new_col = removal['centralities'][centrality][nodes]
+            # Nodes missing after the removal count as zero, as in get_node_removal_impact
+            diff_col = np.nan_to_num(new_col) - baseline['centralities'][centrality][nodes]
 
             # Add individual centrality columns
-            for centrality in selected_centralities:
-                new_val = centrality_results[centrality]['new'].get(node, np.nan)
-                diff_val = centrality_results[centrality]['diff'].get(node, np.nan)
-                row_data[f"{centrality.title()}"] = new_val
-                row_data[f"Δ {centrality.title()}"] = diff_val
+            columns[f"{centrality.title()}"] = new_col
+            columns[f"Δ {centrality.title()}"] = diff_col
 
-            # Add combined columns
-            combined_new = sum(centrality_results[cent]['new'].get(node, 0) for cent in selected_centralities)
-            combined_diff = sum(centrality_results[cent]['diff'].get(node, 0) for cent in selected_centralities)
-            row_data["Combined"] = combined_new
-            row_data["Δ Combined"] = combined_diff
+            # Missing values count as zero in the combined columns
+            combined_new += np.nan_to_num(new_col)
+            combined_diff += np.nan_to_num(diff_col)
 
-            centrality_table[node] = row_data
+        # Add combined columns
+        columns["Combined"] = combined_new
+        columns["Δ Combined"] = combined_diff
 
-        df = pd.DataFrame.from_dict(centrality_table, orient="index")
-        return df, overall_centrality_delta, diameter_info
+        overall_centrality_delta = dict(zip(nodes.tolist(), combined_diff.tolist()))
 
+        df = pd.DataFrame(columns, index=nodes)
+        return df, overall_centrality_delta, diameter_info
 
+    def compute(self, G: nx.Graph, removed_nodes, selected_centralities,
+                baseline: dict = None) -> tuple[pd.DataFrame, dict[Any, float], dict[str, float]]:
+        """
+        Compute the per-node centrality table before and after removing nodes.
+
+        G is expected to use integer node ids (see NodeIndex); removed_nodes are ids
+        as well. The returned table is indexed by node id, and callers translate ids
+        to labels when displaying or exporting it.
+
+        Args:
+            G: Graph to analyze
+            removed_nodes: Ids of the nodes to remove
+            selected_centralities: Keys of centrality_functions
+            baseline: Result of compute_baseline for G, reused instead of recomputing it
+        """
+        if baseline is None:
+            baseline = self.compute_baseline(G, selected_centralities)
+
+        if removed_nodes:
+            removal = self.compute_removal(G, removed_nodes, selected_centralities)
+        else:
+            # Nothing removed: the graph after removal is the baseline graph
+            removal = baseline
+
+        return self.build_table(G, removed_nodes, selected_centralities, baseline, removal)
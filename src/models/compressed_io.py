@@ -0,0 +1,179 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import queue
+import threading
+from typing import BinaryIO, Optional
+
+
+# Leading bytes of each supported compression container
+COMPRESSION_MAGIC = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+}
+
+# File name suffixes that only describe the compression, not the graph format
+COMPRESSION_EXTENSIONS = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+}
+
+_OPENERS = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+
+# Size of the decompressed blocks handed from the background thread to the parser
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Number of decompressed blocks that may be buffered ahead of the parser
+DEFAULT_PREFETCH = 8
+
+
+def detect_compression(path: str) -> Optional[str]:
+    """
+    Detect the compression container of a file from its magic bytes.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        "gzip", "bz2" or "xz", or None if the file is not compressed
+    """
+    with open(path, "rb") as f:
+        head = f.read(max(len(magic) for magic in COMPRESSION_MAGIC.values()))
+
+    for name, magic in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def strip_compression_extension(path: str) -> str:
+    """Remove a trailing compression suffix (e.g. 'graph.tsv.gz' -> 'graph.tsv')"""
+    root, ext = os.path.splitext(path)
+    if ext.lower() in COMPRESSION_EXTENSIONS:
+        return root
+    return path
+
+
+def get_format_extension(path: str) -> str:
+    """
+    Get the lowercase extension that describes the graph format of a file,
+    ignoring any compression suffix ('graph.tsv.gz' -> '.tsv').
+    """
+    return os.path.splitext(strip_compression_extension(path))[1].lower()
+
+
+class _BackgroundDecompressor(io.RawIOBase):
+    """
+    Read-only binary stream that decompresses a file on a background thread.
+
+    The worker thread pulls fixed-size blocks out of the decompressor and pushes
+    them into a bounded queue, so decompression of the next blocks overlaps with
+    the consumer parsing the current one. zlib, bz2 and lzma release the GIL while
+    decompressing, which makes the overlap effective even in pure-Python parsers.
+    """
+
+    def __init__(self, path: str, compression: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 prefetch: int = DEFAULT_PREFETCH):
+        super().__init__()
+        self._source = _OPENERS[compression](path, "rb")
+        self._chunk_size = chunk_size
+        self._queue = queue.Queue(maxsize=prefetch)
+        self._stop = threading.Event()
+        self._buffer = b""
+        self._offset = 0
+        self._eof = False
+
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def _produce(self):
+        """Worker loop: decompress blocks until EOF, an error or close()"""
+        try:
+            while not self._stop.is_set():
+                block = self._source.read(self._chunk_size)
+                if not block:
+                    break
+                self._put(block)
+        except BaseException as e:
+            # Hand the error over to the reading thread
+            self._put(e)
+        finally:
+            self._put(None)
+
+    def _put(self, item):
+        # Poll so that close() can stop a producer blocked on a full queue
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        if self._eof:
+            return 0
+
+        if self._offset >= len(self._buffer):
+            item = self._queue.get()
+            if item is None:
+                self._eof = True
+                return 0
+            if isinstance(item, BaseException):
+                self._eof = True
+                raise item
+            self._buffer = item
+            self._offset = 0
+
+        n = min(len(b), len(self._buffer) - self._offset)
+        b[:n] = self._buffer[self._offset:self._offset + n]
+        self._offset += n
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            # Drain the queue so a blocked producer can observe the stop flag
+            try:
+                while True:
+                    self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._thread.join()
+            self._source.close()
+        super().close()
+
+
+def open_decompressed(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      prefetch: int = DEFAULT_PREFETCH) -> BinaryIO:
+    """
+    Open a possibly compressed file as a buffered binary stream.
+
+    Compressed inputs (detected by magic bytes, not by extension) are decompressed
+    on the fly on a background thread; uncompressed files are opened directly.
+
+    Args:
+        path: Path to the file
+        chunk_size: Size in bytes of each decompressed block
+        prefetch: Maximum number of blocks decompressed ahead of the reader
+
+    Returns:
+        A readable binary file object; the caller is responsible for closing it
+    """
+    compression = detect_compression(path)
+    if compression is None:
+        return open(path, "rb")
+
+    raw = _BackgroundDecompressor(path, compression, chunk_size, prefetch)
+    return io.BufferedReader(raw, buffer_size=chunk_size)
@@ -0,0 +1,230 @@
+"""
+Greedy search for the set of k nodes whose removal has the largest impact.
+
+The greedy search adds, k times, the candidate with the largest marginal gain of
+the objective. Gains are evaluated lazily (CELF): a candidate's gain from an
+earlier step is kept as a bound, and only candidates whose bound could still
+beat the best fresh gain are evaluated again. Evaluations run in parallel on an
+AnalysisPool, and every evaluation is diffed against one baseline computed at
+the start.
+"""
+import heapq
+import math
+import time
+from typing import Optional
+
+import numpy as np
+import networkx as nx
+
+from src.models.analysis_pool import AnalysisPool
+from src.models.centrality_service import calculate_diameter, centrality_functions, id_space_size, to_dense
+from src.models.graph_fingerprint import graph_cache_key
+
+# Objective key -> display name
+OBJECTIVES = {
+    "delta": "Total |Δ Combined|",
+    "diameter": "Diameter increase",
+}
+
+DEFAULT_BUDGET = 5
+
+# Size of the default candidate pool: the nodes with the highest degree
+DEFAULT_CANDIDATE_COUNT = 50
+
+
+def top_degree_candidates(G: nx.Graph, count: int = DEFAULT_CANDIDATE_COUNT) -> list[int]:
+    """The count nodes with the highest degree, ties broken by node id"""
+    nodes = np.fromiter(G.nodes(), dtype=np.int64, count=G.number_of_nodes())
+    degrees = np.fromiter((d for _, d in G.degree(nodes.tolist())), dtype=np.int64, count=len(nodes))
+    order = np.lexsort((nodes, -degrees))
+    return nodes[order[:count]].tolist()
+
+
+def combined_task(G: nx.Graph, removed_nodes, selected_centralities) -> np.ndarray:
+    """
+    Worker task: sum of the selected centralities of G after removing nodes.
+
+    Returns a dense array indexed by node id, missing values counted as zero.
+    Unlike removal_task, the diameter is not computed.
+    """
+    temp_graph = G.copy()
+    temp_graph.remove_nodes_from(removed_nodes)
+    size = id_space_size(G)
+    return sum(np.nan_to_num(to_dense(centrality_functions[c](temp_graph), size)) for c in selected_centralities)
+
+
+def objective_task(G: nx.Graph, removed_nodes, selected_centralities, objective: str,
+                   combined_baseline: Optional[np.ndarray]) -> float:
+    """
+    Worker task: objective value of G after removing nodes.
+
+    'delta' is the sum of |Δ Combined| over the remaining nodes (the table's
+    Δ Combined column), against combined_baseline from combined_task. 'diameter'
+    is the diameter after the removal, infinite if it disconnects the graph.
+    """
+    if objective == "diameter":
+        temp_graph = G.copy()
+        temp_graph.remove_nodes_from(removed_nodes)
+        return float(calculate_diameter(temp_graph))
+
+    remaining = np.zeros(len(combined_baseline), dtype=bool)
+    remaining[np.fromiter(G.nodes(), dtype=np.int64, count=G.number_of_nodes())] = True
+    remaining[list(removed_nodes)] = False
+    delta = combined_task(G, removed_nodes, selected_centralities)[remaining] - combined_baseline[remaining]
+    return float(np.abs(delta).sum())
+
+
+class CriticalNodeSearch:
+    """
+    Lazy-greedy (CELF) search for the k candidates whose removal maximizes an objective.
+
+    The objectives are not guaranteed to be submodular, so like plain greedy the
+    result is a heuristic; the lazy evaluation skips re-evaluating candidates whose
+    gain in an earlier step is already below the best gain of the current step.
+
+    Use as a context manager (or call close()) to shut the worker processes down.
+    """
+
+    def __init__(self, G: nx.Graph, selected_centralities, objective: str = "delta",
+                 max_workers: Optional[int] = None, pool: Optional[AnalysisPool] = None):
+        """
+        Args:
+            G: Graph with interned integer node ids
+            selected_centralities: Keys of centrality_functions (unused by the 'diameter' objective)
+            objective: Key of OBJECTIVES
+            max_workers: Number of worker processes (default: CPU count)
+            pool: Existing pool to use instead of starting one; it is not shut down by close()
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective: {objective}. Available: {', '.join(OBJECTIVES)}")
+        self.graph = G
+        self.centralities = list(selected_centralities)
+        self.objective = objective
+        self._cancelled = False
+
+        self._owns_pool = pool is None
+        self.pool = pool if pool is not None else AnalysisPool(max_workers)
+        self._graph_key = ("search-graph", graph_cache_key(G))
+        self.pool.register_graph(self._graph_key, G)
+
+    def close(self) -> None:
+        if self._owns_pool:
+            self.pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.close()
+
+    def cancel(self) -> None:
+        """Stop the running search after the evaluations in progress (may be called from another thread)"""
+        self._cancelled = True
+
+    def run(self, k: int, candidates, progress=None) -> dict:
+        """
+        Select up to k of the candidates greedily.
+
+        Args:
+            k: Number of nodes to select
+            candidates: Node ids to choose from, e.g. from top_degree_candidates
+            progress: Optional callable(selected, k, evaluations) invoked after each step
+
+        Returns:
+            dict with 'objective', 'baseline' (objective value of the intact graph),
+            'nodes' (selected ids in order), 'steps' (per step: node, gain, value
+            after the step and the evaluations it took), 'evaluations',
+            'greedy_evaluations' (what plain greedy would have needed), 'elapsed'
+            and 'stopped' (why fewer than k nodes were selected, or "")
+        """
+        if k < 1:
+            raise ValueError("The budget k must be at least 1")
+        candidates = list(dict.fromkeys(candidates))
+        missing = [node for node in candidates if node not in self.graph]
+        if missing:
+            raise ValueError(f"{len(missing)} candidate(s) are not in the graph")
+        if not candidates:
+            raise ValueError("No candidate nodes to choose from")
+
+        start_time = time.time()
+        baseline, combined_baseline = self._baseline()
+        if self.objective == "diameter" and math.isinf(baseline):
+            raise ValueError("The diameter objective needs a connected graph (keep only the largest component)")
+
+        # Objective value of the selected set; 'delta' is zero for the intact graph
+        value = 0.0 if self.objective == "delta" else baseline
+        selected = []
+        steps = []
+        evaluations = 0
+        stopped = ""
+
+        # Heap of (-gain bound, candidate position, node, step the gain was evaluated in)
+        values = self._evaluate([[node] for node in candidates], combined_baseline)
+        evaluations += len(values)
+        heap = [(-(v - value), position, node, 0) for position, (node, v) in enumerate(zip(candidates, values))]
+        heapq.heapify(heap)
+        step_evaluations = len(values)
+
+        batch_size = self.pool.max_workers
+        while len(selected) < min(k, len(candidates)):
+            step = len(selected)
+            # The best bound is a fresh gain: no other candidate can do better
+            while heap[0][3] != step:
+                if self._cancelled:
+                    break
+                batch = []
+                while heap and heap[0][3] != step and len(batch) < batch_size:
+                    batch.append(heapq.heappop(heap))
+                values = self._evaluate([selected + [entry[2]] for entry in batch], combined_baseline)
+                evaluations += len(values)
+                step_evaluations += len(values)
+                for (_, position, node, _), v in zip(batch, values):
+                    heapq.heappush(heap, (-(v - value), position, node, step))
+            if self._cancelled:
+                stopped = "Cancelled"
+                break
+
+            neg_gain, _, node, _ = heapq.heappop(heap)
+            selected.append(node)
+            value -= neg_gain
+            steps.append({"node": node, "gain": -neg_gain, "value": value, "evaluations": step_evaluations})
+            step_evaluations = 0
+            if progress is not None:
+                progress(len(selected), k, evaluations)
+
+            if self.objective == "diameter" and math.isinf(value):
+                # Disconnected: no further removal can increase the diameter
+                stopped = "The selected nodes disconnect the graph"
+                break
+
+        if not stopped and len(selected) < k:
+            stopped = f"Only {len(candidates)} candidate(s)"
+
+        # Plain greedy evaluates every remaining candidate in every step
+        count = len(candidates)
+        greedy_evaluations = sum(count - i for i in range(len(selected)))
+        return {
+            "objective": self.objective,
+            "baseline": baseline,
+            "nodes": selected,
+            "steps": steps,
+            "evaluations": evaluations,
+            "greedy_evaluations": greedy_evaluations,
+            "elapsed": time.time() - start_time,
+            "stopped": stopped,
+        }
+
+    def _baseline(self) -> tuple[float, Optional[np.ndarray]]:
+        """Objective value of the intact graph, and the combined baseline centralities ('delta' only)"""
+        if self.objective == "diameter":
+            return self.pool.submit(objective_task, self._graph_key, [], [], "diameter", None).result(), None
+        return 0.0, self.pool.submit(combined_task, self._graph_key, [], self.centralities).result()
+
+    def _evaluate(self, removal_sets: list[list[int]], combined_baseline) -> list[float]:
+        """Objective values of the graph after each removal set, evaluated in parallel"""
+        futures = [
+            self.pool.submit(objective_task, self._graph_key, removed, self.centralities, self.objective,
+                             combined_baseline)
+            for removed in removal_sets
+        ]
+        return [future.result() for future in futures]
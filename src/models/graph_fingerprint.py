@@ -0,0 +1,187 @@
+"""
+Content fingerprints of graphs, used as keys of every cache that holds graph data.
+
+A fingerprint is an order-independent hash: every node and edge is hashed on its
+own with vectorized 64-bit mixing and the hashes are summed, so no sorting is
+needed and the cost is one pass over the edge arrays. Labels are hashed with
+pandas' hash_array, whose key is fixed, so fingerprints are stable across
+processes and machines (unlike Python's salted hash()).
+
+Fingerprints are cached on the graph (G.graph[FINGERPRINT_KEY]) together with a
+cheap content check: the identity of the adjacency dict, which copies and
+unpickled graphs don't share even though G.copy() copies G.graph, and the degree
+of every node, which changes when nodes or edges are added, removed or rewired
+(O(n), against O(m) for the fingerprint). In-place edits that keep every degree,
+such as changing an edge weight, are not detected; call invalidate_fingerprint
+after them.
+"""
+import hashlib
+from itertools import chain, repeat
+from operator import methodcaller
+
+import numpy as np
+import pandas as pd
+import networkx as nx
+
+from src.models.node_index import FINGERPRINT_KEY, get_node_index
+
+_VERSION = b"graph-fingerprint-2"
+
+# Two independently seeded 64-bit lanes give a 128-bit sum
+_LANE_SEEDS = (np.uint64(0x9E3779B97F4A7C15), np.uint64(0xD1B54A32D192ED03))
+_NODE_TAG = np.uint64(0x632BE59BD9B4E019)
+_ID_TAG = np.uint64(0x8CB92BA72F3D8DD7)
+
+
+def _mix(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer on a uint64 array (wrapping arithmetic)"""
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xBF58476D1CE4E5B9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def _lane_sums(values: list[np.ndarray]) -> list[int]:
+    """Sum of the mixed hashes of the rows of the given columns, per lane"""
+    sums = []
+    for seed in _LANE_SEEDS:
+        h = np.full(len(values[0]), seed, dtype=np.uint64)
+        for column in values:
+            h = _mix(h ^ column)
+        sums.append(int(h.sum(dtype=np.uint64)))
+    return sums
+
+
+def _graph_arrays(G: nx.Graph):
+    """
+    Label hashes and edge arrays of a graph.
+
+    The adjacency dicts are flattened with C-level iterators (chain, map) rather
+    than G.edges(data=...), which builds a tuple per edge and is several times
+    slower on large graphs.
+
+    Returns:
+        (label hash per node position, node positions, edge source and target
+        positions, edge weights, whether the nodes are interned)
+    """
+    adj = G._adj
+    index = get_node_index(G)
+    if index is not None:
+        label_hash = pd.util.hash_array(np.asarray(index.labels, dtype=object))
+        nodes = np.fromiter(adj, dtype=np.int64, count=len(adj))
+        targets = chain.from_iterable(adj.values())
+    else:
+        label_hash = pd.util.hash_array(np.asarray([str(n) for n in adj], dtype=object))
+        nodes = np.arange(len(adj), dtype=np.int64)
+        position = {n: i for i, n in enumerate(adj)}
+        targets = map(position.__getitem__, chain.from_iterable(adj.values()))
+
+    degrees = np.fromiter(map(len, adj.values()), dtype=np.int64, count=len(adj))
+    count = int(degrees.sum())
+    u = np.repeat(nodes, degrees)
+    v = np.fromiter(targets, dtype=np.int64, count=count)
+    # Subgraph views wrap the adjacency dicts in read-only mappings
+    values = dict.values if type(adj) is dict else methodcaller("values")
+    attributes = chain.from_iterable(map(values, adj.values()))
+    weights = np.fromiter(map(dict.get, attributes, repeat("weight"), repeat(1.0)),
+                          dtype=np.float64, count=count)
+    if not G.is_directed():
+        # Undirected edges are stored in both endpoints' dicts; keep one copy
+        keep = u <= v
+        u, v, weights = u[keep], v[keep], weights[keep]
+    return label_hash, nodes, u, v, weights, index is not None
+
+
+def _compute(G: nx.Graph) -> tuple[str, str]:
+    label_hash, nodes, u, v, weights, interned = _graph_arrays(G)
+
+    node_lanes = _lane_sums([label_hash[nodes] ^ _NODE_TAG])
+    hu, hv = label_hash[u], label_hash[v]
+    if not G.is_directed():
+        hu, hv = np.minimum(hu, hv), np.maximum(hu, hv)
+    # +0.0 turns -0.0 into 0.0, so equal weights hash equally
+    edge_lanes = _lane_sums([hu, hv, (weights + 0.0).view(np.uint64)])
+
+    digest = hashlib.sha256(_VERSION)
+    digest.update(b"directed" if G.is_directed() else b"undirected")
+    for value in (len(nodes), len(u), *node_lanes, *edge_lanes):
+        digest.update(value.to_bytes(8, "little"))
+    fingerprint = digest.hexdigest()
+
+    # Caches of per-node data (layouts, centrality arrays) also depend on which id each label got
+    if interned:
+        id_lanes = _lane_sums([label_hash[nodes], nodes.astype(np.uint64) ^ _ID_TAG])
+        layout = hashlib.sha256(fingerprint.encode("ascii"))
+        for value in id_lanes:
+            layout.update(value.to_bytes(8, "little"))
+        cache_key = layout.hexdigest()
+    else:
+        cache_key = fingerprint
+    return fingerprint, cache_key
+
+
+def _content_check(G: nx.Graph) -> tuple:
+    """Identity of the adjacency dict and a digest of the degrees, in adjacency order"""
+    adj = G._adj
+    digest = hashlib.blake2b(digest_size=16)
+    for neighbours in (adj, G._pred) if G.is_directed() else (adj,):
+        digest.update(np.fromiter(map(len, neighbours.values()), dtype=np.int64, count=len(neighbours)).tobytes())
+    return id(adj), digest.digest()
+
+
+def _cached(G: nx.Graph) -> tuple[str, str]:
+    if type(G._adj) is not dict:
+        # Subgraph views share G.graph with their graph; don't overwrite its entry
+        return _compute(G)
+    check = _content_check(G)
+    cached = G.graph.get(FINGERPRINT_KEY)
+    if cached is None or cached[0] != check:
+        cached = (check, *_compute(G))
+        G.graph[FINGERPRINT_KEY] = cached
+    return cached[1], cached[2]
+
+
+def copy_fingerprint(source: nx.Graph, copy: nx.Graph) -> None:
+    """
+    Give an exact copy of a graph the fingerprint of the original without recomputing it.
+
+    G.copy() carries the cached fingerprint along but the content check rejects
+    it, since the copy could be edited independently.
+    """
+    fingerprint, cache_key = _cached(source)
+    if type(copy._adj) is dict:
+        copy.graph[FINGERPRINT_KEY] = (_content_check(copy), fingerprint, cache_key)
+
+
+def invalidate_fingerprint(G: nx.Graph) -> None:
+    """Drop the cached fingerprint after an in-place edit that keeps every node's degree"""
+    G.graph.pop(FINGERPRINT_KEY, None)
+
+
+def graph_fingerprint(G: nx.Graph) -> str:
+    """
+    Content hash of a graph, independent of node and edge order.
+
+    Two graphs get the same fingerprint when they have the same node labels,
+    edges, edge weights and directedness, regardless of how they were loaded or
+    which ids the labels were interned to.
+
+    Returns:
+        Hex digest (sha256 of the summed node and edge hashes)
+    """
+    return _cached(G)[0]
+
+
+def graph_cache_key(G: nx.Graph) -> str:
+    """
+    Fingerprint that also covers the label -> id assignment.
+
+    Caches of data indexed by node id (layouts, dense centrality arrays, graphs
+    resident in worker processes) use this key, so two equal graphs interned to
+    different ids don't share entries.
+
+    Returns:
+        Hex digest; equal to graph_fingerprint for graphs without a NodeIndex
+    """
+    return _cached(G)[1]
@@ -2,26 +2,85 @@ import pandas as pd
 import networkx as nx
 import zipfile
 import os
-import networkxgmml
+import re
+import threading
+from collections import OrderedDict
+
+from src.models.compressed_io import open_decompressed, get_format_extension, detect_compression
+from src.models.graph_fingerprint import copy_fingerprint, graph_fingerprint
+from src.models.node_index import NodeIndex, NODE_INDEX_KEY, intern_graph, relabel_to_labels
+
+# Number of TSV rows parsed per chunk when building the graph
+TSV_CHUNK_ROWS = 200_000
+
+# Number of parsed files each loader keeps, so reloading an unchanged file is a copy
+PARSED_CACHE_SIZE = 4
+
+# Optional set name at the start of a removal set line: "name: A,B,C". The space
+# after the colon keeps labels that contain a colon ("GO:0001") from being names.
+_SET_NAME = re.compile(r"([^,\t:]+):\s+")
+
+
+def _split_labels(text: str) -> list[str]:
+    """Labels of a line separated by commas or tabs, without surrounding whitespace"""
+    return [label.strip() for label in text.replace('\t', ',').split(',') if label.strip()]
+
 
 class GraphLoader:
+    def __init__(self):
+        # (path, mtime, size, load options) -> parsed graph, least recently used first
+        self._parsed = OrderedDict()
+        # The GUI loads on background threads as well as on the Tk thread
+        self._lock = threading.Lock()
+
     def load(self, edge1: str, edge2: str, weight: str, path: str, remove_self_edges: bool = True, network_name: str = None, directed: bool = False) -> nx.Graph:
         """
         Load a graph from a TSV file, a Cytoscape .cys file, or a GEXF file.
 
+        TSV and GEXF files may be compressed with gzip, bzip2 or xz (e.g. .tsv.gz);
+        compression is detected from the file contents and decompressed on the fly.
+
         Args:
             edge1: Column name for source node (used for TSV files)
             edge2: Column name for target node (used for TSV files)
             weight: Column name for edge weight (used for TSV files)
-            path: Path to the file (either .tsv, .cys, or .gexf)
+            path: Path to the file (either .tsv, .cys, or .gexf, optionally compressed)
             remove_self_edges: Whether to remove self-edges
             network_name: Name of the network to load from .cys file (optional, defaults to first network)
             directed: Whether to create a directed graph (default: False for undirected)
 
         Returns:
-            A NetworkX Graph or DiGraph object
+            A NetworkX Graph or DiGraph object whose nodes are contiguous integer ids.
+            The labels from the file are kept in the NodeIndex at G.graph["node_index"].
+            Loading a file again while it is unchanged returns a copy of the cached
+            graph, with its fingerprint already computed.
         """
-        file_ext = os.path.splitext(path)[1].lower()
+        try:
+            stat = os.stat(path)
+            key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size,
+                   edge1, edge2, weight, remove_self_edges, network_name, directed)
+        except OSError:
+            key = None
+
+        with self._lock:
+            G = self._parsed.get(key) if key is not None else None
+            if G is not None:
+                self._parsed.move_to_end(key)
+        if G is None:
+            G = self._parse(edge1, edge2, weight, path, remove_self_edges, network_name, directed)
+            graph_fingerprint(G)
+            if key is not None:
+                with self._lock:
+                    self._parsed[key] = G
+                    while len(self._parsed) > PARSED_CACHE_SIZE:
+                        self._parsed.popitem(last=False)
+        copy = G.copy()
+        copy_fingerprint(G, copy)
+        return copy
+
+    def _parse(self, edge1: str, edge2: str, weight: str, path: str, remove_self_edges: bool,
+               network_name: str, directed: bool) -> nx.Graph:
+        file_ext = self.get_file_format(path)
 
         if file_ext == '.cys':
             return self._load_cys(path, remove_self_edges, network_name)
@@ -31,6 +90,49 @@ class GraphLoader:
             # Default to TSV loading for .tsv or other files
             return self._load_tsv(edge1, edge2, weight, path, remove_self_edges, directed)
 
+    def get_file_format(self, path: str) -> str:
+        """
+        Get the graph format of a file as a lowercase extension ('.tsv', '.cys' or '.gexf').
+
+        Compression suffixes are ignored ('graph.gexf.gz' -> '.gexf'). When a compressed
+        file carries no format extension, the format is sniffed from its first bytes.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            The format extension; unknown formats are reported as they appear in the name
+        """
+        file_ext = get_format_extension(path)
+        if file_ext in ('.tsv', '.cys', '.gexf'):
+            return file_ext
+
+        try:
+            if detect_compression(path) is None:
+                return file_ext
+            with open_decompressed(path) as f:
+                head = f.peek(64)[:64].lstrip()
+        except OSError:
+            return file_ext
+
+        if head.startswith(b'<'):
+            return '.gexf'
+        return '.tsv'
+
+    def read_columns(self, path: str) -> list[str]:
+        """
+        Read the header row of a (possibly compressed) TSV file.
+
+        Args:
+            path: Path to the TSV file
+
+        Returns:
+            List of column names
+        """
+        with open_decompressed(path) as f:
+            df = pd.read_csv(f, sep="\t", nrows=0)
+        return df.columns.tolist()
+
     def _load_gexf(self, path: str, remove_self_edges: bool = True, directed: bool = False) -> nx.Graph:
         """
         Load a graph from a GEXF file.
@@ -39,7 +141,8 @@ class GraphLoader:
         to directed/undirected based on the `directed` flag. It also removes
         self-edges if requested.
         """
-        G = nx.read_gexf(path)
+        with open_decompressed(path) as f:
+            G = nx.read_gexf(f)
 
         # Ensure graph directedness matches the requested flag
         if directed and not G.is_directed():
@@ -53,16 +156,37 @@ class GraphLoader:
             if self_edges:
                 G.remove_edges_from(self_edges)
 
-        return G
+        return intern_graph(G)
 
     def _load_tsv(self, edge1: str, edge2: str, weight: str, path: str, remove_self_edges: bool = True, directed: bool = False) -> nx.Graph:
-        """Load graph from TSV file."""
-        df = pd.read_csv(path, sep="\t")
+        """
+        Load graph from a (possibly compressed) TSV file.
+
+        The file is parsed in chunks of TSV_CHUNK_ROWS rows and each chunk is added
+        to the graph column-wise, so decompression, parsing and graph construction
+        are streamed instead of materializing the whole table first. Node labels are
+        read as strings and interned to integer ids chunk by chunk.
+        """
         G = nx.DiGraph() if directed else nx.Graph()
-        for _, row in df.iterrows():
-            if remove_self_edges and row[edge1] == row[edge2]:
-                continue
-            G.add_edge(row[edge1], row[edge2], weight=row[weight])
+        index = NodeIndex()
+        G.graph[NODE_INDEX_KEY] = index
+        columns = list(dict.fromkeys([edge1, edge2, weight]))
+
+        with open_decompressed(path) as f:
+            chunks = pd.read_csv(f, sep="\t", usecols=columns, dtype={edge1: str, edge2: str},
+                                 chunksize=TSV_CHUNK_ROWS)
+            for chunk in chunks:
+                sources = chunk[edge1].to_numpy()
+                targets = chunk[edge2].to_numpy()
+                weights = chunk[weight].to_numpy()
+
+                if remove_self_edges:
+                    keep = sources != targets
+                    sources, targets, weights = sources[keep], targets[keep], weights[keep]
+
+                source_ids = index.intern_array(sources)
+                target_ids = index.intern_array(targets)
+                G.add_weighted_edges_from(zip(source_ids.tolist(), target_ids.tolist(), weights.tolist()))
         return G
 
     def _load_cys(self, path: str, remove_self_edges: bool = True, network_name: str = None) -> nx.Graph:
@@ -77,6 +201,8 @@ class GraphLoader:
             remove_self_edges: Whether to remove self-edges
             network_name: Name of the network (XGMML file) to load. If None, loads the first network.
         """
+        import networkxgmml
+
         with zipfile.ZipFile(path, 'r') as zip_ref:
             # Find all XGMML files in the archive
             xgmml_files = [f for f in zip_ref.namelist() if f.endswith('.xgmml')]
@@ -102,23 +228,26 @@ class GraphLoader:
             with zip_ref.open(xgmml_file) as xgmml_content:
                 G_directed = networkxgmml.XGMMLReader(xgmml_content)
                 G = nx.Graph()
+                index = NodeIndex()
+                G.graph[NODE_INDEX_KEY] = index
 
-                # Create a mapping from original node IDs to labels (node names)
-                id_to_label = {}
+                # Create a mapping from original XGMML node IDs to interned label ids
+                xgmml_to_node = {}
 
-                # Copy nodes with their attributes, using labels as node identifiers
-                for node_id, attrs in G_directed.nodes(data=True):
+                # Copy nodes with their attributes, interning labels (node names) as identifiers
+                for xgmml_id, attrs in G_directed.nodes(data=True):
                     # Use the label as the node name if available, otherwise use the ID
-                    node_name = attrs.get('label', node_id)
-                    id_to_label[node_id] = node_name
-                    G.add_node(node_name, **attrs)
+                    node_name = attrs.get('label', xgmml_id)
+                    node = index.intern(node_name)
+                    xgmml_to_node[xgmml_id] = node
+                    G.add_node(node, **attrs)
 
-                # Copy edges with their attributes, mapping IDs to labels
+                # Copy edges with their attributes, mapping XGMML IDs to interned ids
                 for source_id, target_id, attrs in G_directed.edges(data=True):
-                    source_name = id_to_label[source_id]
-                    target_name = id_to_label[target_id]
+                    source_node = xgmml_to_node[source_id]
+                    target_node = xgmml_to_node[target_id]
 
-                    if remove_self_edges and source_name == target_name:
+                    if remove_self_edges and source_node == target_node:
                         continue
 
                     # Extract weight from the 'interaction' attribute if available
@@ -154,7 +283,7 @@ class GraphLoader:
                             weight = 1.0
 
                     # Add edge with weight
-                    G.add_edge(source_name, target_name, weight=weight, **attrs)
+                    G.add_edge(source_node, target_node, weight=weight, **attrs)
 
                 return G
 
@@ -180,6 +309,68 @@ class GraphLoader:
             return []
 
 
+    def load_removal_sets(self, path: str) -> list[tuple[str, list[str]]]:
+        """
+        Read removal sets (lists of node labels) from a text file.
+
+        Each non-empty line that does not start with '#' is one removal set, with
+        labels separated by commas or tabs. A line may start with a set name
+        followed by a colon and a space (``name: A,B,C``); a colon inside a label
+        (``GO:0001``) does not start a name. Unnamed sets are named set0, set1, ...
+
+        Args:
+            path: Path to the file (optionally compressed)
+
+        Returns:
+            List of (name, labels) tuples in file order
+        """
+        removal_sets = []
+        with open_decompressed(path) as f:
+            for raw_line in f:
+                line = raw_line.decode("utf-8").strip()
+                if not line or line.startswith('#'):
+                    continue
+
+                name = f"set{len(removal_sets)}"
+                match = _SET_NAME.match(line)
+                if match:
+                    name, line = match.group(1).strip(), line[match.end():]
+
+                removal_sets.append((name, _split_labels(line)))
+        return removal_sets
+
+    def load_labels(self, path: str) -> list[str]:
+        """
+        Read a plain list of node labels (a ranking or a candidate pool) from a text file.
+
+        Labels are separated by newlines, commas or tabs and kept in file order.
+        Lines starting with '#' are ignored. There are no set names: a line that
+        looks like a named removal set (``name: A,B``) or a label listed twice is
+        an error, since the order or content of the list would be ambiguous.
+
+        Args:
+            path: Path to the file (optionally compressed)
+
+        Returns:
+            Labels in file order
+        """
+        labels = []
+        first_line = {}
+        with open_decompressed(path) as f:
+            for line_number, raw_line in enumerate(f, start=1):
+                line = raw_line.decode("utf-8").strip()
+                if not line or line.startswith('#'):
+                    continue
+                if _SET_NAME.match(line):
+                    raise ValueError(f"{path}, line {line_number}: expected node labels, not a named set: {line!r}")
+                for label in _split_labels(line):
+                    if label in first_line:
+                        raise ValueError(f"{path}, line {line_number}: node {label!r} is already listed "
+                                         f"on line {first_line[label]}")
+                    first_line[label] = line_number
+                    labels.append(label)
+        return labels
+
     def process_graph(self, G: nx.Graph, remove_zero_degree: bool = False, use_largest_component: bool = False) -> nx.Graph:
         """
         Apply graph processing operations.
@@ -259,15 +450,15 @@ class GraphLoader:
             graph: NetworkX graph to export
             output_path: Path where to save the .cys file
             network_name: Name for the network (default: "network")
-            combined_centrality: Dictionary mapping node names to combined centrality values
-            combined_delta: Dictionary mapping node names to combined delta values
+            combined_centrality: Dictionary mapping node labels to combined centrality values
+            combined_delta: Dictionary mapping node labels to combined delta values
         """
         import os
         import zipfile
         import tempfile
 
-        # Create a copy of the graph to avoid modifying the original
-        export_graph = graph.copy()
+        # Export with the original labels as nodes (this also copies the graph)
+        export_graph = relabel_to_labels(graph)
 
         # Add combined centrality and delta attributes to nodes if provided
         if combined_centrality:
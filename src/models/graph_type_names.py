@@ -0,0 +1,23 @@
+# Names of the random graph types, in display order.
+# Like centrality_names, this module has no heavy imports so the GUI can build
+# its widgets before numpy and scipy are loaded; random_graph_generator
+# generates one graph per name.
+GRAPH_TYPE_KEYS = (
+    "erdos_renyi",
+    "barabasi_albert",
+    "watts_strogatz",
+    "stochastic_block_model",
+    "configuration_model",
+    "holme_kim",
+    "random_geometric",
+)
+
+GRAPH_TYPE_DISPLAY_NAMES = {
+    "erdos_renyi": "Erdős-Rényi",
+    "barabasi_albert": "Barabási-Albert",
+    "watts_strogatz": "Watts-Strogatz",
+    "stochastic_block_model": "Stochastic Block Model",
+    "configuration_model": "Configuration Model",
+    "holme_kim": "Holme-Kim",
+    "random_geometric": "Random Geometric",
+}
@@ -0,0 +1,579 @@
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, wait
+from contextlib import contextmanager
+from typing import Optional
+
+import numpy as np
+import networkx as nx
+
+from src.models.analysis_pool import AnalysisPool
+from src.models.graph_fingerprint import graph_cache_key, graph_fingerprint
+from src.models.node_index import node_ids
+
+# Job states
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+# Environment variable overriding the default database location
+JOB_DB_ENV = "GCA_JOB_DB"
+
+# Running jobs refresh their heartbeat this often (seconds); a running job whose
+# heartbeat is older than STALE_AFTER belongs to a worker that died
+HEARTBEAT_INTERVAL = 5.0
+STALE_AFTER = 60.0
+
+# Stored graphs and baselines are pruned, least recently used first, once their
+# compressed size exceeds this many bytes (graphs of queued or running jobs are kept)
+MAX_STORED_GRAPH_BYTES = 1 << 30
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS graphs (
+    fingerprint TEXT PRIMARY KEY,
+    nodes INTEGER NOT NULL,
+    edges INTEGER NOT NULL,
+    directed INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    created REAL NOT NULL,
+    used REAL NOT NULL,
+    cache_key TEXT
+);
+CREATE TABLE IF NOT EXISTS baselines (
+    fingerprint TEXT NOT NULL,
+    options TEXT NOT NULL,
+    centrality TEXT NOT NULL,
+    data BLOB,
+    diameter REAL,
+    PRIMARY KEY (fingerprint, options, centrality)
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    request_key TEXT NOT NULL UNIQUE,
+    fingerprint TEXT NOT NULL,
+    source TEXT NOT NULL DEFAULT '',
+    removed TEXT NOT NULL,
+    centralities TEXT NOT NULL,
+    options TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    diameter_before REAL,
+    diameter_after REAL,
+    created REAL NOT NULL,
+    started REAL,
+    finished REAL,
+    heartbeat REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id);
+CREATE TABLE IF NOT EXISTS results (
+    job_id INTEGER NOT NULL,
+    centrality TEXT NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (job_id, centrality)
+);
+"""
+
+# Pseudo-centrality under which the baseline diameter is stored in 'baselines'
+_DIAMETER_ROW = "__diameter__"
+
+
+def default_job_db_path() -> str:
+    """Location of the job database: $GCA_JOB_DB or ~/.graph-centrality-analysis/jobs.sqlite3"""
+    return os.environ.get(JOB_DB_ENV) or os.path.join(
+        os.path.expanduser("~"), ".graph-centrality-analysis", "jobs.sqlite3")
+
+
+def pack_array(values: np.ndarray) -> bytes:
+    """Encode a dense per-node float array as a compressed little-endian float64 blob"""
+    return zlib.compress(np.ascontiguousarray(values, dtype="<f8").tobytes(), 1)
+
+
+def unpack_array(data: bytes) -> np.ndarray:
+    return np.frombuffer(zlib.decompress(data), dtype="<f8")
+
+
+def _canonical_json(value) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def job_options(**options) -> dict:
+    """
+    Options of an analysis request as stored with its job, e.g. the load and
+    graph processing options. Options that don't apply (None) are left out.
+    """
+    return {name: value for name, value in options.items() if value is not None}
+
+
+class JobStore:
+    """
+    SQLite-backed queue and result store for analysis jobs.
+
+    A job is one analysis request: a graph (by fingerprint), a removal set given
+    as node labels, the selected centralities and engine options. Identical
+    requests map to the same job, so a finished result is returned instead of
+    being recomputed. Graphs are stored once per fingerprint, baselines once per
+    graph and options, and per-node results as compressed float64 blobs indexed
+    by the node ids of the stored graph.
+
+    Stored graphs and their baselines are pruned, least recently used first,
+    when their size exceeds max_graph_bytes; finished jobs on a pruned graph are
+    deleted with it.
+
+    Every method opens its own connection, so a store can be shared between
+    threads and processes.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_graph_bytes: int = MAX_STORED_GRAPH_BYTES):
+        self.path = path or default_job_db_path()
+        self.max_graph_bytes = max_graph_bytes
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as con:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        con = sqlite3.connect(self.path, timeout=30)
+        con.row_factory = sqlite3.Row
+        try:
+            yield con
+            con.commit()
+        except BaseException:
+            con.rollback()
+            raise
+        finally:
+            con.close()
+
+    # ---- graphs and baselines ----
+
+    def canonical_graph(self, G: nx.Graph) -> tuple[str, nx.Graph]:
+        """
+        Return the fingerprint of G and the stored copy of the graph.
+
+        Stored results are indexed by the node ids of the stored graph, so any
+        computation meant to be recorded must run on the graph returned here.
+        G itself is stored (and returned) if its fingerprint is new, and returned
+        without unpickling the stored copy if its ids match the stored ones.
+        Storing a graph prunes the least recently used ones (see prune).
+        """
+        fingerprint = graph_fingerprint(G)
+        cache_key = graph_cache_key(G)
+        now = time.time()
+        with self._connect() as con:
+            row = con.execute("SELECT cache_key FROM graphs WHERE fingerprint = ?", (fingerprint,)).fetchone()
+            if row is not None:
+                con.execute("UPDATE graphs SET used = ? WHERE fingerprint = ?", (now, fingerprint))
+                stored_key = row["cache_key"]
+            else:
+                data = zlib.compress(pickle.dumps(G, protocol=pickle.HIGHEST_PROTOCOL), 1)
+                con.execute(
+                    "INSERT INTO graphs (fingerprint, nodes, edges, directed, data, created, used, cache_key) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (fingerprint, G.number_of_nodes(), G.number_of_edges(), int(G.is_directed()), data, now, now,
+                     cache_key))
+        if row is None:
+            self.prune(keep=fingerprint)
+            return fingerprint, G
+        if stored_key == cache_key:
+            return fingerprint, G
+        return fingerprint, self.load_graph(fingerprint)
+
+    def prune(self, max_bytes: Optional[int] = None, keep: Optional[str] = None) -> int:
+        """
+        Delete least recently used graphs until the graphs and baselines fit in max_bytes.
+
+        Graphs of queued or running jobs, and the graph with fingerprint keep, are
+        never deleted. Baselines and finished or failed jobs of a deleted graph are
+        deleted with it.
+
+        Args:
+            max_bytes: Size limit of the stored data (default: max_graph_bytes)
+            keep: Fingerprint of a graph to keep regardless of its age
+
+        Returns:
+            Number of graphs deleted
+        """
+        limit = self.max_graph_bytes if max_bytes is None else max_bytes
+        with self._connect() as con:
+            sizes = {row["fingerprint"]: row["size"] for row in con.execute(
+                "SELECT g.fingerprint, length(g.data) + COALESCE(SUM(length(b.data)), 0) AS size "
+                "FROM graphs g LEFT JOIN baselines b ON b.fingerprint = g.fingerprint GROUP BY g.fingerprint")}
+            total = sum(sizes.values())
+            if total <= limit:
+                return 0
+            active = {row["fingerprint"] for row in con.execute(
+                "SELECT DISTINCT fingerprint FROM jobs WHERE status IN (?, ?)", (JOB_QUEUED, JOB_RUNNING))}
+            candidates = con.execute("SELECT fingerprint FROM graphs ORDER BY used").fetchall()
+            deleted = []
+            for row in candidates:
+                if total <= limit:
+                    break
+                fingerprint = row["fingerprint"]
+                if fingerprint == keep or fingerprint in active:
+                    continue
+                total -= sizes[fingerprint]
+                deleted.append((fingerprint,))
+            con.executemany("DELETE FROM results WHERE job_id IN (SELECT id FROM jobs WHERE fingerprint = ?)", deleted)
+            con.executemany("DELETE FROM jobs WHERE fingerprint = ?", deleted)
+            con.executemany("DELETE FROM baselines WHERE fingerprint = ?", deleted)
+            con.executemany("DELETE FROM graphs WHERE fingerprint = ?", deleted)
+        return len(deleted)
+
+    def load_graph(self, fingerprint: str) -> nx.Graph:
+        with self._connect() as con:
+            row = con.execute("SELECT data FROM graphs WHERE fingerprint = ?", (fingerprint,)).fetchone()
+            con.execute("UPDATE graphs SET used = ? WHERE fingerprint = ?", (time.time(), fingerprint))
+        if row is None:
+            raise KeyError(f"Graph {fingerprint[:12]} is not in the job store")
+        return pickle.loads(zlib.decompress(row["data"]))
+
+    def load_baseline(self, fingerprint: str, selected_centralities, options: Optional[dict] = None) -> Optional[dict]:
+        """
+        Return a stored baseline (as compute_baseline would) or None if any part is missing
+        """
+        options_key = _canonical_json(options or {})
+        with self._connect() as con:
+            rows = con.execute("SELECT centrality, data, diameter FROM baselines WHERE fingerprint = ? AND options = ?",
+                               (fingerprint, options_key)).fetchall()
+        stored = {row["centrality"]: row for row in rows}
+        if _DIAMETER_ROW not in stored or any(c not in stored for c in selected_centralities):
+            return None
+        return {
+            'centralities': {c: unpack_array(stored[c]["data"]) for c in selected_centralities},
+            'diameter': stored[_DIAMETER_ROW]["diameter"],
+        }
+
+    def _store_baseline(self, con, fingerprint: str, options_key: str, baseline: dict) -> None:
+        rows = [(fingerprint, options_key, c, pack_array(values), None)
+                for c, values in baseline['centralities'].items()]
+        rows.append((fingerprint, options_key, _DIAMETER_ROW, None, baseline['diameter']))
+        con.executemany("INSERT OR IGNORE INTO baselines VALUES (?, ?, ?, ?, ?)", rows)
+
+    # ---- jobs ----
+
+    @staticmethod
+    def request_key(fingerprint: str, removed_labels, selected_centralities, options: Optional[dict] = None) -> str:
+        """Identity of an analysis request; equal requests share one job"""
+        request = {
+            "graph": fingerprint,
+            "removed": sorted(set(map(str, removed_labels))),
+            "centralities": sorted(set(selected_centralities)),
+            "options": options or {},
+        }
+        return hashlib.sha256(_canonical_json(request).encode("utf-8")).hexdigest()
+
+    def find(self, fingerprint: str, removed_labels, selected_centralities,
+             options: Optional[dict] = None) -> Optional[dict]:
+        """Return the job of an identical request, if one was submitted"""
+        key = self.request_key(fingerprint, removed_labels, selected_centralities, options)
+        with self._connect() as con:
+            row = con.execute("SELECT * FROM jobs WHERE request_key = ?", (key,)).fetchone()
+        return self._job(row) if row is not None else None
+
+    def submit(self, G: nx.Graph, removed_labels, selected_centralities, options: Optional[dict] = None,
+               source: str = "") -> tuple[dict, bool]:
+        """
+        Queue an analysis request.
+
+        Returns:
+            (job, created): an identical earlier job is returned as is (created False),
+            except failed jobs, which are queued again
+        """
+        fingerprint, _ = self.canonical_graph(G)
+        key = self.request_key(fingerprint, removed_labels, selected_centralities, options)
+        with self._connect() as con:
+            row = con.execute("SELECT * FROM jobs WHERE request_key = ?", (key,)).fetchone()
+            if row is not None and row["status"] != JOB_FAILED:
+                return self._job(row), False
+            if row is not None:
+                con.execute("UPDATE jobs SET status = ?, error = NULL, started = NULL, finished = NULL "
+                            "WHERE id = ?", (JOB_QUEUED, row["id"]))
+                job_id = row["id"]
+            else:
+                job_id = con.execute(
+                    "INSERT INTO jobs (request_key, fingerprint, source, removed, centralities, options, status, created) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, fingerprint, source, json.dumps(list(map(str, removed_labels))),
+                     json.dumps(list(selected_centralities)), _canonical_json(options or {}), JOB_QUEUED,
+                     time.time())).lastrowid
+        return self.get_job(job_id), True
+
+    def record(self, G: nx.Graph, removed_labels, selected_centralities, baseline: dict, removal: dict,
+               options: Optional[dict] = None, source: str = "") -> dict:
+        """
+        Store a result computed outside the queue as a finished job.
+
+        G must be the graph returned by canonical_graph, since the arrays are
+        indexed by its node ids.
+        """
+        job, created = self.submit(G, removed_labels, selected_centralities, options, source)
+        if created or job["status"] != JOB_DONE:
+            self.complete(job["id"], baseline, removal)
+        return self.get_job(job["id"])
+
+    def get_job(self, job_id: int) -> dict:
+        with self._connect() as con:
+            row = con.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"Job {job_id} not found")
+        return self._job(row)
+
+    def list_jobs(self, status: Optional[str] = None, limit: Optional[int] = None) -> list[dict]:
+        """Jobs with their graph size, newest first"""
+        query = "SELECT * FROM jobs"
+        params = []
+        if status:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY id DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._connect() as con:
+            rows = con.execute(query, params).fetchall()
+            sizes = {row["fingerprint"]: (row["nodes"], row["edges"])
+                     for row in con.execute("SELECT fingerprint, nodes, edges FROM graphs")}
+        jobs = []
+        for row in rows:
+            job = self._job(row)
+            job["nodes"], job["edges"] = sizes.get(row["fingerprint"], (None, None))
+            jobs.append(job)
+        return jobs
+
+    @staticmethod
+    def _job(row: sqlite3.Row) -> dict:
+        job = dict(row)
+        job["removed"] = json.loads(job["removed"])
+        job["centralities"] = json.loads(job["centralities"])
+        job["options"] = json.loads(job["options"])
+        return job
+
+    # ---- worker side ----
+
+    def claim(self, limit: int = 1) -> list[dict]:
+        """Atomically mark up to limit queued jobs as running and return them"""
+        if limit <= 0:
+            return []
+        con = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        con.row_factory = sqlite3.Row
+        try:
+            # IMMEDIATE takes the write lock up front, so concurrent workers never claim the same job
+            con.execute("BEGIN IMMEDIATE")
+            rows = con.execute("SELECT * FROM jobs WHERE status = ? ORDER BY id LIMIT ?",
+                               (JOB_QUEUED, limit)).fetchall()
+            now = time.time()
+            con.executemany("UPDATE jobs SET status = ?, started = ?, heartbeat = ? WHERE id = ?",
+                            [(JOB_RUNNING, now, now, row["id"]) for row in rows])
+            con.execute("COMMIT")
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+        finally:
+            con.close()
+        return [self._job(row) for row in rows]
+
+    def heartbeat(self, job_ids) -> None:
+        with self._connect() as con:
+            con.executemany("UPDATE jobs SET heartbeat = ? WHERE id = ? AND status = ?",
+                            [(time.time(), job_id, JOB_RUNNING) for job_id in job_ids])
+
+    def complete(self, job_id: int, baseline: dict, removal: dict) -> None:
+        """Store the baseline (if new) and the per-node results of a job and mark it done"""
+        job = self.get_job(job_id)
+        options_key = _canonical_json(job["options"])
+        with self._connect() as con:
+            self._store_baseline(con, job["fingerprint"], options_key, baseline)
+            con.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                            [(job_id, c, pack_array(removal['centralities'][c])) for c in job["centralities"]])
+            con.execute("UPDATE jobs SET status = ?, error = NULL, diameter_before = ?, diameter_after = ?, "
+                        "finished = ? WHERE id = ?",
+                        (JOB_DONE, baseline['diameter'], removal['diameter'], time.time(), job_id))
+
+    def fail(self, job_id: int, error: str) -> None:
+        with self._connect() as con:
+            con.execute("UPDATE jobs SET status = ?, error = ?, finished = ? WHERE id = ?",
+                        (JOB_FAILED, error, time.time(), job_id))
+
+    def resume(self, stale_after: float = STALE_AFTER) -> int:
+        """
+        Queue again the jobs interrupted by a worker that died (running, no recent heartbeat).
+
+        Returns:
+            Number of jobs queued again
+        """
+        with self._connect() as con:
+            cursor = con.execute("UPDATE jobs SET status = ?, started = NULL WHERE status = ? AND heartbeat < ?",
+                                 (JOB_QUEUED, JOB_RUNNING, time.time() - stale_after))
+            return cursor.rowcount
+
+    def load_result(self, job_id: int) -> dict:
+        """
+        Reopen a finished job without recomputing it.
+
+        Returns:
+            dict with 'job', 'graph' (the stored graph), 'removed_nodes' (ids in it),
+            'baseline' and 'removal', ready for CentralityAnalysisService.build_table
+        """
+        job = self.get_job(job_id)
+        if job["status"] != JOB_DONE:
+            raise ValueError(f"Job {job_id} is {job['status']}, not {JOB_DONE}")
+
+        G = self.load_graph(job["fingerprint"])
+        baseline = self.load_baseline(job["fingerprint"], job["centralities"], job["options"])
+        with self._connect() as con:
+            rows = con.execute("SELECT centrality, data FROM results WHERE job_id = ?", (job_id,)).fetchall()
+        if baseline is None or len(rows) != len(job["centralities"]):
+            raise ValueError(f"Stored results of job {job_id} are incomplete")
+
+        removal = {
+            'centralities': {row["centrality"]: unpack_array(row["data"]) for row in rows},
+            'diameter': job["diameter_after"],
+        }
+        return {
+            "job": job,
+            "graph": G,
+            "removed_nodes": node_ids(G, job["removed"]),
+            "baseline": baseline,
+            "removal": removal,
+        }
+
+
+def job_task(G: nx.Graph, removed_nodes, selected_centralities, baseline: Optional[dict]) -> tuple[dict, dict]:
+    """Worker task: (baseline, removal) of one job; the baseline is only computed if not given"""
+    from src.models.centrality_service import CentralityAnalysisService
+
+    service = CentralityAnalysisService()
+    if baseline is None:
+        baseline = service.compute_baseline(G, selected_centralities)
+    removal = service.compute_removal(G, removed_nodes, selected_centralities) if removed_nodes else baseline
+    return baseline, removal
+
+
+class JobWorker:
+    """
+    Executes queued jobs of a JobStore on an AnalysisPool.
+
+    Several workers (threads or processes) can serve the same store; jobs are
+    claimed atomically. Stored baselines are reused, so jobs on a graph that was
+    analyzed before only compute the post-removal centralities.
+    """
+
+    def __init__(self, store: JobStore, max_workers: Optional[int] = None):
+        self.store = store
+        self.max_workers = max_workers
+
+    def run(self, stop_when_idle: bool = True, poll_interval: float = 1.0, progress=None) -> int:
+        """
+        Process queued jobs.
+
+        Args:
+            stop_when_idle: Return once the queue is empty instead of polling for new jobs
+            poll_interval: Seconds between queue polls while idle
+            progress: Optional callable(job, status) invoked when a job finishes
+
+        Returns:
+            Number of jobs processed
+        """
+        processed = 0
+        running = {}  # future -> job
+        graphs = {}   # pool key -> stored graph
+
+        with AnalysisPool(self.max_workers) as pool:
+            while True:
+                for job in self.store.claim(pool.max_workers - len(running)):
+                    try:
+                        key = ("job-graph", job["fingerprint"])
+                        G = graphs.get(key)
+                        if G is None:
+                            G = self.store.load_graph(job["fingerprint"])
+                            pool.register_graph(key, G)
+                            graphs[key] = G
+                        removed = node_ids(G, job["removed"])
+                        baseline = self.store.load_baseline(job["fingerprint"], job["centralities"], job["options"])
+                        future = pool.submit(job_task, key, removed, job["centralities"], baseline)
+                        running[future] = job
+                    except Exception as e:
+                        self._finish(job, error=str(e), progress=progress)
+                        processed += 1
+
+                if not running:
+                    if stop_when_idle:
+                        return processed
+                    time.sleep(poll_interval)
+                    continue
+
+                done, _ = wait(list(running), timeout=HEARTBEAT_INTERVAL, return_when=FIRST_COMPLETED)
+                self.store.heartbeat([job["id"] for job in running.values()])
+                for future in done:
+                    job = running.pop(future)
+                    try:
+                        baseline, removal = future.result()
+                        self.store.complete(job["id"], baseline, removal)
+                        self._finish(job, progress=progress)
+                    except Exception as e:
+                        self._finish(job, error=str(e), progress=progress)
+                    processed += 1
+
+    def _finish(self, job: dict, error: Optional[str] = None, progress=None) -> None:
+        if error is not None:
+            self.store.fail(job["id"], error)
+        if progress is not None:
+            progress(job, JOB_FAILED if error is not None else JOB_DONE)
+
+
+def start_worker(store: JobStore, max_workers: Optional[int] = None):
+    """
+    Start a background worker that processes the queue until it is empty.
+
+    The worker runs as a detached process ('python -m src jobs work'), so queued
+    jobs keep running after the GUI is closed. Frozen builds cannot start the
+    module that way and use a daemon thread instead.
+
+    Returns:
+        The subprocess.Popen or threading.Thread running the worker
+    """
+    if getattr(sys, "frozen", False):
+        thread = threading.Thread(target=JobWorker(store, max_workers).run, daemon=True)
+        thread.start()
+        return thread
+
+    command = [sys.executable, "-m", "src", "jobs", "work", "--db", store.path]
+    if max_workers:
+        command += ["--workers", str(max_workers)]
+    kwargs = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+    return subprocess.Popen(command, cwd=REPO_ROOT, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL, **kwargs)
+
+
+def worker_alive(worker) -> bool:
+    """Whether a worker returned by start_worker is still running"""
+    if worker is None:
+        return False
+    if isinstance(worker, threading.Thread):
+        return worker.is_alive()
+    return worker.poll() is None
+
+
+def describe_removed(job: dict, limit: int = 5) -> str:
+    """Short display form of a job's removal set"""
+    removed = job["removed"]
+    if not removed:
+        return "(none)"
+    text = ", ".join(removed[:limit])
+    return text + f", ... (+{len(removed) - limit})" if len(removed) > limit else text
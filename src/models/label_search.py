@@ -0,0 +1,123 @@
+"""
+Case-insensitive search over node labels, for filtering large node lists as the user types.
+
+Prefix matches come from a sorted array of the lowercase labels (two binary
+searches). Substring matches of at least NGRAM_SIZE characters intersect the
+posting lists of the term's n-grams and only check the remaining candidates;
+shorter terms scan the labels.
+"""
+from bisect import bisect_left
+from typing import Iterable, Sequence
+
+import numpy as np
+
+# Length of the n-grams indexed for substring search
+NGRAM_SIZE = 3
+
+# Sorts after any character, so term + _MAX_CHAR bounds the labels starting with term
+_MAX_CHAR = "\U0010ffff"
+
+# Bits per code point when packing an n-gram into one integer key (Unicode needs 21)
+_CODE_BITS = 21
+
+
+class LabelSearchIndex:
+    """
+    Search index over a list of labels.
+
+    Results are positions in the list: labels starting with the term first, then
+    the other labels containing it, each in list order. The n-gram index is built
+    on the first substring search that can use it.
+    """
+
+    def __init__(self, labels: Sequence[str]):
+        self.labels = list(labels)
+        self._lower = [label.lower() for label in self.labels]
+        self._by_lower = np.array(sorted(range(len(self._lower)), key=self._lower.__getitem__), dtype=np.int64)
+        self._sorted_lower = [self._lower[i] for i in self._by_lower]
+        self._positions = {label: i for i, label in enumerate(self.labels)}
+        # n-gram keys (sorted), the start of each key's postings, and the postings:
+        # positions of the labels containing the n-gram
+        self._gram_keys = None
+        self._gram_starts = None
+        self._gram_postings = None
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def positions(self, labels: Iterable[str]) -> list[int]:
+        """Positions of the given labels that are in the index"""
+        return [self._positions[label] for label in labels if label in self._positions]
+
+    def search(self, term: str) -> np.ndarray:
+        """Positions of the labels containing term (case-insensitive), prefix matches first"""
+        term = term.lower()
+        if not term:
+            return np.arange(len(self.labels))
+
+        low = bisect_left(self._sorted_lower, term)
+        high = bisect_left(self._sorted_lower, term + _MAX_CHAR, low)
+        prefix = np.sort(self._by_lower[low:high])
+
+        lower = self._lower
+        if len(term) < NGRAM_SIZE:
+            candidates = range(len(lower))
+        else:
+            candidates = self._ngram_candidates(term)
+        contains = np.array([i for i in candidates if term in lower[i] and not lower[i].startswith(term)],
+                            dtype=np.int64)
+        return np.concatenate([prefix, np.sort(contains)])
+
+    def _ngram_candidates(self, term: str) -> np.ndarray:
+        """Positions of the labels containing every n-gram of term"""
+        if self._gram_keys is None:
+            self._build_ngrams()
+        postings = []
+        for key in np.unique(_gram_keys(_code_points(term))):
+            i = int(np.searchsorted(self._gram_keys, key))
+            if i == len(self._gram_keys) or self._gram_keys[i] != key:
+                return np.empty(0, dtype=np.int64)
+            postings.append(self._gram_postings[self._gram_starts[i]:self._gram_starts[i + 1]])
+        postings.sort(key=len)
+        candidates = postings[0]
+        for posting in postings[1:]:
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+        return candidates
+
+    def _build_ngrams(self) -> None:
+        """Index the n-grams of all labels with array operations on their code points"""
+        # All labels in one array of code points, each followed by a 0 separator
+        codes = _code_points("\0".join(self._lower) + "\0")
+        lengths = np.fromiter(map(len, self._lower), dtype=np.int64, count=len(self._lower))
+        owner = np.repeat(np.arange(len(lengths)), lengths + 1)[:len(codes) - NGRAM_SIZE + 1]
+        keys = _gram_keys(codes)
+
+        # Drop n-grams spanning a separator
+        spanning = (np.flatnonzero(codes == 0)[:, None] - np.arange(NGRAM_SIZE)).ravel()
+        valid = np.ones(len(keys), dtype=bool)
+        valid[spanning[(spanning >= 0) & (spanning < len(keys))]] = False
+        keys, owner = keys[valid], owner[valid]
+
+        # Sort by n-gram, then label, and keep each (n-gram, label) pair once
+        order = np.lexsort((owner, keys))
+        keys, owner = keys[order], owner[order]
+        first = np.ones(len(keys), dtype=bool)
+        first[1:] = (keys[1:] != keys[:-1]) | (owner[1:] != owner[:-1])
+        keys, owner = keys[first], owner[first]
+
+        self._gram_keys, starts = np.unique(keys, return_index=True)
+        self._gram_starts = np.append(starts, len(keys))
+        self._gram_postings = owner
+
+
+def _code_points(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+
+
+def _gram_keys(codes: np.ndarray) -> np.ndarray:
+    """Integer key of the n-gram starting at each position of a code point array"""
+    count = len(codes) - NGRAM_SIZE + 1
+    keys = np.zeros(max(count, 0), dtype=np.uint64)
+    for offset in range(NGRAM_SIZE):
+        keys = (keys << np.uint64(_CODE_BITS)) | codes[offset:offset + count]
+    return keys
@@ -1,18 +1,172 @@
+"""
+Layout positions shared by the preview and the analysis plots.
+
+Layouts are stored as a node array and an (n, 2) position array, kept in an LRU
+bounded by the bytes of those arrays. With a directory, layouts are also written
+to disk as .npz files (the directory is bounded the same way, by file size), so
+reopening a network reuses its layout after a restart.
+
+Keys are tuples of strings, e.g. (graph_cache_key(G), layout_type); the file
+name is a hash of the key, so keys must be stable across processes.
+"""
+import hashlib
+import os
+import tempfile
+import zipfile
+from collections import OrderedDict
 from typing import Any, Optional
 
+import numpy as np
+
+# Environment variable overriding the default layout directory
+LAYOUT_DIR_ENV = "GCA_LAYOUT_DIR"
+
+# Bytes of position data kept in memory (about 10M nodes)
+MEMORY_LIMIT_BYTES = 256 * 1024 ** 2
+
+# Bytes of layout files kept on disk
+DISK_LIMIT_BYTES = 1024 ** 3
+
+_FILE_SUFFIX = ".npz"
+
+
+def default_layout_dir() -> str:
+    """Layout directory: $GCA_LAYOUT_DIR or ~/.graph-centrality-analysis/layouts"""
+    return os.environ.get(LAYOUT_DIR_ENV) or os.path.join(
+        os.path.expanduser("~"), ".graph-centrality-analysis", "layouts")
+
 
 class LayoutCache:
-    def __init__(self):
-        self._cache = {}
+    def __init__(self, directory: Optional[str] = None, memory_limit: int = MEMORY_LIMIT_BYTES,
+                 disk_limit: int = DISK_LIMIT_BYTES):
+        """
+        Args:
+            directory: Directory in which layouts are persisted (default: memory only)
+            memory_limit: Bytes of position data kept in memory
+            disk_limit: Bytes of layout files kept in the directory
+        """
+        self.directory = directory
+        self.memory_limit = memory_limit
+        self.disk_limit = disk_limit
+        # key -> (nodes, xy), least recently used first
+        self._cache = OrderedDict()
+        self._bytes = 0
 
-    def get(self, key) -> Optional[dict[Any, tuple[float, float]]]:
-        return self._cache.get(key)
+    def get(self, key) -> Optional[dict[Any, np.ndarray]]:
+        """Positions of a cached layout (node -> array([x, y])), or None"""
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+        else:
+            entry = self._read(key)
+            if entry is None:
+                return None
+            self._remember(key, entry)
+        nodes, xy = entry
+        return dict(zip(nodes.tolist(), xy))
 
-    def set(self, key, value) -> None:
-        self._cache[key] = value
+    def set(self, key, value: dict[Any, Any]) -> None:
+        """Cache the positions of a layout (node -> (x, y))"""
+        nodes = np.array(list(value.keys()))
+        xy = np.array([value[n] for n in value.keys()], dtype=float).reshape(-1, 2)
+        entry = (nodes, xy)
+        self._remember(key, entry)
+        self._write(key, entry)
 
     def clear(self) -> None:
-        """Clear all cached layouts"""
+        """Clear all cached layouts, in memory and on disk"""
         self._cache.clear()
+        self._bytes = 0
+        for path, _size, _mtime in self._files():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _remember(self, key, entry: tuple[np.ndarray, np.ndarray]) -> None:
+        old = self._cache.pop(key, None)
+        if old is not None:
+            self._bytes -= _entry_bytes(old)
+        self._cache[key] = entry
+        self._bytes += _entry_bytes(entry)
+        # The newest entry is kept even if it alone exceeds the limit
+        while self._bytes > self.memory_limit and len(self._cache) > 1:
+            _, evicted = self._cache.popitem(last=False)
+            self._bytes -= _entry_bytes(evicted)
+
+    def _path(self, key) -> str:
+        name = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + _FILE_SUFFIX)
+
+    def _read(self, key) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                # The key is stored as well, to rule out hash collisions
+                if str(data["key"]) != repr(key):
+                    return None
+                entry = (data["nodes"], data["xy"])
+            # Touch the file, so disk eviction is least recently used as well
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            # Damaged file (e.g. from an interrupted write); recompute the layout
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return entry
+
+    def _write(self, key, entry: tuple[np.ndarray, np.ndarray]) -> None:
+        nodes, xy = entry
+        # Only interned (integer) node ids are persisted; other labels would need pickling
+        if self.directory is None or nodes.dtype.kind not in "iu":
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Written to a temporary file and renamed, so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, key=np.array(repr(key)), nodes=nodes, xy=xy)
+            os.replace(tmp_path, self._path(key))
+            self._prune_disk()
+        except OSError:
+            # Persistence is best-effort; the layout stays cached in memory
+            pass
+
+    def _files(self) -> list[tuple[str, int, float]]:
+        """(path, size, mtime) of the layout files in the directory"""
+        if self.directory is None:
+            return []
+        files = []
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(_FILE_SUFFIX):
+                        stat = entry.stat()
+                        files.append((entry.path, stat.st_size, stat.st_mtime))
+        except OSError:
+            return []
+        return files
+
+    def _prune_disk(self) -> None:
+        """Delete the least recently used layout files beyond the disk limit"""
+        files = sorted(self._files(), key=lambda file: file[2])
+        total = sum(size for _path, size, _mtime in files)
+        for path, size, _mtime in files[:-1]:
+            if total <= self.disk_limit:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
 
 
+def _entry_bytes(entry: tuple[np.ndarray, np.ndarray]) -> int:
+    nodes, xy = entry
+    return nodes.nbytes + xy.nbytes
@@ -0,0 +1,670 @@
+"""
+Multilevel force-directed layout for large graphs.
+
+The scheme is Yifan Hu's (sfdp), applied to each connected component:
+- Coarsening: the graph is repeatedly contracted by matching neighbors (heavy
+  edge matching, proposed and accepted for all nodes at once), until it has at
+  most COARSEST_SIZE nodes or stops shrinking
+- Initialization: the coarsest graph is placed with a spectral layout, the two
+  leading nontrivial eigenvectors of its (regularized) normalized adjacency,
+  computed with a sparse eigensolver
+- Refinement: from the coarsest to the original graph, positions are copied
+  from the clusters to their members and improved by force-directed steps with
+  an adaptive step length
+- Packing: the component layouts are arranged in rows, so small components and
+  isolated nodes don't drift away from the large ones
+
+Attraction follows the edges (d² / K); repulsion between all pairs (K² / d) is
+approximated with a Barnes-Hut quadtree: the tree is built level by level from
+Morton codes of the positions and traversed for pairs of cells, so both are
+numpy operations over arrays instead of Python loops over nodes. A step costs
+O(m + n log n).
+
+incremental_layout derives the layout of a graph from the layout of a similar
+one (matched by node labels), relaxing only the nodes near the differences.
+
+The layout is deterministic for a seed. It stops early at the time budget; the
+budget is split over the components and levels in proportion to their size, so
+the coarse levels, which fix the global shape, are always laid out.
+"""
+import time
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+import networkx as nx
+from scipy.sparse import csr_array, diags
+from scipy.sparse.csgraph import breadth_first_order, connected_components
+
+from src.models.node_index import node_labels
+
+# Seconds a layout may take by default
+LAYOUT_TIME_BUDGET = 10.0
+
+# Graphs are coarsened until they have at most this many nodes
+COARSEST_SIZE = 50
+
+# Barnes-Hut opening criterion: two cells interact through their centers of mass
+# when the sum of their widths is below THETA times the distance of the centers
+BARNES_HUT_THETA = 1.0
+
+# Relative strength of the repulsion (C in Hu's model)
+REPULSION_STRENGTH = 0.2
+
+# Force-directed steps per level: many on the coarsest graph, whose layout is
+# random apart from the spectral start, few on the finer levels
+COARSEST_ITERATIONS = 300
+LEVEL_ITERATIONS = 30
+
+# Refinement of a level stops when the step length falls below this (in edge lengths)
+_MIN_STEP = 0.01
+
+# Cell pairs whose Barnes-Hut interactions are vectorized together (bounds the memory)
+_PAIR_CHUNK = 1 << 18
+
+# Incremental layouts: nodes within this many hops of a change are relaxed,
+# with this many force-directed steps
+INCREMENTAL_HOPS = 2
+INCREMENTAL_ITERATIONS = 30
+
+# Share of the nodes an incremental layout relaxes at most (besides the changed ones)
+INCREMENTAL_MAX_MOVABLE = 0.2
+
+# Incremental layouts need this share of the nodes to be unchanged (same label
+# and neighbors as in the base graph); otherwise the graph is laid out from scratch
+INCREMENTAL_MIN_SHARE = 0.5
+
+# Edge length the forces settle at: attraction d^2 equals repulsion C / d
+_EDGE_LENGTH = REPULSION_STRENGTH ** (1 / 3)
+
+# Components up to this size are placed on a circle instead of by forces
+_SMALL_COMPONENT = 5
+
+# Space between packed components, in edge lengths
+_COMPONENT_GAP = 2 * _EDGE_LENGTH
+
+# Quadtree leaves are split until they hold at most this many nodes, down to _MAX_DEPTH levels
+_LEAF_SIZE = 4
+_MAX_DEPTH = 30
+
+# Squared distance below which coincident nodes are treated as this close
+_MIN_DISTANCE2 = 1e-9
+
+# Coarsening stops when a level keeps more than this share of the nodes
+_MIN_REDUCTION = 0.9
+
+# Matching rounds per coarsening level (each matches a large share of the remaining nodes)
+_MATCHING_ROUNDS = 10
+
+# Below this many nodes, repulsion is computed exactly over all pairs
+_EXACT_REPULSION_SIZE = 500
+
+
+def multilevel_layout(G: nx.Graph, seed: int = 42, time_budget: float = LAYOUT_TIME_BUDGET,
+                      scale: float = 1.0) -> dict[Any, np.ndarray]:
+    """
+    Compute a force-directed layout with multilevel coarsening and Barnes-Hut forces.
+
+    Args:
+        G: Graph (directed graphs are laid out as undirected, weights are ignored)
+        seed: Random seed
+        time_budget: Seconds after which refinement stops and the current positions are returned
+        scale: Positions are rescaled to [-scale, scale], as in networkx layouts
+
+    Returns:
+        dict of node -> array([x, y])
+    """
+    start = time.monotonic()
+    nodes = list(G.nodes())
+    n = len(nodes)
+    if n == 0:
+        return {}
+
+    rng = np.random.default_rng(seed)
+    A = _adjacency(G, nodes)
+
+    # Components are laid out separately (each with a share of the budget by
+    # size) and packed, so they don't push each other apart
+    count, labels = connected_components(A, directed=False)
+    members = np.split(np.argsort(labels, kind="stable"), np.cumsum(np.bincount(labels))[:-1])
+    members.sort(key=len, reverse=True)
+    isolated = np.concatenate([m for m in members if len(m) == 1] or [np.zeros(0, dtype=np.int64)])
+    members = [m for m in members if len(m) > 1]
+
+    layouts = []
+    done = 0
+    for component in members:
+        done += len(component)
+        deadline = start + time_budget * done / n
+        layouts.append(_layout_component(A[component][:, component], rng, deadline))
+    if len(isolated):
+        # Isolated nodes are placed on a square grid, as one block
+        side = int(np.ceil(np.sqrt(len(isolated))))
+        grid = np.arange(len(isolated))
+        layouts.append(np.column_stack([grid % side, grid // side]) * _EDGE_LENGTH)
+        members.append(isolated)
+
+    x = np.empty((n, 2))
+    for component, xy in zip(members, _pack(layouts)):
+        x[component] = xy
+
+    x -= (x.max(axis=0) + x.min(axis=0)) / 2
+    extent = np.abs(x).max()
+    if extent > 0:
+        x *= scale / extent
+    return dict(zip(nodes, x))
+
+
+def _layout_component(A: csr_array, rng: np.random.Generator, deadline: float) -> np.ndarray:
+    """
+    Multilevel layout of a connected graph.
+
+    Returns:
+        (n, 2) array of positions, in units of the natural edge length
+    """
+    n = A.shape[0]
+    if n <= _SMALL_COMPONENT:
+        # Small components go on a circle, with neighbors in the order of a traversal
+        order = breadth_first_order(A, 0, directed=False, return_predecessors=False)
+        angle = 2 * np.pi * np.arange(n) / n
+        radius = _EDGE_LENGTH / (2 * np.sin(np.pi / n))
+        x = np.empty((n, 2))
+        x[order] = radius * np.column_stack([np.cos(angle), np.sin(angle)])
+        return x
+
+    start = time.monotonic()
+    budget = max(deadline - start, 0.0)
+
+    # levels[0] is the original graph; each level's cluster array maps its nodes
+    # to the nodes of the next, coarser level
+    adjacencies = [A]
+    masses = [np.ones(n)]
+    clusters = []
+    while adjacencies[-1].shape[0] > COARSEST_SIZE:
+        cluster, coarse_n = _match(adjacencies[-1], masses[-1], rng)
+        if coarse_n > _MIN_REDUCTION * adjacencies[-1].shape[0]:
+            break
+        adjacencies.append(_contract(adjacencies[-1], cluster, coarse_n))
+        masses.append(np.bincount(cluster, weights=masses[-1], minlength=coarse_n))
+        clusters.append(cluster)
+
+    x = _spectral_layout(adjacencies[-1], rng)
+    # Spectral coordinates have unit norm; spread them to the area the forces settle at
+    x *= np.sqrt(masses[-1].sum())
+
+    sizes = [a.shape[0] for a in adjacencies]
+    total = float(sum(sizes))
+    spent = 0.0
+    for level in range(len(adjacencies) - 1, -1, -1):
+        if level < len(adjacencies) - 1:
+            x = x[clusters[level]]
+            # Members of a cluster start on its position; jitter separates them
+            x = x + rng.normal(scale=0.1, size=x.shape)
+        spent += sizes[level] / total
+        iterations = COARSEST_ITERATIONS if level == len(adjacencies) - 1 else LEVEL_ITERATIONS
+        # The coarsest layout starts far from equilibrium; finer levels only need local moves
+        step = 0.1 * np.sqrt(masses[level].sum()) if level == len(adjacencies) - 1 else 1.0
+        x = _refine(adjacencies[level], masses[level], x, iterations, step, start + budget * spent)
+    return x
+
+
+def _pack(layouts: list[np.ndarray]) -> list[np.ndarray]:
+    """
+    Shelf packing: component layouts are placed in rows, tallest first, filling a roughly square area.
+
+    Returns:
+        The layouts, translated to their places
+    """
+    lows = [xy.min(axis=0) for xy in layouts]
+    boxes = [xy.max(axis=0) - low + _COMPONENT_GAP for xy, low in zip(layouts, lows)]
+    row_width = max(np.sqrt(sum(w * h for w, h in boxes)), max(w for w, _h in boxes))
+
+    placed = [None] * len(layouts)
+    cursor_x = cursor_y = row_height = 0.0
+    for i in sorted(range(len(layouts)), key=lambda i: -boxes[i][1]):
+        width, height = boxes[i]
+        if cursor_x > 0 and cursor_x + width > row_width:
+            cursor_x = 0.0
+            cursor_y += row_height
+            row_height = 0.0
+        placed[i] = layouts[i] - lows[i] + (cursor_x, cursor_y)
+        cursor_x += width
+        row_height = max(row_height, height)
+    return placed
+
+
+def incremental_layout(G: nx.Graph, base_graph: nx.Graph, base_pos: dict, seed: int = 42,
+                       hops: int = INCREMENTAL_HOPS,
+                       iterations: int = INCREMENTAL_ITERATIONS) -> Optional[dict[Any, np.ndarray]]:
+    """
+    Derive the layout of a graph from the layout of a similar one.
+
+    Nodes are matched by label, so the graphs may be interned to different ids
+    (e.g. a preview and the job store's copy of the same graph). Matched nodes
+    keep their base positions. Nodes that are new or whose neighbors changed,
+    and the nodes within `hops` of them (as long as that stays a small part of
+    the graph), are relaxed by a few force-directed steps; new nodes start at
+    the mean position of their placed neighbors.
+
+    Args:
+        G: Graph to lay out
+        base_graph: Graph that base_pos belongs to
+        base_pos: Positions of the nodes of base_graph
+        seed: Random seed (for new nodes without placed neighbors)
+        hops: Radius of the relaxed neighborhood around changed nodes
+        iterations: Force-directed steps
+
+    Returns:
+        dict of node -> array([x, y]), or None when fewer than
+        INCREMENTAL_MIN_SHARE of the nodes are unchanged (e.g. a regenerated
+        random graph), which are better laid out from scratch
+    """
+    nodes = list(G.nodes())
+    n = len(nodes)
+    if n == 0:
+        return {}
+    base_nodes = list(base_graph.nodes())
+    base_index = pd.Index(node_labels(base_graph, base_nodes))
+    # Position in base_nodes of each node of G, -1 for new nodes
+    match = base_index.get_indexer(node_labels(G, nodes)) if base_index.is_unique else np.full(n, -1)
+    placed = match >= 0
+    if placed.sum() < INCREMENTAL_MIN_SHARE * n:
+        return None
+
+    A = _adjacency(G, nodes)
+    B = _adjacency(base_graph, base_nodes)
+    # Nodes of G matched by each base node, -1 for base nodes that are gone
+    base_to_g = np.full(len(base_nodes), -1, dtype=np.int64)
+    base_to_g[match[placed]] = np.flatnonzero(placed)
+
+    # A node changed if its neighbors differ from its base neighbors: compare
+    # the neighbor counts and sums of hashed neighbor ids (in G's numbering;
+    # neighbors that are gone hash to distinct values above n)
+    g_hash = _neighbor_hash(A, np.arange(n))
+    b_targets = np.where(base_to_g >= 0, base_to_g, n + np.arange(len(base_nodes)))
+    b_hash = _neighbor_hash(B, b_targets)
+    b_degree = np.diff(B.indptr)
+    changed = ~placed
+    changed[placed] |= np.diff(A.indptr)[placed] != b_degree[match[placed]]
+    changed[placed] |= g_hash[placed] != b_hash[match[placed]]
+    if n - changed.sum() < INCREMENTAL_MIN_SHARE * n:
+        return None
+
+    x = np.zeros((n, 2))
+    base_xy = np.array([base_pos[v] for v in base_nodes], dtype=float).reshape(-1, 2)
+    x[placed] = base_xy[match[placed]]
+    if not changed.any():
+        return dict(zip(nodes, x))
+
+    # Work in the units the forces settle at. In equilibrium the virial of the
+    # forces vanishes: the attraction gives sum(d^3) over the edges, the
+    # repulsion C per pair of nodes, independently of the scale. This holds for
+    # any Fruchterman-Reingold-type base layout, whatever its normalization.
+    base_rows = np.repeat(np.arange(len(base_nodes)), np.diff(B.indptr))
+    cubes = (np.sqrt(((base_xy[base_rows] - base_xy[B.indices]) ** 2).sum(axis=1)) ** 3).sum() / 2
+    pairs = len(base_nodes) * (len(base_nodes) - 1) / 2
+    unit = float(np.cbrt(cubes / (REPULSION_STRENGTH * pairs))) if cubes > 0 else 1.0
+    x /= unit
+
+    # New nodes start at the mean of their placed neighbors, spreading outwards
+    rng = np.random.default_rng(seed)
+    known = placed.copy()
+    for _ in range(max(hops, 1) * 4):
+        if known.all():
+            break
+        counts = A @ known.astype(float)
+        sums = A @ (x * known[:, None])
+        fill = ~known & (counts > 0)
+        if not fill.any():
+            break
+        x[fill] = sums[fill] / counts[fill, None]
+        known |= fill
+    center = x[known].mean(axis=0) if known.any() else np.zeros(2)
+    x[~known] = center + rng.normal(scale=_EDGE_LENGTH, size=((~known).sum(), 2))
+    new = ~placed
+    x[new] += rng.normal(scale=0.1 * _EDGE_LENGTH, size=(new.sum(), 2))
+
+    # In small-world graphs a few hops reach most nodes; the neighborhood stops
+    # growing before it would exceed INCREMENTAL_MAX_MOVABLE of the graph
+    movable = changed.copy()
+    for _ in range(hops):
+        grown = movable | ((A @ movable.astype(float)) > 0)
+        if grown.sum() > INCREMENTAL_MAX_MOVABLE * n:
+            break
+        movable = grown
+    x = _refine(A, np.ones(n), x, iterations, _EDGE_LENGTH, np.inf, movable)
+    return dict(zip(nodes, x * unit))
+
+
+def _neighbor_hash(A: csr_array, targets: np.ndarray) -> np.ndarray:
+    """Per row of A: wrapping sum of the mixed target ids of its neighbors"""
+    mixed = pd.util.hash_array(targets.astype(np.int64)).astype(np.uint64)
+    rows = np.repeat(np.arange(A.shape[0]), np.diff(A.indptr))
+    sums = np.zeros(A.shape[0], dtype=np.uint64)
+    np.add.at(sums, rows, mixed[A.indices])
+    return sums
+
+
+def _adjacency(G: nx.Graph, nodes: list) -> csr_array:
+    """Symmetric 0/1 adjacency matrix without self-loops, in the order of nodes"""
+    position = {node: i for i, node in enumerate(nodes)}
+    edges = np.fromiter((position[w] for u, v in G.edges() for w in (u, v)),
+                        dtype=np.int64, count=2 * G.number_of_edges()).reshape(-1, 2)
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    n = len(nodes)
+    u = np.concatenate([edges[:, 0], edges[:, 1]])
+    v = np.concatenate([edges[:, 1], edges[:, 0]])
+    A = csr_array((np.ones(len(u)), (u, v)), shape=(n, n))
+    A.sum_duplicates()
+    A.data[:] = 1.0
+    return A
+
+
+def _match(A: csr_array, mass: np.ndarray, rng: np.random.Generator) -> tuple[np.ndarray, int]:
+    """
+    Heavy edge matching, done for all nodes at once.
+
+    In each round every unmatched node proposes to its unmatched neighbor with
+    the heaviest edge relative to the cluster sizes (ties broken randomly), and
+    mutual proposals are matched. The rounds continue until the matching is
+    (nearly) maximal; then every unmatched node joins the cluster of its best
+    neighbor, so stars and hubs shrink as well.
+
+    Returns:
+        (cluster id of each node, number of clusters)
+    """
+    n = A.shape[0]
+    rows = np.repeat(np.arange(n), np.diff(A.indptr))
+    cols = A.indices
+    score = A.data / (mass[rows] * mass[cols]) * (1.0 + 1e-3 * rng.random(len(cols)))
+
+    def proposals(r, c, s):
+        # The first entry of each row after sorting by (row, -score) is its proposal
+        order = np.lexsort((-s, r))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = r[order][1:] != r[order][:-1]
+        proposal = np.full(n, -1, dtype=np.int64)
+        proposal[r[order][first]] = c[order][first]
+        return r[order][first], proposal
+
+    partner = np.full(n, -1, dtype=np.int64)
+    for _ in range(_MATCHING_ROUNDS):
+        free = (partner[rows] < 0) & (partner[cols] < 0)
+        if not free.any():
+            break
+        proposers, proposal = proposals(rows[free], cols[free], score[free])
+        mutual = proposers[proposal[proposal[proposers]] == proposers]
+        if len(mutual) == 0:
+            break
+        partner[mutual] = proposal[mutual]
+
+    # The lower id of each pair names the cluster
+    representative = np.arange(n)
+    matched = partner >= 0
+    representative[matched] = np.minimum(np.arange(n)[matched], partner[matched])
+
+    # Unmatched nodes join the cluster of their best matched neighbor
+    to_matched = ~matched[rows] & matched[cols]
+    joiners, best = proposals(rows[to_matched], cols[to_matched], score[to_matched])
+    representative[joiners] = representative[best[joiners]]
+
+    _, cluster = np.unique(representative, return_inverse=True)
+    return cluster, int(cluster.max()) + 1
+
+
+def _contract(A: csr_array, cluster: np.ndarray, coarse_n: int) -> csr_array:
+    """Adjacency of the cluster graph: edge weights are summed, internal edges dropped"""
+    n = A.shape[0]
+    P = csr_array((np.ones(n), (np.arange(n), cluster)), shape=(n, coarse_n))
+    C = (P.T @ A @ P).tocsr()
+    C.setdiag(0)
+    C.eliminate_zeros()
+    return C
+
+
+def _spectral_layout(A: csr_array, rng: np.random.Generator) -> np.ndarray:
+    """
+    Spectral positions: the leading nontrivial eigenvectors of the normalized adjacency.
+
+    The adjacency is regularized with a complete graph of weight tau / n (tau the
+    mean degree), applied implicitly so the matrix stays sparse; this keeps
+    weakly connected parts from collapsing to a point and helps the solver
+    converge.
+
+    Returns:
+        (n, 2) array
+    """
+    # Imported on first use because scipy.sparse.linalg is slow to import
+    from scipy.sparse.linalg import LinearOperator, eigsh
+
+    n = A.shape[0]
+    if n <= 3:
+        return rng.normal(size=(n, 2))
+
+    degree = np.asarray(A.sum(axis=1)).ravel()
+    tau = max(degree.mean(), 1e-9)
+    inv_sqrt = 1.0 / np.sqrt(degree + tau)
+    D = diags(inv_sqrt)
+    N = D @ A @ D
+
+    def matvec(v):
+        v = np.asarray(v).ravel()
+        # (D^-1/2 (A + tau/n 11^T) D^-1/2) v
+        return N @ v + inv_sqrt * (tau / n) * np.dot(inv_sqrt, v)
+
+    operator = LinearOperator((n, n), matvec=matvec, dtype=float)
+    try:
+        # The eigenvector of the largest eigenvalue is the trivial one (~ sqrt(degree))
+        values, vectors = eigsh(operator, k=3, which="LA", v0=rng.random(n), maxiter=n * 20, tol=1e-4)
+        order = np.argsort(values)[::-1]
+        x = vectors[:, order[1:3]] * inv_sqrt[:, None]
+    except Exception:
+        # No convergence (e.g. highly symmetric graphs): the forces start from random positions
+        return rng.normal(size=(n, 2))
+
+    x /= np.maximum(np.abs(x).max(axis=0), 1e-12)
+    # Nodes with equal coordinates (e.g. symmetric neighbors) are separated by the jitter
+    return x + rng.normal(scale=1e-3, size=x.shape)
+
+
+def _refine(A: csr_array, mass: np.ndarray, x: np.ndarray, iterations: int, step: float,
+            deadline: float, movable: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Force-directed steps with Hu's adaptive step length.
+
+    Each node moves by the step length in the direction of its force; the step
+    grows while the energy keeps decreasing and shrinks otherwise. With a
+    movable mask, the other nodes keep their positions (but still exert forces).
+    """
+    n = len(x)
+    if n < 2:
+        return x
+    rows = np.repeat(np.arange(n), np.diff(A.indptr))
+    cols = A.indices
+    weights = A.data
+
+    energy = np.inf
+    progress = 0
+    for iteration in range(iterations):
+        # At least a few steps per level, so every level is smoothed
+        if iteration >= 5 and time.monotonic() >= deadline:
+            break
+
+        force = _repulsion(x, mass)
+        # Attraction along the edges: d^2 / K with K = 1, weighted by the edge multiplicity
+        delta = x[cols] - x[rows]
+        distance = np.sqrt((delta ** 2).sum(axis=1))
+        pull = delta * (weights * distance)[:, None]
+        force[:, 0] += np.bincount(rows, weights=pull[:, 0], minlength=n)
+        force[:, 1] += np.bincount(rows, weights=pull[:, 1], minlength=n)
+
+        if movable is not None:
+            force[~movable] = 0.0
+        magnitude = np.sqrt((force ** 2).sum(axis=1))
+        moving = magnitude > 0
+        x[moving] += step * force[moving] / magnitude[moving, None]
+
+        new_energy = float((magnitude ** 2).sum())
+        if new_energy < energy:
+            progress += 1
+            if progress >= 5:
+                progress = 0
+                step /= 0.9
+        else:
+            progress = 0
+            step *= 0.9
+        energy = new_energy
+
+        if step < _MIN_STEP:
+            break
+    return x
+
+
+def _morton(q: np.ndarray) -> np.ndarray:
+    """Interleave the bits of two uint64 coordinate columns (up to 32 bits each)"""
+    def spread(v):
+        v = v & np.uint64(0xFFFFFFFF)
+        v = (v | (v << np.uint64(16))) & np.uint64(0x0000FFFF0000FFFF)
+        v = (v | (v << np.uint64(8))) & np.uint64(0x00FF00FF00FF00FF)
+        v = (v | (v << np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+        v = (v | (v << np.uint64(2))) & np.uint64(0x3333333333333333)
+        v = (v | (v << np.uint64(1))) & np.uint64(0x5555555555555555)
+        return v
+    return spread(q[:, 0]) | (spread(q[:, 1]) << np.uint64(1))
+
+
+def _repulsion(x: np.ndarray, mass: np.ndarray, theta: float = BARNES_HUT_THETA) -> np.ndarray:
+    """
+    Repulsive forces C K^2 m_i m_j / d between all pairs, by Barnes-Hut.
+
+    The quadtree has `depth` levels over the bounding square. The cells of a
+    level are the distinct prefixes of the nodes' Morton codes; with the nodes
+    sorted by code, each cell is a contiguous run of nodes, so cell masses and
+    centers are reduceat sums and the children of a cell are a contiguous range
+    of the next level's cells.
+
+    The tree is traversed for pairs of cells of the same level (the dual-tree
+    form of Barnes-Hut): two cells that are far apart relative to their width
+    interact through their centers of mass, and the field is passed down to
+    every node of the cell; other pairs are split into the pairs of their
+    children. Leaf cells hold at most _LEAF_SIZE nodes; their remaining pairs are
+    computed node by node. Pairs are processed in chunks of _PAIR_CHUNK, which
+    bounds the memory.
+
+    Returns:
+        (n, 2) array of forces
+    """
+    n = len(x)
+    if n <= _EXACT_REPULSION_SIZE:
+        delta = x[:, None, :] - x[None, :, :]
+        dist2 = (delta ** 2).sum(axis=2)
+        np.fill_diagonal(dist2, np.inf)
+        dist2 = np.maximum(dist2, _MIN_DISTANCE2)
+        scale = REPULSION_STRENGTH * mass[:, None] * mass[None, :] / dist2
+        return (delta * scale[:, :, None]).sum(axis=1)
+
+    lo = x.min(axis=0)
+    span = float((x.max(axis=0) - lo).max()) or 1.0
+    q = np.clip(((x - lo) / span * (1 << _MAX_DEPTH)).astype(np.int64), 0, (1 << _MAX_DEPTH) - 1)
+    code = _morton(q.astype(np.uint64))
+    order = np.argsort(code, kind="stable")
+    code = code[order]
+    px, py = x[order, 0], x[order, 1]
+    ms = mass[order]
+
+    # Deep enough that leaf cells hold at most _LEAF_SIZE nodes, even where the
+    # nodes are dense (e.g. a large component next to far-away small ones)
+    depth = int(np.clip(np.ceil(np.log(n / _LEAF_SIZE) / np.log(4)), 2, _MAX_DEPTH))
+    while depth < _MAX_DEPTH:
+        prefix = code >> np.uint64(2 * (_MAX_DEPTH - depth))
+        starts = np.flatnonzero(np.r_[True, prefix[1:] != prefix[:-1]])
+        if np.diff(np.r_[starts, n]).max() <= _LEAF_SIZE:
+            break
+        depth += 1
+    code = code >> np.uint64(2 * (_MAX_DEPTH - depth))
+
+    # Per level: cell codes, masses, centers of mass and the first node of each cell
+    cell_code, cell_mass, cell_x, cell_y, cell_start = [], [], [], [], []
+    for level in range(depth + 1):
+        prefix = code >> np.uint64(2 * (depth - level))
+        starts = np.flatnonzero(np.r_[True, prefix[1:] != prefix[:-1]])
+        m = np.add.reduceat(ms, starts)
+        cell_code.append(prefix[starts])
+        cell_mass.append(m)
+        cell_x.append(np.add.reduceat(px * ms, starts) / m)
+        cell_y.append(np.add.reduceat(py * ms, starts) / m)
+        cell_start.append(np.r_[starts, n])
+
+    # Children of each cell: a contiguous range of the next level's cells
+    child_start, child_count = [], []
+    for level in range(depth):
+        parents = cell_code[level + 1] >> np.uint64(2)
+        first = np.searchsorted(parents, cell_code[level], side="left")
+        child_start.append(first)
+        child_count.append(np.searchsorted(parents, cell_code[level], side="right") - first)
+
+    # Field (force per unit mass) received by the cells of each level
+    field_x = [np.zeros(len(m)) for m in cell_mass]
+    field_y = [np.zeros(len(m)) for m in cell_mass]
+    node_fx = np.zeros(n)
+    node_fy = np.zeros(n)
+
+    work = [(0, np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64))]
+    while work:
+        level, a, b = work.pop()
+        dx = cell_x[level][a] - cell_x[level][b]
+        dy = cell_y[level][a] - cell_y[level][b]
+        dist2 = dx * dx + dy * dy
+        width = span / (1 << level)
+        accept = (a != b) & (4 * width * width < theta * theta * dist2)
+        if accept.any():
+            scale = cell_mass[level][b[accept]] / dist2[accept]
+            count = len(field_x[level])
+            field_x[level] += np.bincount(a[accept], weights=dx[accept] * scale, minlength=count)
+            field_y[level] += np.bincount(a[accept], weights=dy[accept] * scale, minlength=count)
+
+        a, b = a[~accept], b[~accept]
+        if len(a) == 0:
+            continue
+        if level == depth:
+            _leaf_repulsion(a, b, cell_start[depth], px, py, ms, node_fx, node_fy)
+            continue
+        # Every child of a with every child of b
+        a, b = _expand(a, b, child_start[level], child_count[level])
+        b, a = _expand(b, a, child_start[level], child_count[level])
+        for chunk in range(0, len(a), _PAIR_CHUNK):
+            work.append((level + 1, a[chunk:chunk + _PAIR_CHUNK], b[chunk:chunk + _PAIR_CHUNK]))
+
+    # Pass the cell fields down to the nodes: each node gets the fields of its cells at every level
+    for level in range(depth + 1):
+        sizes = np.diff(cell_start[level])
+        node_fx += np.repeat(field_x[level], sizes)
+        node_fy += np.repeat(field_y[level], sizes)
+
+    force = np.empty((n, 2))
+    force[order, 0] = REPULSION_STRENGTH * ms * node_fx
+    force[order, 1] = REPULSION_STRENGTH * ms * node_fy
+    return force
+
+
+def _expand(a: np.ndarray, b: np.ndarray, start: np.ndarray, count: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Replace each pair (a, b) by the pairs (child of a, b)"""
+    counts = count[a]
+    b = np.repeat(b, counts)
+    # Child index = start of the range + position within the range
+    offsets = np.arange(len(b)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(start[a], counts) + offsets, b
+
+
+def _leaf_repulsion(a: np.ndarray, b: np.ndarray, cell_start: np.ndarray, px: np.ndarray, py: np.ndarray,
+                    ms: np.ndarray, node_fx: np.ndarray, node_fy: np.ndarray) -> None:
+    """Add the exact forces per unit mass between the nodes of leaf cell pairs (a, b)"""
+    i, j = _expand(a, b, cell_start[:-1], np.diff(cell_start))
+    j, i = _expand(j, i, cell_start[:-1], np.diff(cell_start))
+    distinct = i != j
+    i, j = i[distinct], j[distinct]
+    dx = px[i] - px[j]
+    dy = py[i] - py[j]
+    scale = ms[j] / np.maximum(dx * dx + dy * dy, _MIN_DISTANCE2)
+    node_fx += np.bincount(i, weights=dx * scale, minlength=len(node_fx))
+    node_fy += np.bincount(i, weights=dy * scale, minlength=len(node_fy))
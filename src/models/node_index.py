@@ -0,0 +1,163 @@
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+import networkx as nx
+
+
+# Key under which the label table is stored in G.graph
+NODE_INDEX_KEY = "node_index"
+
+# Key of the cached fingerprints (see graph_fingerprint), which relabeling invalidates
+FINGERPRINT_KEY = "_fingerprint"
+
+
+class NodeIndex:
+    """
+    Label table that interns node labels to contiguous integer ids.
+
+    Graphs produced by GraphLoader and the random graph generators use the ids
+    as networkx nodes, so every model works on small ints. Labels (always strings)
+    are only looked up at the UI and export edges.
+    """
+
+    def __init__(self, labels: Iterable = ()):
+        self._labels: list[str] = []
+        self._ids: dict[str, int] = {}
+        for label in labels:
+            self.intern(label)
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __contains__(self, label) -> bool:
+        return str(label) in self._ids
+
+    @property
+    def labels(self) -> list[str]:
+        """All labels, positioned by id"""
+        return self._labels
+
+    def intern(self, label) -> int:
+        """Return the id of a label, assigning the next free id if it is new"""
+        label = str(label)
+        node_id = self._ids.get(label)
+        if node_id is None:
+            node_id = len(self._labels)
+            self._ids[label] = node_id
+            self._labels.append(label)
+        return node_id
+
+    def intern_array(self, labels) -> np.ndarray:
+        """
+        Intern an array of labels in one pass.
+
+        Each distinct label is hashed once through pandas' factorization, so the
+        cost is dominated by the vectorized factorize rather than per-row lookups.
+
+        Args:
+            labels: Array-like of labels
+
+        Returns:
+            int32 array of ids, aligned with the input
+        """
+        codes, uniques = pd.factorize(np.asarray(labels), use_na_sentinel=False)
+        unique_ids = np.fromiter((self.intern(u) for u in uniques), dtype=np.int32, count=len(uniques))
+        return unique_ids[codes]
+
+    def id_of(self, label) -> int:
+        """Return the id of a label, raising KeyError if the label is unknown"""
+        return self._ids[str(label)]
+
+    def get_id(self, label, default: Optional[int] = None) -> Optional[int]:
+        """Return the id of a label, or default if the label is unknown"""
+        return self._ids.get(str(label), default)
+
+    def ids_of(self, labels: Iterable) -> list[int]:
+        """Return the ids of several labels, raising KeyError on unknown labels"""
+        return [self._ids[str(label)] for label in labels]
+
+    def label_of(self, node_id: int) -> str:
+        """Return the label of an id"""
+        return self._labels[node_id]
+
+    def labels_of(self, node_ids: Iterable[int]) -> list[str]:
+        """Return the labels of several ids"""
+        labels = self._labels
+        return [labels[i] for i in node_ids]
+
+
+def get_node_index(G: nx.Graph) -> Optional[NodeIndex]:
+    """Return the label table attached to a graph, if any"""
+    return G.graph.get(NODE_INDEX_KEY)
+
+
+def intern_graph(G: nx.Graph, label_attribute: Optional[str] = None) -> nx.Graph:
+    """
+    Relabel a graph with arbitrary node keys to contiguous integer ids.
+
+    Args:
+        G: Input graph
+        label_attribute: Node attribute holding the label; defaults to the node key
+
+    Returns:
+        The graph with integer nodes and its NodeIndex in G.graph["node_index"].
+        Graphs whose nodes already are 0..n-1 are returned without copying.
+    """
+    index = NodeIndex()
+    mapping = {}
+    for node, attrs in G.nodes(data=True):
+        label = attrs.get(label_attribute, node) if label_attribute else node
+        mapping[node] = index.intern(label)
+
+    if any(node != node_id for node, node_id in mapping.items()):
+        G = nx.relabel_nodes(G, mapping, copy=True)
+    G.graph.pop(FINGERPRINT_KEY, None)
+    G.graph[NODE_INDEX_KEY] = index
+    return G
+
+
+def node_labels(G: nx.Graph, nodes: Iterable) -> list[str]:
+    """
+    Materialize the labels of graph nodes for display or export.
+
+    Falls back to str(node) for graphs that were not interned.
+    """
+    index = get_node_index(G)
+    if index is None:
+        return [str(n) for n in nodes]
+    return index.labels_of(nodes)
+
+
+def node_ids(G: nx.Graph, labels: Iterable) -> list:
+    """
+    Resolve labels (e.g. selected in the UI) to graph nodes.
+
+    Raises:
+        ValueError: If a label is not part of the graph
+    """
+    index = get_node_index(G)
+    if index is None:
+        by_label = {str(n): n for n in G.nodes()}
+        lookup = by_label.get
+    else:
+        lookup = index.get_id
+
+    nodes = []
+    for label in labels:
+        node = lookup(str(label))
+        if node is None or node not in G:
+            raise ValueError(f"Node '{label}' is not in the graph")
+        nodes.append(node)
+    return nodes
+
+
+def relabel_to_labels(G: nx.Graph) -> nx.Graph:
+    """Return a copy of an interned graph whose nodes are the original labels"""
+    index = get_node_index(G)
+    if index is None:
+        return G.copy()
+    H = nx.relabel_nodes(G, {n: index.label_of(n) for n in G.nodes()}, copy=True)
+    H.graph.pop(NODE_INDEX_KEY, None)
+    H.graph.pop(FINGERPRINT_KEY, None)
+    return H
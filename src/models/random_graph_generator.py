@@ -1,58 +1,553 @@
+"""
+Random graph generators.
+
+The generators work on edge arrays and emit the symmetric adjacency matrix as
+CSR (scipy.sparse.csr_array) directly, so million-node benchmark graphs are
+created in seconds without building Python objects per edge:
+- Erdős-Rényi G(n, p): geometric skipping over the candidate pairs
+  (Batagelj & Brandes), O(n + m) instead of O(n²)
+- Barabási-Albert: preferential attachment by copying a random endpoint of the
+  edges created so far, resolved for all nodes at once by pointer jumping and
+  a fixed-point iteration
+- Watts-Strogatz: ring lattice with all rewirings drawn at once and conflicting
+  ones (self-loops, duplicate edges) drawn again
+- Stochastic block model: communities with dense edges inside and sparse edges
+  between them, both drawn by geometric skipping
+- Configuration model: a power-law degree sequence (or a given one) with the
+  edge stubs matched by one random permutation
+- Holme-Kim: preferential attachment with triangle formation (heavy tail and
+  high clustering); its triad steps depend on every earlier step, so it runs as
+  a tight loop over preallocated random numbers
+- Random geometric: points in the unit square joined within a radius, found
+  with a k-d tree
+
+The models are the ones of the networkx generators (the same initial star of
+Barabási-Albert, distinct targets per new node, rewiring that never creates
+self-loops or parallel edges, ...), so the degree distributions match. A seed gives
+the same graph on every platform, but not the same graph as networkx.
+"""
+from typing import Optional
+
+import numpy as np
 import networkx as nx
+from scipy.sparse import csr_array
+
+from src.models.graph_type_names import GRAPH_TYPE_DISPLAY_NAMES, GRAPH_TYPE_KEYS
+from src.models.node_index import NODE_INDEX_KEY, NodeIndex
+
+# Rewiring attempts per Watts-Strogatz edge before it is left in place (only
+# reached when a node is connected to (almost) all others, as in networkx)
+_MAX_REWIRE_ATTEMPTS = 100
+
+
+# Triangle formation probability of Holme-Kim graphs
+HOLME_KIM_TRIAD_PROBABILITY = 0.5
+
+# Share of the stochastic block model edges inside communities
+SBM_INTERNAL_SHARE = 0.8
+
+# Exponent of the power-law degree sequence of configuration model graphs
+POWERLAW_EXPONENT = 2.5
+
+_DEFAULT_PARAMETERS = {
+    "erdos_renyi": 5,
+    "stochastic_block_model": 10,
+    "configuration_model": 2,
+    "holme_kim": 3,
+    "random_geometric": 8,
+}
+
+
+def _default_parameter(graph_type: str, size: int) -> int:
+    """Default degree parameter of a graph type, see make_csr"""
+    return _DEFAULT_PARAMETERS.get(graph_type) or max(2, size // 50)
+
+
+def _index_dtype(n: int, nnz: int):
+    return np.int32 if max(n, nnz) < 2 ** 31 else np.int64
+
+
+def edges_to_csr(n: int, u: np.ndarray, v: np.ndarray) -> csr_array:
+    """
+    Build the symmetric, unweighted adjacency matrix of an undirected simple graph.
+
+    Args:
+        n: Number of nodes
+        u, v: Endpoints of each edge (every edge once, no self-loops)
+
+    Returns:
+        n x n csr_array with sorted column indices and int8 ones as data
+    """
+    rows = np.concatenate([u, v]).astype(np.int64, copy=False)
+    cols = np.concatenate([v, u]).astype(np.int64, copy=False)
+    order = np.argsort(rows * n + cols, kind="stable")
+    dtype = _index_dtype(n, len(order))
+    indices = cols[order].astype(dtype)
+    indptr = np.zeros(n + 1, dtype=dtype)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return csr_array((np.ones(len(indices), dtype=np.int8), indices, indptr), shape=(n, n))
+
+
+def _complete_edges(n: int) -> tuple[np.ndarray, np.ndarray]:
+    return np.triu_indices(n, k=1)
+
+
+def _skip_sample(pairs: int, p: float, rng: np.random.Generator) -> np.ndarray:
+    """
+    Select each of range(pairs) independently with probability p.
+
+    The gaps between selected positions are geometrically distributed, so only
+    the selected positions are drawn (Batagelj & Brandes).
+
+    Returns:
+        Sorted int64 array of the selected positions
+    """
+    if p <= 0 or pairs <= 0:
+        return np.empty(0, dtype=np.int64)
+    if p >= 1:
+        return np.arange(pairs, dtype=np.int64)
+
+    chunks = []
+    position = -1
+    while True:
+        # Enough gaps to pass the last pair with high probability in one batch
+        expected = (pairs - position) * p
+        batch = int(expected + 5 * np.sqrt(expected) + 64)
+        linear = position + np.cumsum(rng.geometric(p, size=batch))
+        chunks.append(linear[linear < pairs])
+        if linear[-1] >= pairs:
+            break
+        position = int(linear[-1])
+    return np.concatenate(chunks)
+
+
+def _lower_triangle_pair(linear: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Pair k of the lower triangle is (v, w) with k = v(v-1)/2 + w and w < v"""
+    v = ((1 + np.sqrt(1 + 8 * linear.astype(np.float64))) // 2).astype(np.int64)
+    v -= v * (v - 1) // 2 > linear
+    v += (v + 1) * v // 2 <= linear
+    return v, linear - v * (v - 1) // 2
+
+
+def erdos_renyi_csr(n: int, p: float, seed: int = 42) -> csr_array:
+    """
+    G(n, p) random graph by geometric skipping over the n(n-1)/2 node pairs.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if p <= 0 or n < 2:
+        return edges_to_csr(n, np.empty(0, np.int64), np.empty(0, np.int64))
+    if p >= 1:
+        return edges_to_csr(n, *_complete_edges(n))
+
+    rng = np.random.default_rng(seed)
+    v, w = _lower_triangle_pair(_skip_sample(n * (n - 1) // 2, p, rng))
+    return edges_to_csr(n, v, w)
+
+
+def _resolve_copies(target: np.ndarray, link: np.ndarray, pending: np.ndarray) -> None:
+    """
+    Resolve targets that copy the target of an earlier edge by pointer jumping.
+
+    target[t] is known (>= 0) or copies target[link[t]]. Chains are halved on
+    every pass, so this takes O(log chain length) vectorized passes.
+    """
+    while len(pending):
+        source = link[pending]
+        copied = target[source]
+        known = copied >= 0
+        target[pending[known]] = copied[known]
+        pending = pending[~known]
+        link[pending] = link[source[~known]]
+
+
+def _first_distinct(values: np.ndarray, m: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Per row, mark the first m distinct values in column order.
+
+    Returns:
+        (mask of the selected entries, rows with fewer than m distinct values)
+    """
+    order = np.argsort(values, axis=1, kind="stable")
+    ordered = np.take_along_axis(values, order, axis=1)
+    first = np.ones_like(values, dtype=bool)
+    np.put_along_axis(first, order[:, 1:], ordered[:, 1:] != ordered[:, :-1], axis=1)
+    selected = first & (np.cumsum(first, axis=1) <= m)
+    return selected, np.flatnonzero(selected.sum(axis=1) < m)
+
+
+def barabasi_albert_csr(n: int, m: int, seed: int = 42) -> csr_array:
+    """
+    Barabási-Albert preferential attachment graph.
+
+    As in networkx the graph starts as a star on m + 1 nodes and every further
+    node attaches to m distinct nodes chosen with probability proportional to
+    their degree, i.e. to the first m distinct nodes of a stream of uniformly
+    random endpoints of the edges created before it. The first nodes, where
+    most draws hit the same hubs, are attached one by one. For the others all
+    streams are drawn at once: endpoints on the target side of a later edge are
+    first resolved by pointer jumping, then the targets are recomputed from the
+    streams until nothing changes, which gives the node-by-node result.
+    """
+    if m < 1 or m >= n:
+        raise ValueError(f"Barabási-Albert network must have m >= 1 and m < n, m = {m}, n = {n}")
+
+    rng = np.random.default_rng(seed)
+    edges = m + (n - m - 1) * m
+    source = np.empty(edges, dtype=np.int64)
+    target = np.full(edges, -1, dtype=np.int64)
+    source[:m] = 0
+    target[:m] = np.arange(1, m + 1)
+    source[m:] = np.repeat(np.arange(m + 1, n, dtype=np.int64), m)
+
+    def endpoint_values(positions):
+        return np.where(positions % 2 == 0, source[positions // 2], target[positions // 2])
+
+    # Node by node while repeated draws are common
+    sequential_end = min(n, 8 * m + 2)
+    for node in range(m + 1, sequential_end):
+        first_edge = m + (node - m - 1) * m
+        chosen = []
+        while len(chosen) < m:
+            values = endpoint_values(rng.integers(0, 2 * first_edge, size=2 * m))
+            for value in values.tolist():
+                if value not in chosen:
+                    chosen.append(value)
+                    if len(chosen) == m:
+                        break
+        target[first_edge:first_edge + m] = chosen
+
+    rows = n - sequential_end
+    if rows:
+        offset = m + (sequential_end - m - 1) * m
+        candidates = 2 * (offset + np.arange(rows, dtype=np.int64) * m)
+        stream = rng.integers(0, candidates[:, None], size=(rows, m + max(2, m // 2)))
+
+        # Initial guess: the first m draws of every stream, resolved by pointer jumping
+        first = stream[:, :m].ravel()
+        link = np.zeros(edges, dtype=np.int64)
+        link[offset:] = first // 2
+        on_source = first % 2 == 0
+        target[offset:][on_source] = source[link[offset:][on_source]]
+        known = ~on_source & (link[offset:] < offset)
+        target[offset:][known] = target[link[offset:][known]]
+        _resolve_copies(target, link, np.flatnonzero(target < 0))
+
+        # Recompute the rows that draw the target of a changed edge until none changes
+        chosen = target[offset:].reshape(rows, m)
+        active = np.arange(rows)
+        copied = np.where(stream % 2 == 1, stream // 2, edges)
+        while len(active):
+            values = endpoint_values(stream[active])
+            selected, short = _first_distinct(values, m)
+            if len(short):
+                extra = rng.integers(0, candidates[:, None], size=(rows, stream.shape[1]))
+                stream = np.concatenate([stream, extra], axis=1)
+                copied = np.where(stream % 2 == 1, stream // 2, edges)
+                continue
+            update = values[selected].reshape(len(active), m)
+            changed = np.any(update != chosen[active], axis=1)
+            changed_rows = active[changed]
+            chosen[changed_rows] = update[changed]
+            changed_edge = np.zeros(edges + 1, dtype=bool)
+            changed_edge[offset + (changed_rows[:, None] * m + np.arange(m)).ravel()] = True
+            active = np.flatnonzero(changed_edge[copied].any(axis=1)) if len(changed_rows) else changed_rows
+
+    return edges_to_csr(n, source, target)
+
+
+def watts_strogatz_csr(n: int, k: int, p: float, seed: int = 42) -> csr_array:
+    """
+    Watts-Strogatz small-world graph.
+
+    A ring lattice where every node is joined to its k // 2 nearest neighbors on
+    each side; every lattice edge (u, v) is rewired to (u, w) with probability p,
+    w uniform. As in networkx a rewiring never creates a self-loop or a parallel
+    edge and never keeps w = v; conflicting draws are drawn again.
+    """
+    if k > n:
+        raise ValueError("k>n, choose smaller k or larger n")
+    if k == n:
+        return edges_to_csr(n, *_complete_edges(n))
+
+    rng = np.random.default_rng(seed)
+    half = k // 2
+    u = np.tile(np.arange(n, dtype=np.int64), half)
+    v = (u + np.repeat(np.arange(1, half + 1, dtype=np.int64), n)) % n
+    rewired = rng.random(len(u)) < p
+    w = v.copy()
+
+    redraw = np.flatnonzero(rewired)
+    for _attempt in range(_MAX_REWIRE_ATTEMPTS + 1):
+        w[redraw] = rng.integers(0, n, size=len(redraw))
+        keys = np.minimum(u, w) * n + np.maximum(u, w)
+        # Lattice edges that stay have priority over rewired ones
+        order = np.lexsort((rewired, keys))
+        repeated = np.zeros(len(keys), dtype=bool)
+        repeated[order[1:]] = keys[order[1:]] == keys[order[:-1]]
+        conflict = rewired & (repeated | (w == u) | (w == v))
+        redraw = np.flatnonzero(conflict)
+        if not len(redraw):
+            break
+    else:
+        # Nodes without a free partner keep their lattice edge
+        rewired[redraw] = False
+        w[redraw] = v[redraw]
+
+    return edges_to_csr(n, u, w)
+
+
+def stochastic_block_model_csr(block_sizes, p_in: float, p_out: float, seed: int = 42) -> csr_array:
+    """
+    Planted-partition stochastic block model.
+
+    Nodes form consecutive blocks; two nodes of the same block are joined with
+    probability p_in, nodes of different blocks with probability p_out. The
+    pairs inside all blocks are sampled in one pass, the pairs between blocks by
+    sampling all pairs with p_out and dropping those inside a block.
+    """
+    block_sizes = np.asarray(block_sizes, dtype=np.int64)
+    if np.any(block_sizes < 0):
+        raise ValueError("Block sizes must be non-negative")
+    n = int(block_sizes.sum())
+    starts = np.concatenate([[0], np.cumsum(block_sizes)])
+    rng = np.random.default_rng(seed)
+
+    # Internal pairs, block after block in lower-triangle order
+    internal = block_sizes * (block_sizes - 1) // 2
+    internal_starts = np.concatenate([[0], np.cumsum(internal)])
+    linear = _skip_sample(int(internal_starts[-1]), p_in, rng)
+    block = np.searchsorted(internal_starts, linear, side="right") - 1
+    v, w = _lower_triangle_pair(linear - internal_starts[block])
+    inside_u, inside_v = v + starts[block], w + starts[block]
+
+    between_u, between_v = _lower_triangle_pair(_skip_sample(n * (n - 1) // 2, p_out, rng))
+    node_block = np.repeat(np.arange(len(block_sizes)), block_sizes)
+    between = node_block[between_u] != node_block[between_v]
+
+    return edges_to_csr(n, np.concatenate([inside_u, between_u[between]]),
+                       np.concatenate([inside_v, between_v[between]]))
+
+
+def powerlaw_degree_sequence(n: int, exponent: float = POWERLAW_EXPONENT, min_degree: int = 2,
+                             seed: int = 42) -> np.ndarray:
+    """
+    Degree sequence with P(degree >= d) ~ d ** -(exponent - 1), capped at n - 1, with an even sum
+    """
+    if exponent <= 1:
+        raise ValueError("The power-law exponent must be greater than 1")
+    rng = np.random.default_rng(seed)
+    degrees = np.floor(min_degree * (1.0 - rng.random(n)) ** (-1.0 / (exponent - 1.0)))
+    degrees = np.minimum(degrees, max(n - 1, 0)).astype(np.int64)
+    if degrees.sum() % 2:
+        degrees[np.argmin(degrees)] += 1
+    return degrees
+
+
+def configuration_model_csr(degrees, seed: int = 42) -> csr_array:
+    """
+    Erased configuration model of a degree sequence.
+
+    Every node gets one stub per unit of degree and a random permutation of the
+    stubs pairs them up. As with nx.Graph(nx.configuration_model(degrees)),
+    parallel edges are merged and self-loops removed, which lowers the degree of
+    the largest hubs slightly.
+    """
+    degrees = np.asarray(degrees, dtype=np.int64)
+    if np.any(degrees < 0) or degrees.sum() % 2:
+        raise ValueError("Invalid degree sequence: degrees must be non-negative with an even sum")
+    n = len(degrees)
+    rng = np.random.default_rng(seed)
+    stubs = rng.permutation(np.repeat(np.arange(n, dtype=np.int64), degrees)).reshape(-1, 2)
+    u, v = stubs.min(axis=1), stubs.max(axis=1)
+    keys = np.unique((u * n + v)[u != v])
+    return edges_to_csr(n, keys // n, keys % n)
+
+
+def _uniforms(rng: np.random.Generator, batch: int = 1 << 16):
+    """Endless stream of uniform floats drawn in batches"""
+    while True:
+        yield from rng.random(batch).tolist()
+
+
+def holme_kim_csr(n: int, m: int, p: float = HOLME_KIM_TRIAD_PROBABILITY, seed: int = 42) -> csr_array:
+    """
+    Holme-Kim powerlaw-cluster graph (the model of networkx.powerlaw_cluster_graph).
+
+    Every new node makes one preferential attachment to a target and m - 1
+    further links; each of them closes a triangle with a random neighbor of the
+    target with probability p, or else is another preferential attachment, which
+    becomes the target of the following triangles. Whether a triangle can be
+    closed depends on the graph built so far, so the nodes are added one by one,
+    with adjacency lists and random numbers kept out of networkx.
+
+    Attachment is proportional to the degree: a link to a node that is already
+    a neighbor adds no edge and does not count. networkx counts such links too
+    and takes its targets from a set, which favours small (old) node ids, so its
+    hubs grow larger; the clustering and edge counts of the two agree, but they
+    don't produce the same graph for a seed.
+    """
+    if m < 1 or n < m:
+        raise ValueError(f"Holme-Kim graph must have m >= 1 and m <= n, m = {m}, n = {n}")
+    if not 0 <= p <= 1:
+        raise ValueError(f"Holme-Kim triad probability must be in [0, 1], p = {p}")
+
+    uniform = _uniforms(np.random.default_rng(seed))
+    neighbors = [[] for _ in range(n)]
+    # Existing nodes, repeated once per adjacent edge (the m initial nodes once)
+    repeated = list(range(m))
+    sources, targets = [], []
+
+    def link(source, node) -> bool:
+        """Add the edge source-node unless it exists; returns whether it was added"""
+        if node in neighbors[source]:
+            return False
+        neighbors[source].append(node)
+        neighbors[node].append(source)
+        sources.append(source)
+        targets.append(node)
+        repeated.append(node)
+        return True
+
+    for source in range(m, n):
+        candidates = []
+        while len(candidates) < m:
+            node = repeated[int(next(uniform) * len(repeated))]
+            if node not in candidates:
+                candidates.append(node)
+
+        target = candidates.pop()
+        added = link(source, target)
+        linked = neighbors[source]
+        for _ in range(m - 1):
+            if next(uniform) < p:
+                around = neighbors[target]
+                neighbor = around[int(next(uniform) * len(around))]
+                if neighbor == source or neighbor in linked:
+                    open_neighbors = [w for w in around if w != source and w not in linked]
+                    neighbor = open_neighbors[int(next(uniform) * len(open_neighbors))] if open_neighbors else None
+                if neighbor is not None:
+                    added += link(source, neighbor)
+                    continue
+            target = candidates.pop()
+            added += link(source, target)
+        repeated.extend([source] * added)
+
+    return edges_to_csr(n, np.array(sources, dtype=np.int64), np.array(targets, dtype=np.int64))
+
+
+def random_geometric_csr(n: int, radius: float, dim: int = 2, seed: int = 42) -> csr_array:
+    """
+    Random geometric graph: n uniform points in the unit cube, joined when closer than radius
+    """
+    from scipy.spatial import cKDTree
+
+    points = np.random.default_rng(seed).random((n, dim))
+    pairs = cKDTree(points).query_pairs(radius, output_type="ndarray").astype(np.int64)
+    return edges_to_csr(n, pairs[:, 0], pairs[:, 1])
+
+
+def make_csr(graph_type: str, size: int, seed: int = 42, parameter: Optional[int] = None) -> csr_array:
+    """
+    Generate the adjacency matrix of a random graph of the specified type and size.
+
+    Args:
+        graph_type: One of get_available_graph_types()
+        size: Number of nodes in the graph
+        seed: Random seed for reproducibility
+        parameter: Degree parameter of the model:
+            - erdos_renyi: average degree (default 5)
+            - barabasi_albert: edges per new node (default max(2, size // 50))
+            - watts_strogatz: lattice degree (default max(2, size // 50))
+            - stochastic_block_model: average degree (default 10), with
+              SBM_INTERNAL_SHARE of the edges inside about sqrt(size) / 4 blocks
+            - configuration_model: minimum degree of the power-law sequence (default 2)
+            - holme_kim: edges per new node (default 3)
+            - random_geometric: expected average degree (default 8)
+            The size-dependent defaults are far too dense for million-node graphs
+
+    Returns:
+        size x size symmetric csr_array
+    """
+    if graph_type not in GRAPH_TYPE_KEYS:
+        raise ValueError(f"Unsupported graph_type: {graph_type}")
+    if parameter is None:
+        parameter = _default_parameter(graph_type, size)
+
+    if graph_type == "erdos_renyi":
+        return erdos_renyi_csr(size, parameter / size if size else 0.0, seed=seed)
+    if graph_type == "barabasi_albert":
+        return barabasi_albert_csr(size, parameter, seed=seed)
+    if graph_type == "watts_strogatz":
+        return watts_strogatz_csr(size, parameter, 0.3, seed=seed)
+    if graph_type == "stochastic_block_model":
+        blocks = max(2, min(size, round(size ** 0.5 / 4)))
+        block_sizes = np.full(blocks, size // blocks)
+        block_sizes[:size % blocks] += 1
+        block = size / blocks
+        p_in = min(1.0, SBM_INTERNAL_SHARE * parameter / max(block - 1, 1))
+        p_out = min(1.0, (1 - SBM_INTERNAL_SHARE) * parameter / max(size - block, 1))
+        return stochastic_block_model_csr(block_sizes, p_in, p_out, seed=seed)
+    if graph_type == "configuration_model":
+        return configuration_model_csr(powerlaw_degree_sequence(size, min_degree=parameter, seed=seed), seed=seed)
+    if graph_type == "holme_kim":
+        return holme_kim_csr(size, parameter, seed=seed)
+    return random_geometric_csr(size, (parameter / (np.pi * max(size, 1))) ** 0.5, seed=seed)
+
+
+def csr_to_graph(A: csr_array) -> nx.Graph:
+    """
+    Build an interned networkx graph from a symmetric adjacency matrix.
+
+    Returns:
+        Graph with nodes 0..n-1, unweighted edges and the labels in G.graph["node_index"]
+    """
+    n = A.shape[0]
+    rows = np.repeat(np.arange(n), np.diff(A.indptr))
+    upper = A.indices > rows
+    G = nx.Graph()
+    G.add_nodes_from(range(n))
+    G.add_edges_from(zip(rows[upper].tolist(), A.indices[upper].tolist()))
+    G.graph[NODE_INDEX_KEY] = NodeIndex(range(n))
+    return G
+
 
 def make_graph(
     graph_type: str,
     size: int,
     seed: int = 42,
+    parameter: Optional[int] = None,
 ) -> nx.Graph:
     """
     Generate a random graph of the specified type and size.
-    
+
     Args:
-        graph_type: Type of graph to generate ('erdos_renyi', 'barabasi_albert', 'watts_strogatz')
+        graph_type: One of get_available_graph_types()
         size: Number of nodes in the graph
         seed: Random seed for reproducibility
-        
+        parameter: Degree parameter of the model, see make_csr
+
     Returns:
-        NetworkX Graph object
+        NetworkX Graph object with nodes 0..size-1 and their labels in G.graph["node_index"]
     """
-    if graph_type == "erdos_renyi":
-        c = 5
-        p = c / size
-        G = nx.erdos_renyi_graph(size, p, seed=seed, directed=False)
-    
-    elif graph_type == "barabasi_albert":
-        m = max(2, size // 50)
-        G = nx.barabasi_albert_graph(size, m, seed=seed)
-    
-    elif graph_type == "watts_strogatz":
-        k = max(2, size // 50)
-        G = nx.watts_strogatz_graph(size, k, 0.3, seed=seed)
-    else:
-        raise ValueError(f"Unsupported graph_type: {graph_type}")
-
-    return G
+    return csr_to_graph(make_csr(graph_type, size, seed=seed, parameter=parameter))
 
 
 def get_available_graph_types():
     """
     Get list of available random graph types.
-    
+
     Returns:
         List of graph type names
     """
-    return ["erdos_renyi", "barabasi_albert", "watts_strogatz"]
+    return list(GRAPH_TYPE_KEYS)
 
 
 def get_graph_type_display_names():
     """
     Get mapping of graph types to display names.
-    
+
     Returns:
         Dictionary mapping graph types to display names
     """
-    return {
-        "erdos_renyi": "Erdős-Rényi",
-        "barabasi_albert": "Barabási-Albert", 
-        "watts_strogatz": "Watts-Strogatz"
-    }
\ No newline at end of file
+    return dict(GRAPH_TYPE_DISPLAY_NAMES)
@@ -0,0 +1,199 @@
+"""
+Robustness curves: how a graph falls apart as nodes are removed one by one.
+
+Removing nodes and recomputing the components after every removal costs
+O(n * (n + m)). The curve is computed in reverse instead (reverse percolation):
+starting from the graph with all listed nodes removed, the nodes are added back
+in reverse order and their edges merged with a union-find structure, so the
+whole curve takes about O(m log m). Expensive metrics such as the diameter are
+only computed at a few checkpoints.
+"""
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import networkx as nx
+
+from src.models.centrality_service import calculate_diameter, centrality_functions
+from src.models.node_index import node_labels
+
+# Strategy key -> display name
+REMOVAL_STRATEGIES = {
+    "degree": "Highest degree first",
+    "betweenness": "Highest betweenness first",
+    "ranking": "Given ranking",
+}
+
+# Number of points of the curve at which the diameter is sampled when requested
+DEFAULT_DIAMETER_CHECKPOINTS = 10
+
+
+def removal_order(G: nx.Graph, strategy: str, ranking: Optional[list] = None) -> list:
+    """
+    Order in which nodes are removed.
+
+    'degree' and 'betweenness' rank all nodes by their value in the intact graph
+    (highest first, ties broken by node id); they are not recomputed after each
+    removal. 'ranking' removes the given node ids in the given order and never
+    removes the other nodes.
+    """
+    if strategy == "ranking":
+        if not ranking:
+            raise ValueError("The 'ranking' strategy needs a list of nodes")
+        missing = [node for node in ranking if node not in G]
+        if missing:
+            raise ValueError(f"{len(missing)} ranked node(s) are not in the graph")
+        return list(dict.fromkeys(ranking))
+
+    if strategy == "degree":
+        values = dict(G.degree())
+    elif strategy == "betweenness":
+        values = centrality_functions["betweenness"](G)
+    else:
+        raise ValueError(f"Unknown removal strategy: {strategy}. Available: {', '.join(REMOVAL_STRATEGIES)}")
+
+    nodes = np.fromiter(values.keys(), dtype=np.int64, count=len(values))
+    scores = np.fromiter(values.values(), dtype=float, count=len(values))
+    return nodes[np.lexsort((nodes, -scores))].tolist()
+
+
+def robustness_curve(G: nx.Graph, order: list, diameter_checkpoints: int = 0) -> pd.DataFrame:
+    """
+    Component structure of G after removing each prefix of order.
+
+    Components of directed graphs are weakly connected components, as in
+    GraphLoader.process_graph.
+
+    Args:
+        G: Graph with interned integer node ids
+        order: Node ids in removal order (see removal_order)
+        diameter_checkpoints: Number of evenly spaced points at which the diameter
+            of the largest component is computed (0: not computed)
+
+    Returns:
+        One row per number of removed nodes, from 0 to len(order), indexed by the
+        label of the node removed last ('(none)' for the intact graph), with the
+        columns 'Removed', 'Fraction Removed', 'Largest Component',
+        'Largest Component Fraction', 'Components' and, with checkpoints,
+        'Largest Component Diameter' (NaN between checkpoints)
+    """
+    node_count = G.number_of_nodes()
+    count = len(order)
+    largest, components = _reverse_percolation(G, order)
+
+    removed = np.arange(count + 1)
+    curve = pd.DataFrame({
+        "Removed": removed,
+        "Fraction Removed": removed / node_count if node_count else np.zeros(count + 1),
+        # Time t of the reverse process is the graph with count - t nodes removed
+        "Largest Component": largest[::-1],
+        "Largest Component Fraction": largest[::-1] / node_count if node_count else np.zeros(count + 1),
+        "Components": components[::-1],
+    }, index=["(none)"] + node_labels(G, order))
+
+    if diameter_checkpoints > 0:
+        diameters = np.full(count + 1, np.nan)
+        for k in checkpoint_positions(count, diameter_checkpoints):
+            diameters[k] = largest_component_diameter(G, order[:k])
+        curve["Largest Component Diameter"] = diameters
+    return curve
+
+
+def robustness_index(curve: pd.DataFrame) -> float:
+    """
+    Mean size of the largest component, as a fraction of the nodes, over the removals.
+
+    This is the robustness measure R of Schneider et al. (2011) when every node is
+    removed: the area under the curve, between 0 and 0.5.
+    """
+    fractions = curve["Largest Component Fraction"].to_numpy()[1:]
+    return float(fractions.mean()) if len(fractions) else float("nan")
+
+
+def checkpoint_positions(count: int, checkpoints: int) -> list[int]:
+    """Evenly spaced numbers of removed nodes from 0 to count, including both ends"""
+    return np.unique(np.linspace(0, count, min(checkpoints, count + 1)).round().astype(np.int64)).tolist()
+
+
+def largest_component_diameter(G: nx.Graph, removed_nodes) -> float:
+    """Diameter of the largest (weakly) connected component after removing nodes"""
+    temp_graph = G.copy()
+    temp_graph.remove_nodes_from(removed_nodes)
+    if temp_graph.number_of_nodes() == 0:
+        return 0
+    if temp_graph.is_directed():
+        component = max(nx.weakly_connected_components(temp_graph), key=len)
+    else:
+        component = max(nx.connected_components(temp_graph), key=len)
+    return calculate_diameter(temp_graph.subgraph(component))
+
+
+def _reverse_percolation(G: nx.Graph, order: list) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Largest component size and number of components while the nodes of order are added back.
+
+    Returns arrays indexed by the time t = 0..len(order): the graph without any
+    node of order at t = 0, with the last node of order added back at t = 1, and
+    the intact graph at t = len(order).
+    """
+    nodes = np.fromiter(G.nodes(), dtype=np.int64, count=G.number_of_nodes())
+    count = len(order)
+    if len(nodes) == 0:
+        return np.zeros(count + 1, dtype=np.int64), np.zeros(count + 1, dtype=np.int64)
+
+    # Node ids -> positions 0..n-1
+    position = np.full(int(nodes.max()) + 1, -1, dtype=np.int64)
+    position[nodes] = np.arange(len(nodes))
+
+    # Time at which each node is added back (0 for nodes that are never removed)
+    appear = np.zeros(len(nodes), dtype=np.int64)
+    appear[position[np.asarray(order, dtype=np.int64)]] = np.arange(count, 0, -1)
+
+    # Each edge joins the graph once both of its ends are back
+    edges = G.number_of_edges()
+    flat = np.fromiter((node for edge in G.edges() for node in edge), dtype=np.int64, count=2 * edges)
+    source, target = position[flat[0::2]], position[flat[1::2]]
+    edge_time = np.maximum(appear[source], appear[target])
+    by_time = np.argsort(edge_time, kind="stable")
+    source, target = source[by_time].tolist(), target[by_time].tolist()
+    # Edges of time t are source[edge_start[t]:edge_start[t + 1]]
+    edge_start = np.searchsorted(edge_time[by_time], np.arange(count + 2)).tolist()
+    present = np.cumsum(np.bincount(appear, minlength=count + 1))
+
+    parent = list(range(len(nodes)))
+    size = [1] * len(nodes)
+    merges = 0
+    biggest = 0
+    largest = np.zeros(count + 1, dtype=np.int64)
+    components = np.zeros(count + 1, dtype=np.int64)
+    for t in range(count + 1):
+        if present[t]:
+            biggest = max(biggest, 1)
+        for e in range(edge_start[t], edge_start[t + 1]):
+            # Find the roots, halving the paths on the way
+            a = source[e]
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            b = target[e]
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+            if a == b:
+                continue
+            # Union by size
+            if size[a] < size[b]:
+                a, b = b, a
+            parent[b] = a
+            size[a] += size[b]
+            merges += 1
+            if size[a] > biggest:
+                biggest = size[a]
+        largest[t] = biggest
+        components[t] = present[t] - merges
+    return largest, components
+
+
+def robustness_task(G: nx.Graph, strategy: str, ranking: Optional[list], diameter_checkpoints: int) -> pd.DataFrame:
+    """Worker task: robustness_curve of G for a removal strategy"""
+    return robustness_curve(G, removal_order(G, strategy, ranking), diameter_checkpoints)
@@ -0,0 +1,178 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import networkx as nx
+
+from src.models.analysis_pool import AnalysisPool, removal_task
+from src.models.centrality_service import CentralityAnalysisService
+from src.models.graph_fingerprint import graph_cache_key
+from src.models.node_index import get_node_index, node_labels
+
+# Number of most affected nodes listed per scenario in the summary
+DEFAULT_TOP_K = 10
+
+
+class ScenarioRunner:
+    """
+    Evaluates many removal sets (scenarios) against one graph.
+
+    The baseline centralities and diameter are computed once. The post-removal
+    computations are fanned out over a persistent AnalysisPool whose workers keep
+    the graph resident, and each scenario is diffed against the shared baseline.
+
+    Use as a context manager (or call close()) to shut the worker processes down.
+    """
+
+    def __init__(self, G: nx.Graph, selected_centralities, max_workers: Optional[int] = None,
+                 pool: Optional[AnalysisPool] = None):
+        """
+        Args:
+            G: Graph with interned integer node ids
+            selected_centralities: Keys of centrality_functions
+            max_workers: Number of worker processes (default: CPU count)
+            pool: Existing pool to use instead of starting one; it is not shut down by close()
+        """
+        self.graph = G
+        self.centralities = list(selected_centralities)
+        self.analysis = CentralityAnalysisService()
+        self.baseline = self.analysis.compute_baseline(G, self.centralities)
+
+        self._owns_pool = pool is None
+        self.pool = pool if pool is not None else AnalysisPool(max_workers)
+        self._graph_key = ("scenario-graph", graph_cache_key(G))
+        self.pool.register_graph(self._graph_key, G)
+
+    def close(self) -> None:
+        if self._owns_pool:
+            self.pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.close()
+
+    def resolve(self, removal_sets: list[tuple[str, list[str]]]) -> list[tuple[str, list[str], Optional[list[int]], str]]:
+        """
+        Resolve removal sets given as labels to node ids.
+
+        Returns:
+            List of (name, labels, ids or None, error message) tuples; scenarios with
+            unknown labels get ids None and are reported instead of aborting the batch
+        """
+        index = get_node_index(self.graph)
+        resolved = []
+        for name, labels in removal_sets:
+            ids = []
+            missing = []
+            for label in labels:
+                node = index.get_id(label) if index is not None else None
+                if node is None or node not in self.graph:
+                    missing.append(label)
+                else:
+                    ids.append(node)
+            if missing:
+                resolved.append((name, labels, None, f"Node(s) not in the graph: {', '.join(missing)}"))
+            else:
+                resolved.append((name, labels, list(dict.fromkeys(ids)), ""))
+        return resolved
+
+    def run(self, removal_sets: list[tuple[str, list[str]]], top_k: int = DEFAULT_TOP_K,
+            progress=None) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Evaluate every removal set.
+
+        Args:
+            removal_sets: (name, node labels) tuples, e.g. from GraphLoader.load_removal_sets
+            top_k: Number of most affected nodes (by |Δ Combined|) listed per scenario
+            progress: Optional callable(done, total) invoked as scenarios complete
+
+        Returns:
+            (results, summary):
+            - results: long format, one row per scenario, remaining node and centrality
+              (plus a 'combined' centrality) with baseline, new and delta values
+            - summary: one row per scenario with the sum of |Δ| per centrality,
+              the diameter before/after/change and the top-k affected nodes
+        """
+        scenarios = self.resolve(removal_sets)
+        futures = {}
+        for position, (_, _, ids, _) in enumerate(scenarios):
+            if ids is not None:
+                futures[position] = self.pool.submit(removal_task, self._graph_key, ids, self.centralities)
+
+        result_frames = []
+        summary_rows = []
+        for position, (name, labels, ids, error) in enumerate(scenarios):
+            if ids is not None:
+                try:
+                    removal = futures[position].result()
+                except Exception as e:
+                    ids, error = None, str(e)
+
+            if ids is None:
+                summary_rows.append(self._summary_row(name, labels, error=error))
+            else:
+                frame, summary = self._scenario_result(name, labels, ids, removal, top_k)
+                result_frames.append(frame)
+                summary_rows.append(summary)
+
+            if progress is not None:
+                progress(position + 1, len(scenarios))
+
+        columns = ["scenario", "node", "centrality", "baseline", "new", "delta"]
+        results = pd.concat(result_frames, ignore_index=True) if result_frames else pd.DataFrame(columns=columns)
+        return results, pd.DataFrame(summary_rows)
+
+    def _scenario_result(self, name, labels, ids, removal, top_k) -> tuple[pd.DataFrame, dict]:
+        """Diff one removal result against the shared baseline"""
+        df, _, diameter_info = self.analysis.build_table(self.graph, ids, self.centralities, self.baseline, removal)
+        nodes = df.index.to_numpy()
+        node_names = np.asarray(node_labels(self.graph, nodes), dtype=object)
+
+        frames = []
+        sums = {}
+        for centrality in self.centralities + ["combined"]:
+            if centrality == "combined":
+                new = df["Combined"].to_numpy()
+                delta = df["Δ Combined"].to_numpy()
+                baseline = new - delta
+            else:
+                new = df[centrality.title()].to_numpy()
+                delta = df[f"Δ {centrality.title()}"].to_numpy()
+                baseline = self.baseline['centralities'][centrality][nodes]
+            sums[centrality] = float(np.nansum(np.abs(delta)))
+            frames.append(pd.DataFrame({
+                "scenario": name,
+                "node": node_names,
+                "centrality": centrality,
+                "baseline": baseline,
+                "new": new,
+                "delta": delta,
+            }))
+
+        combined_delta = df["Δ Combined"].to_numpy()
+        top = np.argsort(-np.abs(combined_delta), kind="stable")[:top_k]
+        top_nodes = ";".join(f"{node_names[i]}:{combined_delta[i]:.6g}" for i in top)
+
+        summary = self._summary_row(name, labels, sums, diameter_info, top_nodes)
+        return pd.concat(frames, ignore_index=True), summary
+
+    def _summary_row(self, name, labels, sums=None, diameter_info=None, top_nodes="", error="") -> dict:
+        row = {
+            "scenario": name,
+            "removed_nodes": ",".join(labels),
+            "n_removed": len(labels),
+        }
+        for centrality in self.centralities + ["combined"]:
+            row[f"sum_abs_delta_{centrality}"] = (sums or {}).get(centrality, np.nan)
+
+        before = self.baseline['diameter']
+        after = diameter_info['after'] if diameter_info else np.nan
+        row["diameter_before"] = before
+        row["diameter_after"] = after
+        # inf when the removal disconnects the graph, NaN if it already was disconnected
+        row["diameter_change"] = float(after) - float(before)
+        row["top_affected"] = top_nodes
+        row["error"] = error
+        return row
@@ -0,0 +1,97 @@
+import os
+import time
+
+import numpy as np
+import networkx as nx
+import pytest
+
+from src.models.betweenness import (
+    BetweennessCheckpoint, _accumulate_sources, _canonical_adjacency, betweenness_centrality, prune_checkpoints,
+)
+from src.models.graph_fingerprint import graph_fingerprint
+from src.models.node_index import intern_graph
+
+
+def assert_matches_networkx(G, **kwargs):
+    expected = nx.betweenness_centrality(G, normalized=kwargs.get("normalized", True))
+    actual = betweenness_centrality(G, **kwargs)
+    assert actual.keys() == expected.keys()
+    np.testing.assert_allclose([actual[v] for v in G], [expected[v] for v in G], rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("normalized", [True, False])
+def test_matches_networkx_on_random_graphs(seed, normalized):
+    assert_matches_networkx(nx.gnp_random_graph(60, 0.08, seed=seed), normalized=normalized)
+
+
+@pytest.mark.parametrize("normalized", [True, False])
+def test_matches_networkx_on_directed_graphs(normalized):
+    assert_matches_networkx(nx.gnp_random_graph(50, 0.06, seed=7, directed=True), normalized=normalized)
+
+
+def test_matches_networkx_on_disconnected_graph_with_self_loops():
+    G = nx.disjoint_union(nx.path_graph(6), nx.star_graph(5))
+    G.add_edge(3, 3)
+    G.add_node(100)
+    assert_matches_networkx(G)
+
+
+def test_matches_networkx_on_interned_graph():
+    G = intern_graph(nx.relabel_nodes(nx.karate_club_graph(), lambda v: f"n{v}"))
+    assert_matches_networkx(G)
+
+
+def test_resumes_from_checkpoint(tmp_path):
+    G = intern_graph(nx.gnp_random_graph(40, 0.1, seed=3))
+    nodes, adjacency = _canonical_adjacency(G)
+    partial = np.zeros(len(nodes))
+    completed = _accumulate_sources(adjacency, range(0, 15), partial, float("inf"))
+    checkpoint = BetweennessCheckpoint(str(tmp_path), graph_fingerprint(G))
+    checkpoint.save(completed, partial)
+
+    resumed = betweenness_centrality(G, checkpoint_dir=str(tmp_path), checkpoint_min_nodes=0)
+    assert resumed == betweenness_centrality(G)
+    assert not os.path.exists(checkpoint.path)
+
+
+def test_ignores_checkpoint_of_other_graph(tmp_path):
+    G = intern_graph(nx.gnp_random_graph(30, 0.15, seed=4))
+    BetweennessCheckpoint(str(tmp_path), graph_fingerprint(G)).save(10, np.full(G.number_of_nodes() + 1, 5.0))
+    assert_matches_networkx(G, checkpoint_dir=str(tmp_path), checkpoint_min_nodes=0)
+
+
+def _write(path, size, age):
+    with open(path, "wb") as f:
+        f.write(b"\0" * size)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+
+
+def test_prune_deletes_old_checkpoints(tmp_path):
+    old = tmp_path / "betweenness-old.npz"
+    recent = tmp_path / "betweenness-recent.npz"
+    leftover = tmp_path / "abc.tmp"
+    other = tmp_path / "notes.txt"
+    _write(old, 10, age=100)
+    _write(recent, 10, age=1)
+    _write(leftover, 10, age=100)
+    _write(other, 10, age=100)
+
+    assert prune_checkpoints(str(tmp_path), max_age=50) == 2
+    assert sorted(os.listdir(tmp_path)) == ["betweenness-recent.npz", "notes.txt"]
+
+
+def test_prune_keeps_total_size_below_limit(tmp_path):
+    for i in range(5):
+        _write(tmp_path / f"betweenness-{i}.npz", 100, age=10 - i)
+    keep = str(tmp_path / "betweenness-0.npz")
+
+    assert prune_checkpoints(str(tmp_path), max_bytes=250, keep=keep) == 3
+    assert sorted(os.listdir(tmp_path)) == ["betweenness-0.npz", "betweenness-4.npz"]
+
+
+def test_opening_a_checkpoint_prunes_the_directory(tmp_path):
+    _write(tmp_path / "betweenness-stale.npz", 10, age=400 * 24 * 3600)
+    BetweennessCheckpoint(str(tmp_path), "abc")
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,73 @@
+import math
+
+import networkx as nx
+import pytest
+
+from src.models.analysis_pool import AnalysisPool
+from src.models.critical_nodes import CriticalNodeSearch, combined_task, objective_task, top_degree_candidates
+from src.models.node_index import intern_graph
+
+CENTRALITIES = ["degree", "closeness"]
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with AnalysisPool(2) as pool:
+        yield pool
+
+
+def exhaustive_best(G, candidates, objective):
+    """Best single removal by evaluating every candidate"""
+    combined_baseline = combined_task(G, [], CENTRALITIES) if objective == "delta" else None
+    values = {node: objective_task(G, [node], CENTRALITIES, objective, combined_baseline) for node in candidates}
+    best = max(values.values())
+    return best, {node for node, value in values.items() if value == best}
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("objective", ["delta", "diameter"])
+def test_first_step_is_exhaustive_best(pool, seed, objective):
+    G = intern_graph(nx.connected_watts_strogatz_graph(40, 4, 0.2, seed=seed))
+    candidates = top_degree_candidates(G, 12)
+    best, best_nodes = exhaustive_best(G, candidates, objective)
+
+    with CriticalNodeSearch(G, CENTRALITIES, objective, pool=pool) as search:
+        result = search.run(1, candidates)
+
+    assert result["nodes"][0] in best_nodes
+    step = result["steps"][0]
+    baseline = 0.0 if objective == "delta" else result["baseline"]
+    if math.isinf(best):
+        assert math.isinf(step["value"])
+    else:
+        assert step["value"] == pytest.approx(best)
+        assert step["gain"] == pytest.approx(best - baseline)
+    assert result["evaluations"] == len(candidates)
+
+
+def test_greedy_steps_are_consistent(pool):
+    G = intern_graph(nx.barabasi_albert_graph(60, 2, seed=1))
+    candidates = top_degree_candidates(G, 15)
+    with CriticalNodeSearch(G, CENTRALITIES, "delta", pool=pool) as search:
+        result = search.run(3, candidates)
+
+    assert len(result["nodes"]) == len(set(result["nodes"])) == 3
+    combined_baseline = combined_task(G, [], CENTRALITIES)
+    # The value after each step is the objective of the selected prefix
+    for i, step in enumerate(result["steps"]):
+        expected = objective_task(G, result["nodes"][:i + 1], CENTRALITIES, "delta", combined_baseline)
+        assert step["value"] == pytest.approx(expected)
+    assert result["evaluations"] <= result["greedy_evaluations"]
+
+
+def test_top_degree_candidates_breaks_ties_by_id():
+    G = nx.star_graph(4)
+    G.add_edge(5, 6)
+    assert top_degree_candidates(G, 3) == [0, 1, 2]
+
+
+def test_rejects_unknown_candidates(pool):
+    G = intern_graph(nx.path_graph(5))
+    with CriticalNodeSearch(G, CENTRALITIES, "delta", pool=pool) as search:
+        with pytest.raises(ValueError):
+            search.run(1, [99])
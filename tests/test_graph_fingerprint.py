@@ -0,0 +1,92 @@
+import pickle
+import random
+
+import networkx as nx
+
+from src.models.graph_fingerprint import copy_fingerprint, graph_cache_key, graph_fingerprint, invalidate_fingerprint
+from src.models.node_index import FINGERPRINT_KEY, intern_graph
+
+
+def labelled_graph(edges, directed=False):
+    G = nx.DiGraph() if directed else nx.Graph()
+    G.add_weighted_edges_from(edges)
+    return intern_graph(G)
+
+
+EDGES = [("a", "b", 1.0), ("b", "c", 2.0), ("c", "d", 1.5), ("d", "a", 1.0), ("a", "c", 0.5)]
+
+
+def test_independent_of_edge_order_and_ids():
+    shuffled = EDGES[:]
+    random.Random(1).shuffle(shuffled)
+    # Reversed endpoints as well: the graph is undirected
+    reversed_edges = [(v, u, w) for u, v, w in shuffled]
+    G, H = labelled_graph(EDGES), labelled_graph(reversed_edges)
+
+    assert graph_fingerprint(G) == graph_fingerprint(H)
+    # The labels were interned to different ids
+    assert graph_cache_key(G) != graph_cache_key(H)
+
+
+def test_sensitive_to_content():
+    base = graph_fingerprint(labelled_graph(EDGES))
+    assert graph_fingerprint(labelled_graph(EDGES[:-1])) != base
+    assert graph_fingerprint(labelled_graph(EDGES[:-1] + [("a", "c", 0.6)])) != base
+    assert graph_fingerprint(labelled_graph(EDGES[:-1] + [("b", "d", 0.5)])) != base
+    assert graph_fingerprint(labelled_graph(EDGES, directed=True)) != base
+
+
+def test_copy_does_not_reuse_stale_cache():
+    G = labelled_graph(EDGES)
+    base = graph_fingerprint(G)
+    H = G.copy()
+    assert FINGERPRINT_KEY in H.graph  # G.copy() copies G.graph
+    assert graph_fingerprint(H) == base
+
+    # Same node and edge count, different edges
+    H.remove_edge(0, 2)
+    H.add_edge(1, 3, weight=0.5)
+    assert graph_fingerprint(H) == graph_fingerprint(labelled_graph(EDGES[:-1] + [("b", "d", 0.5)]))
+    assert graph_fingerprint(G) == base
+
+
+def test_rewire_in_place_is_detected():
+    G = labelled_graph(EDGES)
+    base = graph_fingerprint(G)
+    G.remove_edge(0, 2)
+    G.add_edge(1, 3, weight=0.5)
+    assert graph_fingerprint(G) != base
+
+
+def test_weight_edit_after_invalidate():
+    G = labelled_graph(EDGES)
+    base = graph_fingerprint(G)
+    G[0][1]["weight"] = 3.0
+    invalidate_fingerprint(G)
+    assert graph_fingerprint(G) != base
+    assert graph_fingerprint(G) == graph_fingerprint(labelled_graph([("a", "b", 3.0)] + EDGES[1:]))
+
+
+def test_copy_fingerprint_and_pickle():
+    G = labelled_graph(EDGES)
+    H = G.copy()
+    copy_fingerprint(G, H)
+    assert H.graph[FINGERPRINT_KEY][1:] == (graph_fingerprint(G), graph_cache_key(G))
+
+    P = pickle.loads(pickle.dumps(G))
+    assert (graph_fingerprint(P), graph_cache_key(P)) == (graph_fingerprint(G), graph_cache_key(G))
+
+
+def test_subgraph_view_does_not_overwrite_parent_cache():
+    G = labelled_graph(EDGES)
+    base = graph_fingerprint(G)
+    cached = G.graph[FINGERPRINT_KEY]
+    view = G.subgraph([0, 1, 2])
+    assert graph_fingerprint(view) != base
+    assert G.graph[FINGERPRINT_KEY] is cached
+
+
+def test_uninterned_graph_key_equals_fingerprint():
+    G = nx.Graph()
+    G.add_weighted_edges_from(EDGES)
+    assert graph_cache_key(G) == graph_fingerprint(G) == graph_fingerprint(labelled_graph(EDGES))
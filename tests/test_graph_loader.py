@@ -0,0 +1,35 @@
+import pytest
+
+from src.models.graph_loader import GraphLoader
+
+
+@pytest.fixture
+def write(tmp_path):
+    def write(text, name="nodes.txt"):
+        path = tmp_path / name
+        path.write_text(text, encoding="utf-8")
+        return str(path)
+    return write
+
+
+def test_removal_sets(write):
+    path = write("# comment\nA\tB\tC\n\nko1: X, Y\nGO:0001,GO:0002\n")
+    assert GraphLoader().load_removal_sets(path) == [
+        ("set0", ["A", "B", "C"]),
+        ("ko1", ["X", "Y"]),
+        ("set2", ["GO:0001", "GO:0002"]),
+    ]
+
+
+def test_labels_keep_file_order(write):
+    path = write("C\tA\nB, D\n# E\nGO:1\n")
+    assert GraphLoader().load_labels(path) == ["C", "A", "B", "D", "GO:1"]
+
+
+@pytest.mark.parametrize("text, message", [
+    ("A\nranking: B,C\n", "line 2"),
+    ("A,B\nC\tA\n", "already listed on line 1"),
+])
+def test_labels_reject_ambiguous_files(write, text, message):
+    with pytest.raises(ValueError, match=message):
+        GraphLoader().load_labels(write(text))
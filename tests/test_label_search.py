@@ -0,0 +1,51 @@
+import random
+import string
+
+import pytest
+
+from src.models.label_search import LabelSearchIndex
+
+
+def brute_force(labels, term):
+    term = term.lower()
+    lower = [label.lower() for label in labels]
+    prefix = [i for i, label in enumerate(lower) if label.startswith(term)]
+    contains = [i for i, label in enumerate(lower) if term in label and not label.startswith(term)]
+    return prefix + contains
+
+
+def random_labels(rng, count):
+    alphabet = "abcAB12_-é"
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8))) for _ in range(count)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_brute_force(seed):
+    rng = random.Random(seed)
+    labels = random_labels(rng, 500)
+    index = LabelSearchIndex(labels)
+    terms = ["", "a", "AB", "é", "zz"] + [label[i:i + rng.randint(1, 5)]
+                                          for label in rng.sample(labels, 60) for i in range(min(len(label), 2))]
+    for term in terms:
+        assert index.search(term).tolist() == brute_force(labels, term), term
+
+
+def test_gene_like_labels():
+    labels = ["TP53", "TP53BP1", "ATP5A1", "tp63", "BRCA1", "BRCA2", "MTP53X", "P53"]
+    index = LabelSearchIndex(labels)
+    assert [labels[i] for i in index.search("tp5")] == ["TP53", "TP53BP1", "ATP5A1", "MTP53X"]
+    assert [labels[i] for i in index.search("P53")] == ["P53", "TP53", "TP53BP1", "MTP53X"]
+    assert index.search("brca3").tolist() == []
+
+
+def test_non_bmp_and_long_terms():
+    labels = ["node\U0001F600x", "plain", "\U0001F600start", string.ascii_lowercase]
+    index = LabelSearchIndex(labels)
+    for term in ["\U0001F600", "e\U0001F600x", "defghij", "plain", "xyz!"]:
+        assert index.search(term).tolist() == brute_force(labels, term)
+
+
+def test_positions():
+    index = LabelSearchIndex(["a", "b", "c"])
+    assert index.positions(["c", "missing", "a"]) == [2, 0]
+    assert len(index) == 3
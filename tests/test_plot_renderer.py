@@ -0,0 +1,41 @@
+import matplotlib
+matplotlib.use("Agg")
+
+import networkx as nx
+from matplotlib.figure import Figure
+
+from src.gui.plot_renderer import LOD_NODE_THRESHOLD, PlotRenderer
+from src.models.node_index import intern_graph
+
+
+class DictLayoutCache:
+    def __init__(self):
+        self.layouts = {}
+
+    def get(self, key):
+        return self.layouts.get(key)
+
+    def set(self, key, pos):
+        self.layouts[key] = pos
+
+
+def test_removed_edges_are_drawn_above_density():
+    G = intern_graph(nx.cycle_graph(LOD_NODE_THRESHOLD + 100))
+    removed = [0, 5000]
+    result = {
+        "graph": G,
+        "impact": {node: 0.1 for node in G if node not in removed},
+        "removed_nodes": removed,
+        "label": "Reduced detail",
+    }
+    figure = Figure(figsize=(2, 2), dpi=50)
+    renderer = PlotRenderer(DictLayoutCache())
+    renderer.render(figure, result, {"show_node_names": False, "edge_thickness_by_weight": True,
+                                     "mark_removed_edges": True, "layout_type": "Circular"})
+
+    scene = renderer._scene
+    assert scene.detail is not None and scene.density is not None
+    assert scene.highlight_collection.get_visible()
+    assert len(scene.highlight_collection.get_segments()) == 4
+    assert (scene.edge_collection.get_zorder() < scene.density.get_zorder()
+            < scene.highlight_collection.get_zorder() < scene.node_collection.get_zorder())
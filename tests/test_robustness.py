@@ -0,0 +1,89 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from src.models.node_index import intern_graph, node_labels
+from src.models.robustness import (
+    checkpoint_positions, largest_component_diameter, removal_order, robustness_curve, robustness_index,
+)
+
+
+def brute_force_curve(G, order):
+    """Largest component size and component count after removing each prefix of order"""
+    components = nx.weakly_connected_components if G.is_directed() else nx.connected_components
+    largest, counts = [], []
+    H = G.copy()
+    for k in range(len(order) + 1):
+        if k:
+            H.remove_node(order[k - 1])
+        sizes = [len(c) for c in components(H)]
+        largest.append(max(sizes, default=0))
+        counts.append(len(sizes))
+    return largest, counts
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("strategy", ["degree", "betweenness"])
+def test_matches_connected_components(seed, strategy):
+    G = intern_graph(nx.gnp_random_graph(80, 0.04, seed=seed))
+    order = removal_order(G, strategy)
+    curve = robustness_curve(G, order)
+    largest, counts = brute_force_curve(G, order)
+
+    assert curve["Largest Component"].tolist() == largest
+    assert curve["Components"].tolist() == counts
+    assert curve["Removed"].tolist() == list(range(len(order) + 1))
+    np.testing.assert_allclose(curve["Largest Component Fraction"], np.array(largest) / 80)
+    assert curve.index.tolist() == ["(none)"] + node_labels(G, order)
+
+
+def test_partial_ranking_on_directed_graph():
+    G = intern_graph(nx.gnp_random_graph(60, 0.05, seed=5, directed=True))
+    ranking = [7, 3, 3, 20, 41]
+    order = removal_order(G, "ranking", ranking)
+    assert order == [7, 3, 20, 41]
+
+    curve = robustness_curve(G, order)
+    largest, counts = brute_force_curve(G, order)
+    assert curve["Largest Component"].tolist() == largest
+    assert curve["Components"].tolist() == counts
+
+
+def test_isolated_nodes_and_empty_graph():
+    G = nx.Graph()
+    G.add_nodes_from(range(4))
+    G.add_edge(0, 1)
+    curve = robustness_curve(G, [0, 1, 2, 3])
+    assert curve["Largest Component"].tolist() == [2, 1, 1, 1, 0]
+    assert curve["Components"].tolist() == [3, 3, 2, 1, 0]
+
+    assert robustness_curve(nx.Graph(), [])["Largest Component"].tolist() == [0]
+
+
+def test_diameter_checkpoints():
+    G = intern_graph(nx.path_graph(10))
+    order = list(range(10))
+    curve = robustness_curve(G, order, diameter_checkpoints=3)
+    diameters = curve["Largest Component Diameter"]
+
+    assert checkpoint_positions(10, 3) == [0, 5, 10]
+    assert diameters.iloc[0] == 9 and diameters.iloc[5] == 4 and diameters.iloc[10] == 0
+    assert diameters.isna().sum() == 8
+    assert largest_component_diameter(G, [4]) == 4
+
+
+def test_robustness_index_of_star():
+    # Removing the hub first leaves isolated nodes: R = (1 + 1 + 1 + 1 + 0) / 5 / 5
+    G = intern_graph(nx.star_graph(4))
+    curve = robustness_curve(G, removal_order(G, "degree"))
+    assert robustness_index(curve) == pytest.approx(4 / 25)
+
+
+def test_ranking_errors():
+    G = intern_graph(nx.path_graph(3))
+    with pytest.raises(ValueError):
+        removal_order(G, "ranking", [])
+    with pytest.raises(ValueError):
+        removal_order(G, "ranking", [5])
+    with pytest.raises(ValueError):
+        removal_order(G, "closeness")